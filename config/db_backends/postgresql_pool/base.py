@@ -0,0 +1,150 @@
+"""
+PostgreSQL backend that checks connections out of a psycopg_pool.ConnectionPool.
+
+Django 4.2 keeps at most one connection per thread (CONN_MAX_AGE) and has no pool. Here each
+process owns one pool per database alias. Opening a Django connection takes one from the
+pool, and closing it (end of request, CONN_MAX_AGE=0) gives it back, so the number of server
+connections is bounded by the pool size rather than by the number of worker threads.
+
+Configured through the POOL key of the database settings, passed to ConnectionPool:
+
+    DATABASES["default"] = {
+        "ENGINE": "config.db_backends.postgresql_pool",
+        "CONN_MAX_AGE": 0,
+        "POOL": {"min_size": 2, "max_size": 10, "timeout": 10, "check": True},
+        ...
+    }
+
+"check": True validates each connection with a round trip before handing it out. The wait
+for a pooled connection is recorded in wordrush_db_pool_wait_seconds and pool stats are
+exported as gauges on /api/metrics/.
+"""
+
+import os
+import threading
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import IsolationLevel, is_psycopg3
+from django.db.utils import NO_DB_ALIAS
+
+from game.services.metrics import DB_POOL_WAIT_SECONDS, CallbackGauge
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:  # optional: pip install ".[pool]"
+    ConnectionPool = None
+
+# (alias, database name) -> (pid, pool); the pid check gives forked workers their own pool
+_pools: dict[tuple[str, str], tuple[int, "ConnectionPool"]] = {}
+_pools_lock = threading.Lock()
+
+POOL_STATS = ("pool_size", "pool_available", "requests_waiting")
+
+
+def pool_stats() -> dict[tuple[str, str], float]:
+    """Current gauges of every pool opened by this process, keyed by (alias, stat)."""
+    values = {}
+    pid = os.getpid()
+    for (alias, _), (owner, pool) in list(_pools.items()):
+        if owner != pid:
+            continue
+        stats = pool.get_stats()
+        for stat in POOL_STATS:
+            values[(alias, stat)] = stats.get(stat, 0)
+    return values
+
+
+CallbackGauge(
+    "wordrush_db_pool_connections",
+    "Connection pool state per database alias: pool_size, pool_available, requests_waiting.",
+    ("alias", "stat"),
+    pool_stats,
+)
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if ConnectionPool is None:
+            raise ImproperlyConfigured(
+                "config.db_backends.postgresql_pool requires psycopg_pool "
+                '(pip install ".[pool]")'
+            )
+        if not is_psycopg3:
+            raise ImproperlyConfigured("config.db_backends.postgresql_pool requires psycopg 3")
+
+    @property
+    def pool(self):
+        if self.alias == NO_DB_ALIAS:
+            return None
+        key = (self.alias, self.settings_dict["NAME"])
+        pid = os.getpid()
+        entry = _pools.get(key)
+        if entry is not None and entry[0] == pid:
+            return entry[1]
+
+        with _pools_lock:
+            entry = _pools.get(key)
+            if entry is None or entry[0] != pid:
+                options = dict(self.settings_dict.get("POOL") or {})
+                check = options.pop("check", True)
+                kwargs = self.get_connection_params()
+                # Django switches autocommit per checkout; connections rest in the pool idle
+                kwargs["autocommit"] = True
+                pool = ConnectionPool(
+                    kwargs=kwargs,
+                    open=False,
+                    configure=self._configure_pooled_connection,
+                    check=ConnectionPool.check_connection if check else None,
+                    name=self.alias,
+                    **options,
+                )
+                entry = _pools[key] = (pid, pool)
+        return entry[1]
+
+    def _configure_pooled_connection(self, connection):
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        if isolation_level is not None:
+            connection.isolation_level = IsolationLevel(isolation_level)
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(
+                IsolationLevel.READ_COMMITTED if isolation_level is None else isolation_level
+            )
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {isolation_level} "
+                f"specified. Use one of the psycopg.IsolationLevel values."
+            )
+
+        # no-op once open; opening lazily keeps pool threads out of pre-fork parents
+        pool.open()
+        start = time.perf_counter()
+        connection = pool.getconn()
+        DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - start, alias=self.alias)
+        return connection
+
+    def _close(self):
+        if self.connection is None or self.pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            # rolls back anything left open and discards broken connections
+            self.pool.putconn(self.connection)
+
+
+def close_pools() -> None:
+    """Close every pool opened by this process (worker shutdown, tests)."""
+    pid = os.getpid()
+    with _pools_lock:
+        for key, (owner, pool) in list(_pools.items()):
+            if owner == pid:
+                pool.close()
+            del _pools[key]
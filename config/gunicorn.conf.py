@@ -0,0 +1,56 @@
+"""
+Gunicorn settings (gunicorn -c config/gunicorn.conf.py config.wsgi:application).
+
+The app is preloaded: the master imports config.wsgi, which runs game.warmup, and workers
+are forked from it already warm. Workers are threaded (gthread). Environment overrides:
+GUNICORN_BIND, WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_TIMEOUT.
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count() * 2 + 1)))
+# threaded workers: an open /api/v1/leaderboard/stream/ holds a thread for up to
+# LEADERBOARD_STREAM_MAX_SECONDS, and the view takes at most LEADERBOARD_STREAM_MAX_PER_PROCESS
+# (2) of them, leaving the rest for API requests. gthread workers heartbeat from their main
+# thread, so `timeout` bounds a hung worker, not a request, and long streams are not killed.
+# Every thread that serves API requests keeps its own database connection unless
+# DJANGO_DB_POOL=1, so workers x threads is the connection count per database.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+preload_app = True
+accesslog = "-"
+
+
+# Postgres' default max_connections, less a few for maintenance and migrations
+_CONNECTION_BUDGET = 90
+
+
+def on_starting(server):
+    pooled = os.getenv("DJANGO_DB_POOL", "0") in ("1", "True", "true")
+    connections = workers * threads
+    if not pooled and connections > _CONNECTION_BUDGET:
+        server.log.warning(
+            "%d workers x %d threads may hold %d connections per database, over %d; "
+            "lower WEB_CONCURRENCY or GUNICORN_THREADS, or set DJANGO_DB_POOL=1",
+            workers,
+            threads,
+            connections,
+            _CONNECTION_BUDGET,
+        )
+
+
+def pre_fork(server, worker):
+    # keep preloaded objects out of the collector's generations, so the first collection in a
+    # worker does not touch (and un-share) every page inherited from the master
+    gc.freeze()
+
+
+def worker_exit(server, worker):
+    # write this worker's buffered prompt analytics before it goes away
+    from game.services.prompt_stats import flush_prompt_stats
+
+    flush_prompt_stats()
@@ -30,29 +30,58 @@ if not CORS_ALLOWED_ORIGINS:
 
 
 # Application definition
+# admin (with messages) and the API docs are operator tools the game API never uses; they
+# default to on only with DEBUG so production workers do not import them
+_DEBUG_DEFAULT = "1" if DEBUG else "0"
+ENABLE_ADMIN = os.getenv("DJANGO_ENABLE_ADMIN", _DEBUG_DEFAULT) in ("1", "True", "true")
+# Swagger UI and live schema generation (drf_spectacular); /api/schema/ serves the
+# precomputed OPENAPI_SCHEMA_PATH either way
+ENABLE_API_DOCS = os.getenv("DJANGO_ENABLE_API_DOCS", _DEBUG_DEFAULT) in ("1", "True", "true")
+OPENAPI_SCHEMA_PATH = Path(os.getenv("DJANGO_OPENAPI_SCHEMA", BASE_DIR / "openapi" / "schema.json"))
+
 INSTALLED_APPS = [
-    "django.contrib.admin",
     "django.contrib.sessions",
     "django.contrib.contenttypes",
     "django.contrib.auth",
-    "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
-    "drf_spectacular",
     "corsheaders",
     "game",
 ]
+if ENABLE_ADMIN:
+    INSTALLED_APPS[:0] = ["django.contrib.admin", "django.contrib.messages"]
+if ENABLE_API_DOCS:
+    INSTALLED_APPS.append("drf_spectacular")
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "game.query_budget.QueryBudgetMiddleware",
+    "game.db_router.ReplicaPinningMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "game.profiling.ProfilingMiddleware",
 ]
+if ENABLE_ADMIN:
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("django.contrib.auth.middleware.AuthenticationMiddleware") + 1,
+        "django.contrib.messages.middleware.MessageMiddleware",
+    )
+
+# stateless JSON endpoints under these prefixes skip middleware they never use
+# (see game/fast_lane.py); everything else, /admin/ included, runs the full MIDDLEWARE
+FAST_LANE_PREFIXES = ("/api/v1/",)
+_FULL_STACK_ONLY = {
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+}
+FAST_LANE_MIDDLEWARE = [m for m in MIDDLEWARE if m not in _FULL_STACK_ONLY]
 
 ROOT_URLCONF = "config.urls"
 
@@ -66,18 +95,78 @@ TEMPLATES = [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
             ],
         },
     },
 ]
+if ENABLE_ADMIN:
+    TEMPLATES[0]["OPTIONS"]["context_processors"].append(
+        "django.contrib.messages.context_processors.messages"
+    )
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# log requests that run more SQL queries than their view's declared budget (dev/staging)
+QUERY_BUDGETS_ENABLED = os.getenv("DJANGO_QUERY_BUDGETS", "0") in ("1", "True", "true")
+
+# on-demand profiling of opted-in views (see game/profiling.py): requests with an X-Profile
+# header from staff users or carrying this token, plus a random sample of all requests
+PROFILING_TOKEN = os.getenv("DJANGO_PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE = float(os.getenv("DJANGO_PROFILING_SAMPLE_RATE", "0"))
+PROFILING_TOP_N = int(os.getenv("DJANGO_PROFILING_TOP_N", "30"))
+
+# seconds a process keeps its in-memory prompt catalog before reloading it
+PROMPT_CATALOG_TTL = int(os.getenv("DJANGO_PROMPT_CATALOG_TTL", "300"))
+
+# per-prompt analytics are buffered per process and written after a request once this many
+# events are pending or this many seconds have passed (see game/services/prompt_stats.py)
+PROMPT_STATS_FLUSH_EVENTS = int(os.getenv("DJANGO_PROMPT_STATS_FLUSH_EVENTS", "500"))
+PROMPT_STATS_FLUSH_INTERVAL = float(os.getenv("DJANGO_PROMPT_STATS_FLUSH_INTERVAL", "10"))
+
+# live leaderboard streams (see game/services/leaderboard_stream.py): the dotted path of the
+# backend carrying publishes to every process (empty: NOTIFY on PostgreSQL, else in-process
+# only), events a slow client may have queued before its stream is closed, seconds between
+# keepalive comments, seconds before a stream ends and the client reconnects, and streams
+# one process serves at once (each holds a server thread; see config/gunicorn.conf.py)
+LEADERBOARD_BROADCAST_BACKEND = os.getenv("DJANGO_LEADERBOARD_BROADCAST_BACKEND", "")
+LEADERBOARD_STREAM_QUEUE = int(os.getenv("DJANGO_LEADERBOARD_STREAM_QUEUE", "100"))
+LEADERBOARD_STREAM_HEARTBEAT = float(os.getenv("DJANGO_LEADERBOARD_STREAM_HEARTBEAT", "15"))
+LEADERBOARD_STREAM_MAX_SECONDS = float(os.getenv("DJANGO_LEADERBOARD_STREAM_MAX_SECONDS", "300"))
+LEADERBOARD_STREAM_MAX_PER_PROCESS = int(
+    os.getenv("DJANGO_LEADERBOARD_STREAM_MAX_PER_PROCESS", "2")
+)
+
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL")
+# DJANGO_DB_POOL=1 checks Postgres connections out of a per-process psycopg pool
+# (config/db_backends/postgresql_pool) instead of keeping one per worker thread
+DATABASE_POOL_ENABLED = os.getenv("DJANGO_DB_POOL", "0") in ("1", "True", "true")
+
+
+def _database_from_url(url: str) -> dict:
+    database = dj_database_url.parse(url, conn_max_age=600)
+    if DATABASE_POOL_ENABLED and database["ENGINE"].endswith("postgresql"):
+        database.update(
+            {
+                "ENGINE": "config.db_backends.postgresql_pool",
+                # connections go back to the pool at the end of each request
+                "CONN_MAX_AGE": 0,
+                "POOL": {
+                    "min_size": int(os.getenv("DJANGO_DB_POOL_MIN_SIZE", "2")),
+                    "max_size": int(os.getenv("DJANGO_DB_POOL_MAX_SIZE", "10")),
+                    # seconds a request waits for a free connection before failing
+                    "timeout": float(os.getenv("DJANGO_DB_POOL_TIMEOUT", "10")),
+                    # seconds before an idle connection above min_size is closed
+                    "max_idle": float(os.getenv("DJANGO_DB_POOL_MAX_IDLE", "600")),
+                    "check": os.getenv("DJANGO_DB_POOL_CHECK", "1") in ("1", "True", "true"),
+                },
+            }
+        )
+    return database
+
+
 if DATABASE_URL:
-    DATABASES = {"default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)}
+    DATABASES = {"default": _database_from_url(DATABASE_URL)}
 else:
     DATABASES = {
         "default": {
@@ -86,6 +175,19 @@ else:
         }
     }
 
+# optional read replica for stale-tolerant reads (see game/db_router.py)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+DATABASE_REPLICA_ALIAS = "replica" if DATABASE_REPLICA_URL else None
+if DATABASE_REPLICA_URL:
+    DATABASES["replica"] = {
+        **_database_from_url(DATABASE_REPLICA_URL),
+        # tests use the primary's test database instead of creating one for the replica
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["game.db_router.ReplicaRouter"]
+# seconds a client's reads stay on the primary after it wrote something
+REPLICA_PIN_SECONDS = int(os.getenv("DJANGO_REPLICA_PIN_SECONDS", "10"))
+
 # log DB configuration
 logging.getLogger(__name__).info("Database configured: %s", DATABASES["default"].get("ENGINE"))
 
@@ -102,8 +204,12 @@ STATIC_URL = "/static/"
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # the game API is anonymous: no per-request authenticators or permission checks
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": [],
 }
+if ENABLE_API_DOCS:
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "21 Words API",
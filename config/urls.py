@@ -2,10 +2,11 @@
 URL Configuration for config project.
 """
 
-from django.contrib import admin
+from django.conf import settings
 from django.http import JsonResponse
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+
+from game.api.schema import openapi_schema
 
 # simple root view that mirrors the health endpoint
 # this avoids 404 warnings when hitting '/'
@@ -17,8 +18,18 @@ def root_view(request):
 
 urlpatterns = [
     path("", root_view, name="root"),
-    path("admin/", admin.site.urls),
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="api-schema"), name="api-docs"),
+    path("api/schema/", openapi_schema, name="api-schema"),
     path("api/", include("game.api.urls")),
 ]
+
+# operator tools, imported only when enabled (see ENABLE_ADMIN / ENABLE_API_DOCS)
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.append(path("admin/", admin.site.urls))
+if settings.ENABLE_API_DOCS:
+    from drf_spectacular.views import SpectacularSwaggerView
+
+    urlpatterns.append(
+        path("api/docs/", SpectacularSwaggerView.as_view(url_name="api-schema"), name="api-docs")
+    )
@@ -8,4 +8,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_wsgi_application()
+# /api/v1/ requests take the reduced middleware chain (game/fast_lane.py)
+from game.fast_lane import FastLaneDispatcher  # noqa: E402
+from game.warmup import warm_up  # noqa: E402
+
+application = FastLaneDispatcher(get_wsgi_application())
+
+# runs in the gunicorn master when the app is preloaded, so workers fork warm
+warm_up()
@@ -1,41 +1,115 @@
 from django.contrib import admin
 
-from .models import LeaderboardEntry, Prompt, Session, Word
+from .models import (
+    DailyChallenge,
+    LeaderboardEntry,
+    Prompt,
+    PromptStats,
+    RequestProfile,
+    Session,
+    Word,
+)
+from .services.prompt_stats import median_solve_ms
 
 
 @admin.register(Word)
 class WordAdmin(admin.ModelAdmin):
-    list_display = ["id", "word"]
+    list_display = ["id", "language", "word"]
     search_fields = ["word"]
+    list_filter = ["language"]
     ordering = ["word"]
 
 
 @admin.register(Prompt)
 class PromptAdmin(admin.ModelAdmin):
-    list_display = ["id", "description", "valid_words_count"]
+    list_display = ["id", "language", "description", "valid_words_count"]
     search_fields = ["description"]
-    list_filter = ["valid_words_count"]
+    list_filter = ["language", "valid_words_count"]
+
+
+# like every admin page, mounted only with ENABLE_ADMIN (off in production unless
+# DJANGO_ENABLE_ADMIN=1); /api/v1/prompts/stats/ serves the same numbers regardless
+@admin.register(PromptStats)
+class PromptStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        "prompt",
+        "language",
+        "times_shown",
+        "times_solved",
+        "solve_rate",
+        "median_solve_ms",
+        "rejections",
+        "updated_at",
+    ]
+    list_filter = ["prompt__language"]
+    search_fields = ["prompt__description"]
+    list_select_related = ["prompt"]
+    readonly_fields = [field.name for field in PromptStats._meta.fields] + [
+        "solve_rate",
+        "median_solve_ms",
+    ]
+    ordering = ["-times_shown"]
+
+    @admin.display(ordering="prompt__language")
+    def language(self, obj):
+        return obj.prompt.language
+
+    @admin.display(description="Solve rate")
+    def solve_rate(self, obj):
+        if not obj.times_shown:
+            return None
+        return f"{obj.times_solved / obj.times_shown:.0%}"
+
+    @admin.display(description="Median solve (ms)")
+    def median_solve_ms(self, obj):
+        return median_solve_ms(obj.solve_ms_histogram)
+
+
+@admin.register(DailyChallenge)
+class DailyChallengeAdmin(admin.ModelAdmin):
+    list_display = ["id", "date", "language", "created_at"]
+    list_filter = ["language"]
+    readonly_fields = [field.name for field in DailyChallenge._meta.fields]
+    ordering = ["-date", "language"]
 
 
 @admin.register(Session)
 class SessionAdmin(admin.ModelAdmin):
     list_display = [
         "id",
+        "language",
         "status",
         "current_ordinal",
         "total_score",
         "created_at",
     ]
     search_fields = ["id"]
-    list_filter = ["status", "created_at"]
+    list_filter = ["language", "status", "created_at"]
     readonly_fields = ["id", "created_at"]
     ordering = ["-created_at"]
 
 
 @admin.register(LeaderboardEntry)
 class LeaderboardEntryAdmin(admin.ModelAdmin):
-    list_display = ["player_name", "score", "created_at"]
+    list_display = ["player_name", "score", "challenge", "created_at"]
     search_fields = ["player_name"]
-    list_filter = ["created_at"]
+    list_filter = ["created_at", "challenge__date"]
     readonly_fields = ["created_at"]
     ordering = ["-score", "created_at"]
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "method",
+        "path",
+        "status_code",
+        "duration_ms",
+        "query_count",
+        "created_at",
+    ]
+    list_filter = ["view_name", "trigger", "created_at"]
+    search_fields = ["path"]
+    readonly_fields = [field.name for field in RequestProfile._meta.fields]
+    ordering = ["-created_at"]
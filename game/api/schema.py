@@ -0,0 +1,58 @@
+"""
+OpenAPI schema served from memory.
+
+The schema is generated at build time (`python manage.py spectacular --format openapi-json
+--file openapi/schema.json`, see the Dockerfile) and read once per process from
+OPENAPI_SCHEMA_PATH. Without that file, and with ENABLE_API_DOCS, it is generated on first
+use and kept; drf_spectacular is imported only then.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+CONTENT_TYPE = "application/vnd.oai.openapi+json"
+
+
+@lru_cache(maxsize=4)
+def _read_schema_bytes(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def read_schema_file(path: Path) -> bytes | None:
+    # only hits are cached (lru_cache does not keep exceptions), so a schema file written
+    # after startup is picked up instead of staying hidden for the life of the process
+    try:
+        return _read_schema_bytes(path)
+    except FileNotFoundError:
+        return None
+
+
+def clear_schema_cache() -> None:
+    _read_schema_bytes.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _generate_schema() -> bytes:
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+def get_openapi_schema() -> bytes | None:
+    schema = read_schema_file(Path(settings.OPENAPI_SCHEMA_PATH))
+    if schema is None and settings.ENABLE_API_DOCS:
+        schema = _generate_schema()
+    return schema
+
+
+def openapi_schema(request):
+    """The OpenAPI document as JSON, without per-request view introspection."""
+    schema = get_openapi_schema()
+    if schema is None:
+        raise Http404("OpenAPI schema not generated")
+    return HttpResponse(schema, content_type=CONTENT_TYPE)
@@ -4,6 +4,8 @@ from . import views
 
 urlpatterns = [
     path("health/", views.health_check, name="health_check"),
+    path("metrics/", views.metrics, name="metrics"),
+    path("ready/", views.ready, name="ready"),
     path("v1/sessions/", views.SessionCreateView.as_view(), name="session_create"),
     path("v1/sessions/<uuid:session_id>/", views.SessionDetailView.as_view(), name="session_detail"),
     path(
@@ -11,10 +13,24 @@ urlpatterns = [
         views.SessionAttemptView.as_view(),
         name="session_attempt",
     ),
+    path(
+        "v1/sessions/<uuid:session_id>/hint/",
+        views.SessionHintView.as_view(),
+        name="session_hint",
+    ),
     path(
         "v1/sessions/<uuid:session_id>/publish/",
         views.SessionPublishView.as_view(),
         name="session_publish",
     ),
     path("v1/leaderboard/", views.LeaderboardView.as_view(), name="leaderboard"),
+    path("v1/leaderboard/stream/", views.leaderboard_stream, name="leaderboard_stream"),
+    path("v1/daily/sessions/", views.DailySessionCreateView.as_view(), name="daily_session_create"),
+    path("v1/daily/leaderboard/", views.DailyLeaderboardView.as_view(), name="daily_leaderboard"),
+    path("v1/prompts/stats/", views.PromptStatsListView.as_view(), name="prompt_stats_list"),
+    path(
+        "v1/prompts/<int:prompt_id>/stats/",
+        views.PromptStatsDetailView.as_view(),
+        name="prompt_stats_detail",
+    ),
 ]
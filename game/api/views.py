@@ -1,18 +1,32 @@
-from django.db import transaction
+from datetime import date
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.views.decorators.http import require_GET
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from game.models import Session
-from game.selectors import get_leaderboard_entries
+from game.models import PromptStats, Session
+from game.query_budget import query_budget
+from game.selectors import get_daily_leaderboard_entries, get_leaderboard_entries
+from game.services.daily_challenge import ChallengeUnavailableError, challenge_date
 from game.services.gameplay import (
+    NoHintAvailableError,
     SessionExpiredError,
     SessionNotActiveError,
     get_current_prompt_payload,
     process_attempt,
+    take_hint,
+)
+from game.services.languages import (
+    DEFAULT_LANGUAGE,
+    UnsupportedLanguageError,
+    validate_language,
 )
 from game.services.leaderboard import (
     AlreadyPublishedError,
@@ -21,12 +35,22 @@ from game.services.leaderboard import (
     SessionNotSubmittedError,
     publish_session,
 )
-from game.services.session_factory import NotEnoughPromptsError, create_session
+from game.services.leaderboard_stream import broadcaster, open_stream
+from game.services.metrics import PhaseTimer, render_metrics
+from game.services.prompt_stats import serialize_prompt_stats
+from game.services.session_factory import (
+    NotEnoughPromptsError,
+    create_daily_session,
+    create_session,
+)
+from game.warmup import is_ready, warm_up, warmup_state
 
 
 def _serialize_session(session: Session) -> dict:
     return {
         "id": str(session.id),
+        "language": session.language,
+        "challenge_id": session.challenge_id,
         "status": session.status,
         "started_at": session.started_at,
         "expires_at": session.expires_at,
@@ -36,63 +60,181 @@ def _serialize_session(session: Session) -> dict:
         "total_score": session.total_score,
         "submitted_at": session.submitted_at,
         "time_left_ms": session.time_left_ms,
+        "hints_used": session.hints_used,
         "answers": session.answers,
         "prompt": get_current_prompt_payload(session),
     }
 
 
+def _created_session_response(session: Session) -> Response:
+    return Response(
+        {
+            "id": str(session.id),
+            "language": session.language,
+            "challenge_id": session.challenge_id,
+            "server_time": timezone.now(),
+            "started_at": session.started_at,
+            "expires_at": session.expires_at,
+            "duration_seconds": session.duration_seconds,
+            "target_words": session.target_words,
+            "current_ordinal": session.current_ordinal,
+            "prompt": get_current_prompt_payload(session),
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+
+def _parse_limit(request, *, maximum: int) -> int:
+    try:
+        limit = int(request.query_params.get("limit", "100"))
+    except ValueError:
+        limit = 100
+    return max(1, min(limit, maximum))
+
+
+def _serialize_entries(entries) -> list[dict]:
+    return [
+        {
+            "rank": idx,
+            "player_name": entry.player_name,
+            "score": entry.score,
+            "created_at": entry.created_at,
+        }
+        for idx, entry in enumerate(entries, start=1)
+    ]
+
+
+@query_budget(0)
 @api_view(["GET"])
 def health_check(request):
     """Health check endpoint."""
     return Response({"status": "ok"})
 
 
+# replica lag probe, when a read replica is configured
+@query_budget(1)
+def metrics(request):
+    """Prometheus text exposition of this worker's in-process metrics."""
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@query_budget(0)
+def ready(request):
+    """Readiness probe: 200 once this process has finished warmup, 503 before."""
+    # retried here in case the database was unreachable when the process started
+    if not is_ready() and not warm_up(close_connections=False):
+        return JsonResponse({"status": "warming_up"}, status=503)
+    return JsonResponse({"status": "ready", **warmup_state()})
+
+
 class SessionCreateView(APIView):
+    # session insert; prompts come from the in-process catalog (one reload per TTL)
+    query_budget = 2
+
     def post(self, request):
         try:
-            session = create_session(duration_seconds=60, target_words=21)
+            session = create_session(
+                duration_seconds=60,
+                target_words=21,
+                language=request.data.get("language", DEFAULT_LANGUAGE),
+            )
+        except UnsupportedLanguageError:
+            return Response({"detail": "Unsupported language."}, status=status.HTTP_400_BAD_REQUEST)
         except NotEnoughPromptsError:
             return Response(
                 {"detail": "At least 21 prompts are required before starting a game."},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
+        return _created_session_response(session)
 
-        return Response(
-            {
-                "id": str(session.id),
-                "server_time": timezone.now(),
-                "started_at": session.started_at,
-                "expires_at": session.expires_at,
-                "duration_seconds": session.duration_seconds,
-                "target_words": session.target_words,
-                "current_ordinal": session.current_ordinal,
-                "prompt": get_current_prompt_payload(session),
-            },
-            status=status.HTTP_201_CREATED,
-        )
+
+class DailySessionCreateView(APIView):
+    # today's challenge lookup, catalog load and challenge insert on the day's first
+    # request in this process, then the session insert; afterwards only the insert
+    query_budget = 4
+
+    def post(self, request):
+        try:
+            session = create_daily_session(
+                duration_seconds=60, language=request.data.get("language", DEFAULT_LANGUAGE)
+            )
+        except UnsupportedLanguageError:
+            return Response({"detail": "Unsupported language."}, status=status.HTTP_400_BAD_REQUEST)
+        except ChallengeUnavailableError:
+            return Response(
+                {"detail": "At least 21 prompts are required before starting a game."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return _created_session_response(session)
 
 
 class SessionDetailView(APIView):
+    # the session, plus its daily challenge when this process has not cached it. Read on the
+    # primary: clients that drop the pin cookie (cross-origin fetch without credentials,
+    # non-browser clients) would otherwise see their session from before their last attempt
+    query_budget = 2
+
     def get(self, request, session_id):
         session = get_object_or_404(Session, id=session_id)
         return Response(_serialize_session(session), status=status.HTTP_200_OK)
 
 
 class SessionAttemptView(APIView):
+    # locked session, dictionary lookup, session save, top-100 threshold; plus the daily
+    # challenge when this process has not cached it
+    query_budget = 5
+    profile_requests = True
+
+    def post(self, request, session_id):
+        timer = PhaseTimer()
+        outcome = "error"
+        try:
+            with timer.phase("transaction"), transaction.atomic():
+                with timer.phase("lock"):
+                    session = get_object_or_404(Session.objects.select_for_update(), id=session_id)
+                try:
+                    payload = process_attempt(
+                        session=session, raw_word=request.data.get("word", ""), timer=timer
+                    )
+                except SessionExpiredError:
+                    outcome = "expired"
+                    return Response({"detail": "Session expired."}, status=status.HTTP_409_CONFLICT)
+                except SessionNotActiveError as exc:
+                    outcome = "not_active"
+                    return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
+            outcome = payload["error_code"] or "accepted"
+        finally:
+            timer.observe(outcome)
+
+        return Response(payload, status=status.HTTP_200_OK)
+
+
+class SessionHintView(APIView):
+    # locked session, the prompt's word list when not cached, session save; plus the daily
+    # challenge when this process has not cached it
+    query_budget = 4
+
     def post(self, request, session_id):
         with transaction.atomic():
             session = get_object_or_404(Session.objects.select_for_update(), id=session_id)
             try:
-                payload = process_attempt(session=session, raw_word=request.data.get("word", ""))
+                payload = take_hint(session=session)
             except SessionExpiredError:
                 return Response({"detail": "Session expired."}, status=status.HTTP_409_CONFLICT)
             except SessionNotActiveError as exc:
                 return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
-
+            except NoHintAvailableError as exc:
+                return Response({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
         return Response(payload, status=status.HTTP_200_OK)
 
 
 class SessionPublishView(APIView):
+    # locked session, advisory lock (Postgres), published check, threshold, insert,
+    # ranked ids, prune, NOTIFYs of the entry and the pruned ids to leaderboard streams
+    # (Postgres)
+    query_budget = 9
+    profile_requests = True
+
     def post(self, request, session_id):
         with transaction.atomic():
             session = get_object_or_404(Session.objects.select_for_update(), id=session_id)
@@ -120,22 +262,89 @@ class SessionPublishView(APIView):
 
 
 class LeaderboardView(APIView):
+    query_budget = 1
+    replica_reads = True
+
+    def get(self, request):
+        entries = get_leaderboard_entries(limit=_parse_limit(request, maximum=100))
+        return Response({"items": _serialize_entries(entries)}, status=status.HTTP_200_OK)
+
+
+# the snapshot; later events come from the broadcaster without queries
+@query_budget(1)
+@require_GET
+def leaderboard_stream(request):
+    """Server-sent events: the top 100, then each new leaderboard entry as it commits."""
+    # an open stream holds a server thread for minutes; a sync worker would serve nothing
+    # else meanwhile and be killed by its timeout mid-stream
+    if not request.META.get("wsgi.multithread"):
+        return JsonResponse({"detail": "Leaderboard streams need a threaded server."}, status=503)
+    if broadcaster.subscriber_count() >= settings.LEADERBOARD_STREAM_MAX_PER_PROCESS:
+        response = JsonResponse({"detail": "Too many open leaderboard streams."}, status=503)
+        response["Retry-After"] = "10"
+        return response
+    stream = open_stream()
+    if not connection.in_atomic_block:
+        # a stream stays open for minutes; give its connection back now
+        connection.close()
+    response = StreamingHttpResponse(stream, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # no proxy buffering
+    return response
+
+
+class DailyLeaderboardView(APIView):
+    query_budget = 1
+    replica_reads = True
+
     def get(self, request):
-        limit_raw = request.query_params.get("limit", "100")
+        language = request.query_params.get("language", DEFAULT_LANGUAGE)
+        try:
+            validate_language(language)
+        except UnsupportedLanguageError:
+            return Response({"detail": "Unsupported language."}, status=status.HTTP_400_BAD_REQUEST)
+        day_raw = request.query_params.get("date")
         try:
-            limit = int(limit_raw)
+            day = date.fromisoformat(day_raw) if day_raw else challenge_date()
         except ValueError:
-            limit = 100
-        limit = max(1, min(limit, 100))
-
-        entries = get_leaderboard_entries(limit=limit)
-        items = [
-            {
-                "rank": idx,
-                "player_name": entry.player_name,
-                "score": entry.score,
-                "created_at": entry.created_at,
-            }
-            for idx, entry in enumerate(entries, start=1)
-        ]
+            return Response(
+                {"detail": "date must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        entries = get_daily_leaderboard_entries(
+            day, language, limit=_parse_limit(request, maximum=100)
+        )
+        return Response(
+            {"date": day, "language": language, "items": _serialize_entries(entries)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class PromptStatsListView(APIView):
+    query_budget = 1
+    replica_reads = True
+
+    def get(self, request):
+        stats = PromptStats.objects.select_related("prompt").order_by("-times_shown", "prompt_id")
+        language = request.query_params.get("language")
+        if language is not None:
+            try:
+                validate_language(language)
+            except UnsupportedLanguageError:
+                return Response(
+                    {"detail": "Unsupported language."}, status=status.HTTP_400_BAD_REQUEST
+                )
+            stats = stats.filter(prompt__language=language)
+
+        limit = _parse_limit(request, maximum=500)
+        items = [serialize_prompt_stats(row) for row in stats[:limit]]
         return Response({"items": items}, status=status.HTTP_200_OK)
+
+
+class PromptStatsDetailView(APIView):
+    query_budget = 1
+    replica_reads = True
+
+    def get(self, request, prompt_id):
+        stats = get_object_or_404(PromptStats.objects.select_related("prompt"), prompt_id=prompt_id)
+        return Response(serialize_prompt_stats(stats), status=status.HTTP_200_OK)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class GameConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "game"
+
+    def ready(self):
+        # connects the Prompt signals that invalidate the catalog and the prompt stats flush
+        from game.services import prompt_catalog, prompt_stats  # noqa: F401
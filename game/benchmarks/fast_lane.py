@@ -0,0 +1,59 @@
+"""
+Per-request cost of the full middleware stack versus the /api/v1/ fast lane, measured by
+calling both WSGI handlers directly with the same requests (no server, no network).
+"""
+
+import io
+import time
+import uuid
+from wsgiref.util import setup_testing_defaults
+
+
+def wsgi_environ(method: str, path: str, body: bytes = b"", **extra) -> dict:
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        **extra,
+    }
+    setup_testing_defaults(environ)
+    return environ
+
+
+def call(handler, method: str, path: str, body: bytes = b"", **extra) -> tuple[str, dict, bytes]:
+    """Run one request through a WSGI handler; returns (status, headers, body)."""
+    captured = {}
+
+    def start_response(status, headers, exc_info=None):
+        captured["status"] = status
+        captured["headers"] = dict(headers)
+
+    response = handler(wsgi_environ(method, path, body, **extra), start_response)
+    try:
+        content = b"".join(response)
+    finally:
+        response.close()
+    return captured["status"], captured["headers"], content
+
+
+def default_requests() -> list[tuple[str, str, bytes]]:
+    """Cheap gameplay requests: leaderboard read, session lookup and attempt (404s)."""
+    missing = uuid.uuid4()
+    return [
+        ("GET", "/api/v1/leaderboard/?limit=10", b""),
+        ("GET", f"/api/v1/sessions/{missing}/", b""),
+        ("POST", f"/api/v1/sessions/{missing}/attempt/", b'{"word": "abols"}'),
+    ]
+
+
+def time_handler(handler, requests, *, count: int, rounds: int) -> float:
+    """Best-of-`rounds` mean microseconds per request over `count` requests."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for i in range(count):
+            call(handler, *requests[i % len(requests)])
+        best = min(best, (time.perf_counter() - start) / count)
+    return best * 1e6
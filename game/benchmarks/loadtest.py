@@ -0,0 +1,292 @@
+"""
+End-to-end load test: simulated players run create -> 21 attempts -> publish against the API,
+either in-process through Django's test client or over HTTP against a running server.
+"""
+
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, connection, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+
+from game.benchmarks.synthetic import synthetic_word
+from game.models import Prompt, Word
+from game.services.dictionary import import_words
+from game.services.prompt_catalog import invalidate_prompt_catalog
+from game.services.prompt_mining import count_patterns, prompt_candidates
+from game.services.validation import rule_to_q
+
+LOADTEST_PREFIX = "[loadtest] "
+
+
+class InProcessTransport:
+    """
+    Calls the Django app directly, including the full middleware stack. With
+    `release_connections` the database connection is released after each request, as the
+    request_finished handler does in a real server (the test client skips it).
+    """
+
+    def __init__(self, *, release_connections: bool = False):
+        self._local = threading.local()
+        self.release_connections = release_connections
+
+    def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = Client(raise_request_exception=False)
+        if method == "POST":
+            response = client.post(path, data=payload or {}, content_type="application/json")
+        else:
+            response = client.get(path)
+        if self.release_connections:
+            close_old_connections()
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, {}
+
+
+class HttpTransport:
+    """Sends real HTTP requests to a running server (runserver, gunicorn, ...)."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+        data = json.dumps(payload or {}).encode() if method == "POST" else None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, json.loads(response.read() or b"{}")
+        except urllib.error.HTTPError as exc:
+            body = exc.read()
+            try:
+                return exc.code, json.loads(body or b"{}")
+            except ValueError:
+                return exc.code, {}
+
+
+class ConnectionMonitor:
+    """
+    Counts Django database connects while active and, on Postgres, samples the peak number
+    of server connections to the current database (excluding the sampler's own).
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.connects = 0
+        self.peak_backends: int | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _on_connect(self, sender, **kwargs):
+        with self._lock:
+            self.connects += 1
+
+    def _sample(self):
+        try:
+            while not self._stop.wait(self.interval):
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+                    )
+                    (count,) = cursor.fetchone()
+                self.peak_backends = max(self.peak_backends or 0, count)
+                close_old_connections()
+        finally:
+            connection.close()
+
+    def __enter__(self):
+        connection_created.connect(self._on_connect, dispatch_uid=id(self))
+        if connection.vendor == "postgresql":
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        connection_created.disconnect(dispatch_uid=id(self))
+
+    def report(self) -> list[str]:
+        lines = [f"database connects: {self.connects}"]
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats = pool.get_stats()
+            lines.append(
+                f"pool: {stats.get('connections_num', 0)} server connections opened, "
+                f"size {stats.get('pool_size', 0)}, "
+                f"waited {stats.get('requests_waiting', 0)} now / "
+                f"{stats.get('requests_wait_ms', 0)} ms total"
+            )
+        if self.peak_backends is not None:
+            lines.append(f"peak server connections: {self.peak_backends}")
+        return lines
+
+
+def seed_dictionary(count: int, *, seed: int = 21) -> dict[str, int]:
+    rng = random.Random(seed)
+    return import_words(synthetic_word(rng) for _ in range(count))
+
+
+def seed_prompts(*, min_count: int, max_count: int, limit: int) -> int:
+    """Mine prompts from the seeded dictionary, tagged so they are easy to find and remove."""
+    words = Word.objects.values_list("word", flat=True).iterator(chunk_size=5000)
+    candidates = prompt_candidates(count_patterns(words), min_count=min_count, max_count=max_count)
+    rng = random.Random(21)
+    rng.shuffle(candidates)
+    Prompt.objects.filter(description__startswith=LOADTEST_PREFIX).delete()
+    Prompt.objects.bulk_create(
+        [
+            Prompt(description=LOADTEST_PREFIX + description, rule=rule, valid_words_count=count)
+            for description, rule, count in candidates[:limit]
+        ]
+    )
+    invalidate_prompt_catalog()
+    return min(limit, len(candidates))
+
+
+def build_candidates(per_prompt: int = 200) -> dict[int, list[str]]:
+    """A sample of valid words for every prompt, used by players to answer correctly."""
+    candidates = {}
+    for prompt in Prompt.objects.all():
+        words = Word.objects.filter(rule_to_q(prompt.rule, language=prompt.language))
+        words = words.filter(language=prompt.language)
+        candidates[prompt.id] = list(words.values_list("word", flat=True)[:per_prompt])
+    return candidates
+
+
+def make_typo(word: str, rng: random.Random) -> str:
+    if len(word) < 3:
+        return word + word[-1]
+    i = rng.randrange(len(word) - 1)
+    if rng.random() < 0.5:
+        # swap two neighbouring letters
+        return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    # drop a letter
+    return word[:i] + word[i + 1 :]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def call(self, transport, endpoint: str, method: str, path: str, payload=None):
+        start = time.perf_counter()
+        status, body = transport.request(method, path, payload)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.latencies[endpoint].append(elapsed)
+            self.statuses[endpoint][status] += 1
+        return status, body
+
+
+def play(
+    transport,
+    recorder: Recorder,
+    candidates: dict[int, list[str]],
+    *,
+    player: int,
+    typo_ratio: float,
+    seed: int,
+):
+    rng = random.Random(seed + player)
+    status, body = recorder.call(transport, "create", "POST", "/api/v1/sessions/")
+    if status != 201:
+        return
+    session_id = body["id"]
+    prompt = body["prompt"]
+    used: set[str] = set()
+    while prompt is not None:
+        pool = [w for w in candidates.get(prompt["prompt_id"], []) if w not in used]
+        if not pool:
+            return
+        word = rng.choice(pool)
+        attempt = make_typo(word, rng) if rng.random() < typo_ratio else word
+        status, body = recorder.call(
+            transport,
+            "attempt",
+            "POST",
+            f"/api/v1/sessions/{session_id}/attempt/",
+            {"word": attempt.upper() if rng.random() < 0.1 else attempt},
+        )
+        if status != 200:
+            return
+        if body["is_valid"]:
+            used.add(attempt)
+        if body["is_finished"]:
+            break
+        prompt = body["prompt"]
+
+    recorder.call(
+        transport,
+        "publish",
+        "POST",
+        f"/api/v1/sessions/{session_id}/publish/",
+        {"player_name": f"Bot {player}"},
+    )
+
+
+def run_players(
+    transport, candidates, *, players: int, concurrency: int, typo_ratio: float, seed: int = 21
+):
+    recorder = Recorder()
+
+    def run(player: int):
+        try:
+            play(transport, recorder, candidates, player=player, typo_ratio=typo_ratio, seed=seed)
+        finally:
+            if concurrency > 1:
+                connections.close_all()
+
+    start = time.perf_counter()
+    if concurrency <= 1:
+        for player in range(players):
+            run(player)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(run, range(players)))
+    return recorder, time.perf_counter() - start
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> list[str]:
+    lines = [
+        f"{'endpoint':<10} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p90 ms':>9} "
+        f"{'p99 ms':>9} {'max ms':>9}  statuses"
+    ]
+    for endpoint in ("create", "attempt", "publish"):
+        values = sorted(recorder.latencies.get(endpoint, []))
+        statuses = ", ".join(
+            f"{code}x{count}" for code, count in sorted(recorder.statuses[endpoint].items())
+        )
+        lines.append(
+            f"{endpoint:<10} {len(values):>9} {len(values) / elapsed if elapsed else 0:>9.1f} "
+            f"{percentile(values, 0.5) * 1000:>9.2f} {percentile(values, 0.9) * 1000:>9.2f} "
+            f"{percentile(values, 0.99) * 1000:>9.2f} {(values[-1] if values else 0) * 1000:>9.2f}"
+            f"  {statuses}"
+        )
+    return lines
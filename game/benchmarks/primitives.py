@@ -0,0 +1,164 @@
+"""
+Microbenchmarks for the per-attempt primitives in game.services.normalization,
+game.services.validation and game.services.scoring, with a saved baseline to catch regressions.
+"""
+
+import json
+import platform
+import timeit
+import unicodedata
+from collections.abc import Callable
+from pathlib import Path
+
+from game.services.normalization import normalize_word_cached
+from game.services.scoring import calculate_time_bonus, calculate_word_points
+from game.services.validation import matches_rule, normalize_word, rule_to_q
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "primitives.json"
+
+WORDS = [
+    "ābols",
+    "šokolāde",
+    "ķirbis",
+    "ģimene",
+    "ļoti",
+    "ņaudēt",
+    "žurka",
+    "čūska",
+    "aplis",
+    "saule",
+    "mežs",
+    "upe",
+    "grāmata",
+    "skolotājs",
+    "vilciens",
+    "pilsēta",
+    "dzīvoklis",
+    "ūdens",
+    "ezers",
+    "kalns",
+    "galle",
+    "šalle",
+    "mamma",
+    "kaķis",
+    "pretpulksteņrādītājvirziens",
+    "neatkarīgākajiem",
+    "starptautiskajās",
+    "vispārizglītojošās",
+]
+
+# what players actually type: padded, capitalised, upper-case and decomposed (NFD) input
+RAW_INPUTS = (
+    WORDS
+    + [f"  {w} " for w in WORDS[:7]]
+    + [w.capitalize() for w in WORDS[7:14]]
+    + [w.upper() for w in WORDS[14:21]]
+    + [unicodedata.normalize("NFD", w) for w in WORDS[21:]]
+)
+
+RULES = [
+    {"type": "starts_with", "value": "ā"},
+    {"type": "starts_with", "value": "s"},
+    {"type": "ends_with", "value": "s"},
+    {"type": "ends_with", "value": "šana"},
+    {"type": "contains", "value": "ie"},
+    {"type": "contains", "value": "šķ"},
+    {"type": "contains_double", "value": "ll"},
+    {"type": "contains_diacritic"},
+]
+
+
+def _over(items, fn) -> Callable[[], None]:
+    def run():
+        for item in items:
+            fn(item)
+
+    return run
+
+
+def _cases() -> dict[str, tuple[Callable[[], None], int]]:
+    """name -> (callable running one batch, calls per batch)."""
+    pairs = [(w, r) for w in WORDS for r in RULES]
+    cases = {
+        "normalize_word": (_over(RAW_INPUTS, normalize_word), len(RAW_INPUTS)),
+        "normalize_word_nfc_lower": (_over(WORDS, normalize_word), len(WORDS)),
+        "normalize_word_cached": (_over(RAW_INPUTS, normalize_word_cached), len(RAW_INPUTS)),
+        "matches_rule": (_over(pairs, lambda p: matches_rule(p[0], p[1])), len(pairs)),
+        "rule_to_q": (_over(RULES, rule_to_q), len(RULES)),
+        "calculate_word_points": (
+            _over(WORDS, lambda w: calculate_word_points(ordinal=7, word_length=len(w))),
+            len(WORDS),
+        ),
+        "calculate_time_bonus": (_over(range(0, 60000, 500), calculate_time_bonus), 120),
+    }
+    for rule in RULES:
+        name = f"matches_rule[{rule['type']}:{rule.get('value', '')}]"
+        cases[name] = (_over(WORDS, lambda w, rule=rule: matches_rule(w, rule)), len(WORDS))
+    return cases
+
+
+CALIBRATION = "_calibration"
+
+
+def _calibration_workload() -> None:
+    # fixed pure-Python work used to scale results between machines and runs
+    total = 0
+    for i in range(1000):
+        total += len(str(i)) * (i % 7)
+
+
+def _best_ns(fn: Callable[[], None], calls: int, repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / (number * calls) * 1e9
+
+
+def run_benchmarks(*, repeat: int = 7, pattern: str | None = None) -> dict[str, float]:
+    """
+    Best-of-`repeat` nanoseconds per call for each case, plus the calibration workload
+    under CALIBRATION so comparisons can correct for machine speed.
+    """
+    results = {CALIBRATION: _best_ns(_calibration_workload, 1, repeat)}
+    for name, (fn, calls) in _cases().items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = _best_ns(fn, calls, repeat)
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+
+def save_baseline(results: dict[str, float], path: Path = BASELINE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(ns, 1) for name, ns in sorted(results.items())},
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], *, threshold: float
+) -> list[tuple[str, float, float | None, float | None, bool]]:
+    """
+    (name, ns, baseline ns, relative change, regressed) per case.
+    Baseline numbers are rescaled by the calibration ratio before comparing, so a slower
+    machine does not read as a regression.
+    """
+    scale = 1.0
+    if baseline.get(CALIBRATION) and results.get(CALIBRATION):
+        scale = results[CALIBRATION] / baseline[CALIBRATION]
+    rows = []
+    for name, ns in results.items():
+        if name == CALIBRATION:
+            continue
+        base = baseline[name] * scale if name in baseline else None
+        change = (ns - base) / base if base else None
+        rows.append((name, ns, base, change, change is not None and change > threshold))
+    return rows
@@ -0,0 +1,50 @@
+"""
+Worker startup cost: import time, peak resident memory and module count of a fresh
+interpreter that imports config.wsgi (Django setup, URL conf and warmup), as a gunicorn
+worker does.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import config.wsgi
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": len(sys.modules),
+    "spectacular": "drf_spectacular" in sys.modules,
+    "admin": "game.admin" in sys.modules,
+}))
+"""
+
+
+def measure_startup(env: dict[str, str], *, runs: int = 5) -> dict:
+    """Median of `runs` fresh-interpreter imports of config.wsgi with `env` overrides."""
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            cwd=PROJECT_ROOT,
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return {
+        "seconds": statistics.median(s["seconds"] for s in samples),
+        "maxrss_mb": statistics.median(s["maxrss_mb"] for s in samples),
+        "modules": samples[-1]["modules"],
+        "spectacular": samples[-1]["spectacular"],
+        "admin": samples[-1]["admin"],
+    }
@@ -0,0 +1,36 @@
+import random
+from collections.abc import Iterator
+
+# rough Latvian letter mix; diacritics are rarer than their base letters
+CONSONANTS = "bcdfghjklmnprstvz" * 3 + "čģķļņšž"
+VOWELS = "aeiou" * 3 + "āēīū"
+
+
+def synthetic_word(rng: random.Random, min_length: int = 3, max_length: int = 12) -> str:
+    """Build a pronounceable lowercase pseudo-Latvian word."""
+    length = rng.randint(min_length, max_length)
+    letters = []
+    for i in range(length):
+        pool = VOWELS if i % 2 else CONSONANTS
+        letters.append(rng.choice(pool))
+    return "".join(letters)
+
+
+def synthetic_lines(count: int, *, duplicate_ratio: float = 0.1, seed: int = 21) -> Iterator[str]:
+    """
+    Yield `count` raw word-list lines, mixing casing, stray whitespace and repeats
+    the way real dictionary dumps do.
+    """
+    rng = random.Random(seed)
+    recent: list[str] = []
+    for _ in range(count):
+        if recent and rng.random() < duplicate_ratio:
+            word = rng.choice(recent)
+        else:
+            word = synthetic_word(rng)
+            recent.append(word)
+            if len(recent) > 1000:
+                recent.pop(0)
+        if rng.random() < 0.1:
+            word = word.capitalize()
+        yield f" {word}\n" if rng.random() < 0.05 else f"{word}\n"
@@ -0,0 +1,143 @@
+"""
+Read-replica routing.
+
+With DATABASE_REPLICA_URL set, settings add a `replica` database alias. Reads are sent to it
+only where stale data is acceptable:
+- views that set `replica_reads = True` (leaderboard, prompt stats);
+- code wrapped in `replica_reads()` (the prompt catalog load).
+Everything else, and every read inside a transaction on the primary, stays on the primary.
+
+Read-your-writes: a game session is always read on the primary, so a player never sees it
+from before their last attempt, cookie or not. Every unsafe (writing) request also sets a
+short-lived cookie. While a client sends it back, ReplicaPinningMiddleware keeps that
+client's other reads on the primary too, so a player's own publish shows up on the
+leaderboard. The cookie works across workers.
+
+Replication lag is exported as the wordrush_db_replica_lag_seconds gauge (Postgres
+replicas; other backends report nothing).
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from game.services.metrics import CallbackGauge
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PIN_COOKIE = "wordrush_primary"
+_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def replica_reads():
+    """Route reads in this block to the replica, when one is configured."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def uses_replica(view_func) -> bool:
+    view_class = getattr(view_func, "view_class", None)
+    return bool(
+        getattr(view_class, "replica_reads", False) or getattr(view_func, "replica_reads", False)
+    )
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get():
+            return None
+        alias = settings.DATABASE_REPLICA_ALIAS
+        # a transaction on the primary must read its own writes
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the replica holds the same rows as the primary
+        return True
+
+
+class ReplicaPinningMiddleware:
+    def __init__(self, get_response):
+        if settings.DATABASE_REPLICA_ALIAS is None:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        writes = request.method not in _SAFE_METHODS
+        request._replica_pinned = writes or REPLICA_PIN_COOKIE in request.COOKIES
+        request._replica_token = None
+        try:
+            response = self.get_response(request)
+        finally:
+            if request._replica_token is not None:
+                _replica_reads.reset(request._replica_token)
+
+        if writes:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not request._replica_pinned and uses_replica(view_func):
+            request._replica_token = _replica_reads.set(True)
+        return None
+
+
+_LAG_SQL = {
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    ),
+}
+
+
+def replica_lag_seconds() -> float | None:
+    """Seconds the replica is behind the primary, or None if it cannot be measured."""
+    alias = settings.DATABASE_REPLICA_ALIAS
+    if alias is None:
+        return None
+    connection = connections[alias]
+    sql = _LAG_SQL.get(connection.vendor)
+    if sql is None:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            (lag,) = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Could not measure replica lag", exc_info=True)
+        return None
+    # NULL when the server is not a replica
+    return None if lag is None else float(lag)
+
+
+def _replica_lag():
+    lag = replica_lag_seconds()
+    return {} if lag is None else {(settings.DATABASE_REPLICA_ALIAS,): lag}
+
+
+CallbackGauge(
+    "wordrush_db_replica_lag_seconds",
+    "Seconds the read replica is behind the primary, measured at scrape time.",
+    ("alias",),
+    _replica_lag,
+)
@@ -0,0 +1,62 @@
+"""
+Fast lane for the stateless JSON API.
+
+config/wsgi.py wraps the Django application in FastLaneDispatcher. Requests whose path starts
+with one of FAST_LANE_PREFIXES go to a second handler built from FAST_LANE_MIDDLEWARE. That
+list is MIDDLEWARE without sessions, auth, messages, CSRF and clickjacking, none of which the
+game API uses. Everything else, /admin/ included, keeps the full stack. The game API views
+also run without DRF authentication or permission classes (see REST_FRAMEWORK).
+
+Django's test client always uses the full stack; `python manage.py bench_fast_lane`
+compares the two handlers.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.core.handlers.wsgi import WSGIHandler
+from django.utils.module_loading import import_string
+
+
+class FastLaneWSGIHandler(WSGIHandler):
+    """WSGIHandler whose middleware chain comes from settings.FAST_LANE_MIDDLEWARE."""
+
+    def load_middleware(self, is_async=False):
+        # BaseHandler.load_middleware for a synchronous handler, over a different list
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        handler = convert_exception_to_response(self._get_response)
+        for middleware_path in reversed(settings.FAST_LANE_MIDDLEWARE):
+            middleware = import_string(middleware_path)
+            try:
+                mw_instance = middleware(handler)
+            except MiddlewareNotUsed:
+                continue
+            if mw_instance is None:
+                raise ImproperlyConfigured(f"Middleware factory {middleware_path} returned None.")
+
+            if hasattr(mw_instance, "process_view"):
+                self._view_middleware.insert(0, mw_instance.process_view)
+            if hasattr(mw_instance, "process_template_response"):
+                self._template_response_middleware.append(mw_instance.process_template_response)
+            if hasattr(mw_instance, "process_exception"):
+                self._exception_middleware.append(mw_instance.process_exception)
+            handler = convert_exception_to_response(mw_instance)
+
+        self._middleware_chain = handler
+
+
+class FastLaneDispatcher:
+    """WSGI application routing FAST_LANE_PREFIXES to the fast lane, the rest to `default`."""
+
+    def __init__(self, default, fast=None):
+        self.default = default
+        self.fast = fast or FastLaneWSGIHandler()
+        self.prefixes = tuple(settings.FAST_LANE_PREFIXES)
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO", "").startswith(self.prefixes):
+            return self.fast(environ, start_response)
+        return self.default(environ, start_response)
@@ -0,0 +1,43 @@
+import logging
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+
+from game.benchmarks.fast_lane import default_requests, time_handler
+from game.fast_lane import FastLaneWSGIHandler
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request time of the full middleware stack and the /api/v1/ fast lane "
+        "on the same gameplay requests (read-only; needs a migrated database)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per round")
+        parser.add_argument("--rounds", type=int, default=5, help="Rounds; the best is kept")
+
+    def handle(self, *args, **options):
+        # the sample requests include 404s
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        requests = default_requests()
+        handlers = {"full stack": WSGIHandler(), "fast lane": FastLaneWSGIHandler()}
+
+        for handler in handlers.values():
+            time_handler(handler, requests, count=len(requests) * 10, rounds=1)  # warm up
+        timings = {
+            name: time_handler(
+                handler, requests, count=options["requests"], rounds=options["rounds"]
+            )
+            for name, handler in handlers.items()
+        }
+
+        for name, micros in timings.items():
+            self.stdout.write(f"{name:<11} {micros:>9.1f} us/request")
+        saved = timings["full stack"] - timings["fast lane"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"fast lane saves {saved:.1f} us/request "
+                f"({saved / timings['full stack']:.1%} of the full-stack time)"
+            )
+        )
@@ -0,0 +1,55 @@
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from game.benchmarks.synthetic import synthetic_lines
+from game.services.dictionary import import_words
+from game.services.wordlist import iter_normalized_words
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark dictionary import on a synthetic word list. "
+        "Runs inside a transaction that is rolled back unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lines", type=int, default=2_000_000, help="Synthetic lines to import"
+        )
+        parser.add_argument("--batch", type=int, default=5000, help="Batch size for bulk inserts")
+        parser.add_argument("--seed", type=int, default=21, help="Random seed for the word list")
+        parser.add_argument("--keep", action="store_true", help="Commit the imported words")
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "words.txt"
+            start = time.perf_counter()
+            with path.open("w", encoding="utf-8") as fh:
+                fh.writelines(synthetic_lines(options["lines"], seed=options["seed"]))
+            self.stdout.write(
+                f"Generated {options['lines']} lines in {time.perf_counter() - start:.2f}s"
+            )
+
+            start = time.perf_counter()
+            with transaction.atomic():
+                with path.open("r", encoding="utf-8") as fh:
+                    words = iter_normalized_words(fh)
+                    stats = import_words(words, batch_size=options["batch"])
+                if not options["keep"]:
+                    transaction.set_rollback(True)
+            elapsed = time.perf_counter() - start
+
+        rate = stats["read"] / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[{connection.vendor}] read {stats['read']}, inserted {stats['inserted']}, "
+                f"duplicates {stats['duplicates']} in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+            )
+        )
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.benchmarks.primitives import (
+    BASELINE_PATH,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark normalize_word, matches_rule, rule_to_q and scoring against a saved "
+        "baseline; fails if any case is slower than the baseline by more than --threshold"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON path")
+        parser.add_argument(
+            "--save-baseline", action="store_true", help="Write results as baseline"
+        )
+        parser.add_argument(
+            "--threshold", type=float, default=0.5, help="Allowed slowdown (0.5 = 50%%)"
+        )
+        parser.add_argument("--repeat", type=int, default=7, help="Timing repeats per case")
+        parser.add_argument("-k", dest="pattern", default=None, help="Only cases containing this")
+
+    def handle(self, *args, **options):
+        path = Path(options["baseline"])
+        results = run_benchmarks(repeat=options["repeat"], pattern=options["pattern"])
+        rows = compare(results, load_baseline(path), threshold=options["threshold"])
+
+        self.stdout.write(f"{'case':<40} {'ns/call':>10} {'baseline':>10} {'change':>8}")
+        for name, ns, base, change, regressed in rows:
+            base_text = f"{base:>10.1f}" if base is not None else f"{'-':>10}"
+            change_text = f"{change:>+8.1%}" if change is not None else f"{'-':>8}"
+            line = f"{name:<40} {ns:>10.1f} {base_text} {change_text}"
+            self.stdout.write(self.style.ERROR(line) if regressed else line)
+
+        if options["save_baseline"]:
+            save_baseline(results, path)
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {path}"))
+            return
+
+        regressions = [row[0] for row in rows if row[4]]
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} case(s) regressed beyond {options['threshold']:.0%}: "
+                + ", ".join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions"))
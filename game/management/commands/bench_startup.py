@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from game.benchmarks.startup import measure_startup
+
+VARIANTS = {
+    "admin+docs": {"DJANGO_ENABLE_ADMIN": "1", "DJANGO_ENABLE_API_DOCS": "1"},
+    "lean": {"DJANGO_ENABLE_ADMIN": "0", "DJANGO_ENABLE_API_DOCS": "0"},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure worker startup (import of config.wsgi in a fresh interpreter): import time, "
+        "peak RSS and module count, with admin and API docs enabled and disabled"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per variant")
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'variant':<12} {'import s':>9} {'max RSS MB':>11} {'modules':>8}  loaded"
+        )
+        for name, env in VARIANTS.items():
+            # production settings, quiet logging; warmup failures (no database) do not matter
+            env = {**env, "DJANGO_DEBUG": "0", "DJANGO_LOG_LEVEL": "ERROR"}
+            result = measure_startup(env, runs=options["runs"])
+            loaded = [m for m in ("admin", "spectacular") if result[m]]
+            self.stdout.write(
+                f"{name:<12} {result['seconds']:>9.3f} {result['maxrss_mb']:>11.1f} "
+                f"{result['modules']:>8}  {', '.join(loaded) or '-'}"
+            )
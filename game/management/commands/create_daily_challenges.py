@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.services.daily_challenge import (
+    ChallengeUnavailableError,
+    challenge_date,
+    get_daily_challenge,
+)
+from game.services.languages import LANGUAGES, UnsupportedLanguageError
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the daily challenges of a day (default today) ahead of its first request, "
+        "e.g. from a cron job shortly before midnight UTC with --tomorrow."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", type=date.fromisoformat, help="Day as YYYY-MM-DD")
+        parser.add_argument("--tomorrow", action="store_true", help="Create tomorrow's")
+        parser.add_argument(
+            "--language",
+            action="append",
+            help="Language to create (repeatable; default all)",
+        )
+
+    def handle(self, *args, **options):
+        if options["date"] and options["tomorrow"]:
+            raise CommandError("--date cannot be combined with --tomorrow")
+        day = options["date"] or challenge_date()
+        if options["tomorrow"]:
+            day += timedelta(days=1)
+
+        for language in options["language"] or LANGUAGES:
+            try:
+                challenge = get_daily_challenge(language, day)
+            except (UnsupportedLanguageError, ChallengeUnavailableError) as exc:
+                raise CommandError(f"{language}: {exc}") from exc
+            self.stdout.write(
+                f"{day} {language}: challenge {challenge.id} "
+                f"with {len(challenge.prompts)} prompts"
+            )
+        self.stdout.write(self.style.SUCCESS("Done"))
@@ -0,0 +1,111 @@
+import json
+import resource
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from game.services.gameplay import EXPIRY_GRACE
+from game.services.session_export import EXPORT_FORMATS, iter_answer_rows, write_chunked
+
+
+def _parse_timestamp(value: str, option: str) -> datetime:
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise CommandError(f"{option}: not an ISO 8601 timestamp: {value!r}")
+    if timezone.is_naive(parsed):
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream accepted answers of finished sessions to chunked, compressed CSV or Parquet "
+        "files, one row per answer. Use --watermark-file for incremental exports."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--out-dir", default="exports", help="Directory for the files")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--rows-per-file", type=int, default=1_000_000)
+        parser.add_argument(
+            "--fetch-size", type=int, default=2000, help="Sessions per cursor fetch"
+        )
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="Only sessions that expired after this ISO timestamp (overrides the watermark)",
+        )
+        parser.add_argument(
+            "--until",
+            default=None,
+            help="Only sessions that expired at or before this ISO timestamp (default: a minute ago)",
+        )
+        parser.add_argument(
+            "--watermark-file",
+            default=None,
+            help="JSON file holding the last export's --until; read as --since, updated on success",
+        )
+
+    def handle(self, *args, **options):
+        if options["rows_per_file"] < 1:
+            raise CommandError("--rows-per-file must be positive")
+        # sessions expired within the grace could still gain answers after being exported,
+        # and the watermark never goes back to pick them up again
+        latest = timezone.now() - EXPIRY_GRACE
+        until = _parse_timestamp(options["until"], "--until") if options["until"] else latest
+        if until > latest:
+            raise CommandError(
+                f"--until must be at least {EXPIRY_GRACE.total_seconds():.0f}s in the past: "
+                "sessions expiring later may still gain answers"
+            )
+
+        watermark_path = Path(options["watermark_file"]) if options["watermark_file"] else None
+        since = None
+        if options["since"]:
+            since = _parse_timestamp(options["since"], "--since")
+        elif watermark_path is not None and watermark_path.exists():
+            since = _parse_timestamp(json.loads(watermark_path.read_text())["until"], "watermark")
+        if since is not None and since >= until:
+            self.stdout.write(f"Nothing to export: since {since.isoformat()} is not before until")
+            return
+
+        self.stdout.write(
+            f"Exporting sessions expired in ({since.isoformat() if since else '-inf'}, "
+            f"{until.isoformat()}]"
+        )
+        start = time.perf_counter()
+        try:
+            stats = write_chunked(
+                iter_answer_rows(since=since, until=until, fetch_size=options["fetch_size"]),
+                out_dir=Path(options["out_dir"]),
+                prefix=f"answers-{until.strftime('%Y%m%dT%H%M%S')}",
+                file_format=options["format"],
+                rows_per_file=options["rows_per_file"],
+            )
+        except ImportError as exc:
+            raise CommandError(str(exc)) from exc
+        elapsed = time.perf_counter() - start
+
+        if watermark_path is not None:
+            watermark_path.write_text(json.dumps({"until": until.isoformat()}) + "\n")
+
+        rate = stats["rows"] / elapsed if elapsed > 0 else 0.0
+        for path in stats["files"]:
+            self.stdout.write(f"  {path}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {stats['rows']} rows to {len(stats['files'])} file(s) in "
+                f"{elapsed:.1f}s ({rate:,.0f} rows/s). Peak memory: {_peak_rss_mib():.1f} MiB"
+            )
+        )
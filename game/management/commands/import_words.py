@@ -1,53 +1,94 @@
 import logging
-from pathlib import Path
+import resource
+import sys
+import time
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
-from game.models import Word
-from game.services.validation import normalize_word
+from game.services.dictionary import import_words, preview_import, sync_words
+from game.services.languages import DEFAULT_LANGUAGE, LANGUAGES
+from game.services.wordlist import (
+    DecompressorUnavailableError,
+    expand_paths,
+    iter_normalized_words,
+    iter_source_lines,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
 class Command(BaseCommand):
-    help = "Import words from a UTF-8 file, one word per line. Usage: import_words --path /path/to/file.txt"
+    help = (
+        "Import words from UTF-8 word lists, one word per line. "
+        "Usage: import_words --path words.txt [--path 'dumps/*.xz' ...] (use '-' for stdin)"
+    )
 
     def add_arguments(self, parser):
-        parser.add_argument("--path", required=True, help="Path to UTF-8 words file")
+        parser.add_argument(
+            "--path",
+            action="append",
+            required=True,
+            help="Word list path or glob; .gz/.xz/.zst are decompressed on the fly; '-' reads stdin. Repeatable.",
+        )
         parser.add_argument("--batch", type=int, default=5000, help="Batch size for bulk inserts")
+        parser.add_argument(
+            "--language",
+            default=DEFAULT_LANGUAGE,
+            choices=sorted(LANGUAGES),
+            help="Dictionary language the words belong to",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Replace the whole dictionary atomically; words missing from the input are removed",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Read and normalize everything, report counts and throughput, write nothing",
+        )
 
     def handle(self, *args, **options):
-        path = Path(options["path"]).expanduser()
+        sources = expand_paths(options["path"])
         batch = options["batch"]
-        if not path.exists():
-            raise FileNotFoundError(path)
-
-        inserted = 0
-        to_create = []
-        seen = set()
-        self.stdout.write(f"Reading {path}")
-        with path.open("r", encoding="utf-8") as fh:
-            for i, line in enumerate(fh, start=1):
-                raw = line.strip()
-                if not raw:
-                    continue
-                # skip multi-word entries
-                if " " in raw:
-                    continue
-                w = normalize_word(raw)
-                if not w:
-                    continue
-                if w in seen:
-                    continue
-                seen.add(w)
-                to_create.append(Word(word=w))
-                if len(to_create) >= batch:
-                    Word.objects.bulk_create(to_create, ignore_conflicts=True)
-                    inserted += len(to_create)
-                    self.stdout.write(f"Inserted {inserted}...")
-                    to_create = []
-
-        if to_create:
-            Word.objects.bulk_create(to_create, ignore_conflicts=True)
-            inserted += len(to_create)
-        self.stdout.write(self.style.SUCCESS(f"Import complete. Approx inserted: {inserted}"))
+
+        start = time.perf_counter()
+        for source in sources:
+            self.stdout.write(f"Reading {'stdin' if source == '-' else source}")
+        try:
+            words = iter_normalized_words(iter_source_lines(sources))
+            if options["dry_run"]:
+                stats = preview_import(words, language=options["language"], batch_size=batch)
+            elif options["sync"]:
+                stats = sync_words(words, language=options["language"], batch_size=batch)
+            else:
+                stats = import_words(words, language=options["language"], batch_size=batch)
+        except DecompressorUnavailableError as exc:
+            raise CommandError(str(exc)) from exc
+
+        elapsed = time.perf_counter() - start
+        rate = stats["read"] / elapsed if elapsed > 0 else 0.0
+        if options["dry_run"]:
+            summary = (
+                f"Dry run complete. Read {stats['read']} words from {len(sources)} source(s), "
+                f"{stats['unique']} unique, would insert {stats['inserted']}, "
+                f"duplicates {stats['duplicates']}"
+            )
+        elif options["sync"]:
+            summary = (
+                f"Sync complete. Dictionary version {stats['version']}: {stats['words']} words "
+                f"(was {stats['previous']}), read {stats['read']}"
+            )
+        else:
+            summary = (
+                f"Import complete. Read {stats['read']}, inserted {stats['inserted']}, "
+                f"duplicates {stats['duplicates']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"{summary} in {elapsed:.2f}s ({rate:,.0f} rows/s)"))
+        self.stdout.write(f"Peak memory: {_peak_rss_mib():.1f} MiB")
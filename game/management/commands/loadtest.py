@@ -0,0 +1,107 @@
+import logging
+import time
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from game.benchmarks.loadtest import (
+    ConnectionMonitor,
+    HttpTransport,
+    InProcessTransport,
+    build_candidates,
+    run_players,
+    seed_dictionary,
+    seed_prompts,
+    summarize,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the game API with simulated players (create -> 21 attempts -> publish). "
+        "Seeding writes synthetic words and prompts: use a local, throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--words", type=int, default=0, help="Seed N synthetic words first")
+        parser.add_argument("--prompts", type=int, default=100, help="Mined prompts to seed")
+        parser.add_argument("--players", type=int, default=50, help="Simulated players")
+        parser.add_argument("--concurrency", type=int, default=8, help="Players running at once")
+        parser.add_argument(
+            "--typo-ratio", type=float, default=0.15, help="Share of attempts with a typo"
+        )
+        parser.add_argument(
+            "--base-url",
+            default=None,
+            help="Target a running server over HTTP instead of calling the app in-process",
+        )
+        parser.add_argument("--seed", type=int, default=21, help="Random seed")
+
+    def handle(self, *args, **options):
+        if options["words"]:
+            start = time.perf_counter()
+            stats = seed_dictionary(options["words"], seed=options["seed"])
+            # band the prompts relative to dictionary size so every prompt is playable
+            total = max(stats["read"], 1)
+            seeded = seed_prompts(
+                min_count=max(50, total // 2000), max_count=total // 5, limit=options["prompts"]
+            )
+            self.stdout.write(
+                f"Seeded {stats['inserted']} words and {seeded} prompts "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+
+        candidates = {pid: words for pid, words in build_candidates().items() if len(words) >= 25}
+        if len(candidates) < 21:
+            raise CommandError(
+                "Fewer than 21 playable prompts; seed a dictionary with --words first."
+            )
+
+        monitor = None
+        request_logger = logging.getLogger("django.request")
+        request_log_level = request_logger.level
+        if options["base_url"]:
+            transport = HttpTransport(options["base_url"])
+        else:
+            transport = InProcessTransport(release_connections=connection.vendor != "sqlite")
+            monitor = ConnectionMonitor()
+            # failures are counted per status below; skip a traceback per 500 during the run
+            request_logger.setLevel(logging.CRITICAL)
+            if connection.vendor == "sqlite" and options["concurrency"] > 1:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "SQLite allows one writer at a time; concurrent players will hit "
+                        "'database is locked' (500s). Use --concurrency 1 or Postgres."
+                    )
+                )
+        target = options["base_url"] or f"in-process ({connection.vendor})"
+        self.stdout.write(
+            f"Running {options['players']} players, concurrency {options['concurrency']} "
+            f"against {target}"
+        )
+        try:
+            with monitor or nullcontext():
+                recorder, elapsed = run_players(
+                    transport,
+                    candidates,
+                    players=options["players"],
+                    concurrency=options["concurrency"],
+                    typo_ratio=options["typo_ratio"],
+                    seed=options["seed"],
+                )
+        finally:
+            request_logger.setLevel(request_log_level)
+        for line in summarize(recorder, elapsed):
+            self.stdout.write(line)
+        if monitor is not None:
+            for line in monitor.report():
+                self.stdout.write(line)
+        total = sum(len(v) for v in recorder.latencies.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total} requests in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.1f} req/s)"
+            )
+        )
@@ -0,0 +1,86 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from game.models import Prompt, Word
+from game.selectors import get_dictionary_version
+from game.services.languages import DEFAULT_LANGUAGE, LANGUAGES
+from game.services.prompt_catalog import invalidate_prompt_catalog
+from game.services.prompt_mining import count_patterns, prompt_candidates
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mine starts_with/ends_with/contains/contains_double prompts from the dictionary "
+        "in one pass and insert those whose match count falls in a band"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language", default=DEFAULT_LANGUAGE, choices=sorted(LANGUAGES), help="Dictionary"
+        )
+        parser.add_argument("--min-count", type=int, default=100, help="Fewest matching words")
+        parser.add_argument("--max-count", type=int, default=50000, help="Most matching words")
+        parser.add_argument(
+            "--max-affix-length", type=int, default=2, help="Longest prefix/suffix to consider"
+        )
+        parser.add_argument("--limit", type=int, default=None, help="Insert at most N prompts")
+        parser.add_argument("--dry-run", action="store_true", help="Print candidates only")
+
+    def handle(self, *args, **options):
+        start = time.time()
+        language = options["language"]
+        version = get_dictionary_version(language)
+        words = (
+            Word.objects.filter(language=language)
+            .values_list("word", flat=True)
+            .iterator(chunk_size=5000)
+        )
+        counts = count_patterns(words, max_affix_length=options["max_affix_length"])
+        candidates = prompt_candidates(
+            counts,
+            min_count=options["min_count"],
+            max_count=options["max_count"],
+            language=language,
+        )
+
+        existing = {
+            (rule.get("type"), rule.get("value"))
+            for rule in Prompt.objects.filter(language=language).values_list("rule", flat=True)
+            if isinstance(rule, dict)
+        }
+        new = [c for c in candidates if (c[1]["type"], c[1]["value"]) not in existing]
+        if options["limit"] is not None:
+            new = new[: options["limit"]]
+
+        if options["dry_run"]:
+            for description, _, count in new:
+                self.stdout.write(f"{count:>8}  {description}")
+        else:
+            Prompt.objects.bulk_create(
+                [
+                    Prompt(
+                        language=language,
+                        description=description,
+                        rule=rule,
+                        valid_words_count=count,
+                        dictionary_version=version,
+                    )
+                    for description, rule, count in new
+                ]
+            )
+            # bulk_create sends no post_save
+            invalidate_prompt_catalog()
+            logger.info("Mined %d prompts", len(new))
+
+        elapsed = time.time() - start
+        verb = "Found" if options["dry_run"] else "Inserted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {len(new)} new prompts ({len(candidates)} in band, "
+                f"{len(counts)} patterns) in {elapsed:.2f}s"
+            )
+        )
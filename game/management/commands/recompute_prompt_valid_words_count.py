@@ -2,29 +2,63 @@ import logging
 import time
 
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 
 from game.models import Prompt, Word
+from game.selectors import get_dictionary_version
+from game.services.hints import build_word_list, save_word_lists
+from game.services.languages import LANGUAGES
 from game.services.validation import rule_to_q
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = "Recompute valid_words_count for all prompts using current Word entries"
+    help = (
+        "Recompute valid_words_count and the hint word lists of all prompts using current "
+        "Word entries"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-only",
+            action="store_true",
+            help="Skip prompts already computed against the current dictionary version",
+        )
 
     def handle(self, *args, **options):
         start = time.time()
-        prompts = list(Prompt.objects.all())
+        # versions are per language; a prompt is current against its own language's
+        versions = {language: get_dictionary_version(language) for language in LANGUAGES}
+        prompts = Prompt.objects.all()
+        if options["stale_only"]:
+            current = Q()
+            for language, version in versions.items():
+                current |= Q(language=language, dictionary_version=version)
+            prompts = prompts.exclude(current)
         total_updated = 0
-        for p in prompts:
+        word_lists = {language: [] for language in LANGUAGES}
+        for p in list(prompts):
             rule = p.rule or {}
-            q = rule_to_q(rule)
+            q = rule_to_q(rule, language=p.language)
             # perform the count in SQL using Django ORM
-            count = Word.objects.filter(q).count()
+            count = Word.objects.filter(q, language=p.language).count()
             p.valid_words_count = count
-            p.save(update_fields=["valid_words_count"])
+            p.dictionary_version = versions[p.language]
+            p.save(update_fields=["valid_words_count", "dictionary_version"])
+            word_lists[p.language].append((p.id, build_word_list(p) if count else []))
             total_updated += 1
             logger.info("Prompt %s updated with %d matches", p.id, count)
 
+        for language, lists in word_lists.items():
+            if lists:
+                save_word_lists(lists, version=versions[language])
+
         elapsed = time.time() - start
-        self.stdout.write(self.style.SUCCESS(f"Updated {total_updated} prompts in {elapsed:.2f}s"))
+        described = ", ".join(f"{language} v{version}" for language, version in versions.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated {total_updated} prompts for dictionary versions {described} "
+                f"in {elapsed:.2f}s"
+            )
+        )
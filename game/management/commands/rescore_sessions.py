@@ -0,0 +1,138 @@
+import logging
+import multiprocessing
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from game.models import LeaderboardEntry, Session
+from game.services.gameplay import EXPIRY_GRACE
+from game.services.scoring import rescore_batch
+
+logger = logging.getLogger(__name__)
+
+
+def _iter_chunks(chunk_size: int):
+    """
+    Keyset-paginate finished sessions by primary key, yielding lists of scoring rows.
+    Sessions that can still take attempts are skipped: an attempt committing between the
+    read and the write would lose its answer.
+    """
+    finished = Q(status__in=("submitted", "expired")) | Q(
+        expires_at__lt=timezone.now() - EXPIRY_GRACE
+    )
+    last_id = None
+    while True:
+        queryset = Session.objects.filter(finished).order_by("id")
+        if last_id is not None:
+            queryset = queryset.filter(id__gt=last_id)
+        rows = list(
+            queryset.values_list("id", "answers", "time_left_ms", "hints_used", "total_score")[
+                :chunk_size
+            ]
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+
+
+def _iter_results(chunks, workers: int):
+    if workers <= 1:
+        for chunk in chunks:
+            yield rescore_batch(chunk)
+        return
+
+    # spawned (not forked) workers never share the parent's database connection;
+    # rescore_batch needs no Django setup
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(rescore_batch, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _describe(scores: Counter) -> str:
+    total = sum(scores.values())
+    if not total:
+        return "n=0"
+    ordered = sorted(scores.items())
+    marks = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+    found = {}
+    seen = 0
+    for score, count in ordered:
+        seen += count
+        for name, fraction in marks.items():
+            if name not in found and seen >= fraction * total:
+                found[name] = score
+    mean = sum(score * count for score, count in ordered) / total
+    return (
+        f"n={total} min={ordered[0][0]} p50={found['p50']} p90={found['p90']} "
+        f"p99={found['p99']} max={ordered[-1][0]} mean={mean:.1f}"
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute finished sessions' scores with the current scoring rules "
+        "(use --dry-run to preview)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Sessions per chunk")
+        parser.add_argument("--workers", type=int, default=1, help="Scoring processes")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only print before/after score distributions, write nothing",
+        )
+
+    def handle(self, *args, **options):
+        start = time.time()
+        before = Counter()
+        after = Counter()
+        changed = 0
+        processed = 0
+
+        results = _iter_results(_iter_chunks(options["chunk_size"]), options["workers"])
+        for batch in results:
+            updates = []
+            for session_id, old_total, new_total, rescored in batch:
+                before[old_total] += 1
+                after[new_total] += 1
+                # answers is None when every stored answer's points are current
+                if rescored is not None or new_total != old_total:
+                    updates.append(Session(id=session_id, total_score=new_total, answers=rescored))
+            processed += len(batch)
+            changed += len(updates)
+            if updates and not options["dry_run"]:
+                self._write(updates)
+            logger.info("Rescored %d sessions (%d changed)", processed, changed)
+
+        elapsed = time.time() - start
+        self.stdout.write(f"Before: {_describe(before)}")
+        self.stdout.write(f"After:  {_describe(after)}")
+        verb = "Would change" if options["dry_run"] else "Changed"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {changed} of {processed} sessions in {elapsed:.2f}s")
+        )
+
+    def _write(self, updates: list[Session]) -> None:
+        new_scores = {session.id: session.total_score for session in updates}
+        rescored = [session for session in updates if session.answers is not None]
+        totals_only = [session for session in updates if session.answers is None]
+        with transaction.atomic():
+            Session.objects.bulk_update(rescored, ["total_score", "answers"])
+            Session.objects.bulk_update(totals_only, ["total_score"])
+            entries = list(LeaderboardEntry.objects.filter(session_id__in=new_scores))
+            for entry in entries:
+                entry.score = new_scores[entry.session_id]
+            LeaderboardEntry.objects.bulk_update(entries, ["score"])
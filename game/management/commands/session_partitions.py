@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from django.utils import timezone
+
+from game.services.session_partitions import (
+    DEFAULT_PARTITION,
+    PartitioningError,
+    enable_partitioning,
+    maintain_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintain daily range partitions of the Session table (Postgres): create upcoming "
+        "days and detach or drop expired ones. --enable converts the table once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--enable",
+            action="store_true",
+            help="Convert Session into a partitioned table (locks it while indexing)",
+        )
+        parser.add_argument("--ahead", type=int, default=7, help="Days to pre-create")
+        parser.add_argument(
+            "--retain-days",
+            type=int,
+            default=None,
+            help="Retire partitions whose rows are all older than this many days",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop retired partitions instead of detaching them into standalone tables",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only print the plan")
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        try:
+            if options["enable"]:
+                if options["dry_run"]:
+                    raise CommandError("--dry-run cannot be combined with --enable")
+                legacy = enable_partitioning(today=today, ahead=options["ahead"])
+                self.stdout.write(
+                    self.style.SUCCESS(f"Session is partitioned; existing rows are in {legacy}")
+                )
+                return
+            result = maintain_partitions(
+                today=today,
+                ahead=options["ahead"],
+                retain_days=options["retain_days"],
+                drop=options["drop"],
+                dry_run=options["dry_run"],
+            )
+        except (PartitioningError, DatabaseError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["dry_run"]:
+            created = "Would create"
+            retired = "Would drop" if options["drop"] else "Would detach"
+        else:
+            created = "Created"
+            retired = "Dropped" if options["drop"] else "Detached"
+        for name in result["created"]:
+            self.stdout.write(f"{created} {name}")
+        for name in result["retired"]:
+            self.stdout.write(f"{retired} {name}")
+        for name in result["kept"]:
+            self.stdout.write(f"Kept {name}: it holds sessions still on the leaderboard")
+        moved = "Would move" if options["dry_run"] else "Moved"
+        for name, rows in result["moved"].items():
+            self.stdout.write(f"{moved} {rows} rows from {DEFAULT_PARTITION} into {name}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(result['created'])} created, {len(result['retired'])} retired, "
+                f"{len(result['kept'])} kept"
+            )
+        )
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from game.models import RequestProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "List stored request profiles, or print one profile's top functions and SQL log. "
+        "Profiles are captured by game.profiling.ProfilingMiddleware."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("profile_id", nargs="?", type=int, help="Profile to print in full")
+        parser.add_argument("--view", default=None, help="Only profiles of this view name")
+        parser.add_argument("--limit", type=int, default=20, help="Profiles to list")
+        parser.add_argument("--top", type=int, default=None, help="Functions to print")
+        parser.add_argument(
+            "--purge-days",
+            type=int,
+            default=None,
+            help="Delete profiles older than this many days and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["purge_days"] is not None:
+            cutoff = timezone.now() - timedelta(days=options["purge_days"])
+            deleted, _ = RequestProfile.objects.filter(created_at__lt=cutoff).delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} profile(s)"))
+            return
+
+        if options["profile_id"] is not None:
+            try:
+                profile = RequestProfile.objects.get(id=options["profile_id"])
+            except RequestProfile.DoesNotExist as exc:
+                raise CommandError(f"Profile {options['profile_id']} not found") from exc
+            self._print_profile(profile, options["top"])
+            return
+
+        profiles = RequestProfile.objects.defer("stats", "queries")
+        if options["view"]:
+            profiles = profiles.filter(view_name=options["view"])
+        self.stdout.write(
+            f"{'id':>6} {'created':<19} {'status':>6} {'ms':>9} {'queries':>7} "
+            f"{'trigger':<7} request"
+        )
+        for profile in profiles[: options["limit"]]:
+            self.stdout.write(
+                f"{profile.id:>6} {profile.created_at:%Y-%m-%d %H:%M:%S} "
+                f"{profile.status_code:>6} {profile.duration_ms:>9.1f} {profile.query_count:>7} "
+                f"{profile.trigger:<7} {profile.method} {profile.path}"
+            )
+
+    def _print_profile(self, profile: RequestProfile, top: int | None):
+        self.stdout.write(
+            f"{profile.method} {profile.path} -> {profile.status_code} "
+            f"view={profile.view_name} trigger={profile.trigger} "
+            f"at {profile.created_at:%Y-%m-%d %H:%M:%S}"
+        )
+        self.stdout.write(f"{profile.duration_ms:.1f} ms, {profile.query_count} queries\n")
+
+        self.stdout.write(f"{'ncalls':>10} {'tottime ms':>11} {'cumtime ms':>11}  function")
+        for row in profile.stats[:top]:
+            self.stdout.write(
+                f"{row['ncalls']!s:>10} {row['tottime_ms']:>11.3f} {row['cumtime_ms']:>11.3f}  "
+                f"{row['function']}"
+            )
+
+        self.stdout.write(f"\n{'ms':>9}  sql")
+        for query in profile.queries:
+            self.stdout.write(f"{query['ms']:>9.3f}  {query['sql']}")
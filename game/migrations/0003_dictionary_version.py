@@ -0,0 +1,29 @@
+# Generated by Django 4.2.17 on 2026-10-19 11:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0002_alter_session_prompts_default"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DictionaryVersion",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("word_count", models.IntegerField()),
+                ("is_full_sync", models.BooleanField(default=False)),
+            ],
+            options={
+                "ordering": ["-id"],
+            },
+        ),
+        migrations.AddField(
+            model_name="prompt",
+            name="dictionary_version",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.17 on 2026-10-19 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0003_dictionary_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="prompt",
+            name="language",
+            field=models.CharField(
+                choices=[("lv", "Latvian"), ("lt", "Lithuanian"), ("et", "Estonian")],
+                db_index=True,
+                default="lv",
+                max_length=8,
+            ),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="language",
+            field=models.CharField(
+                choices=[("lv", "Latvian"), ("lt", "Lithuanian"), ("et", "Estonian")],
+                default="lv",
+                max_length=8,
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="language",
+            field=models.CharField(
+                choices=[("lv", "Latvian"), ("lt", "Lithuanian"), ("et", "Estonian")],
+                default="lv",
+                max_length=8,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="word",
+            name="word",
+            field=models.TextField(),
+        ),
+        migrations.AddIndex(
+            model_name="word",
+            index=models.Index(
+                fields=["language", "word"],
+                name="game_word_lang_word_like",
+                opclasses=["varchar_pattern_ops", "text_pattern_ops"],
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="word",
+            constraint=models.UniqueConstraint(
+                fields=("language", "word"), name="game_word_language_word_uniq"
+            ),
+        ),
+    ]
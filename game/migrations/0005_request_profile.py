@@ -0,0 +1,39 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0004_language_scoping"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestProfile",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("method", models.CharField(max_length=8)),
+                ("path", models.CharField(max_length=255)),
+                ("view_name", models.CharField(blank=True, max_length=128)),
+                ("status_code", models.PositiveSmallIntegerField()),
+                (
+                    "trigger",
+                    models.CharField(
+                        choices=[("header", "Header"), ("sample", "Sample")], max_length=8
+                    ),
+                ),
+                ("duration_ms", models.FloatField()),
+                ("query_count", models.PositiveIntegerField()),
+                ("stats", models.JSONField(default=list)),
+                ("queries", models.JSONField(default=list)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["-created_at"], name="game_reques_created_867895_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0005_request_profile"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PromptStats",
+            fields=[
+                (
+                    "prompt",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="game.prompt",
+                    ),
+                ),
+                ("times_shown", models.PositiveIntegerField(default=0)),
+                ("times_solved", models.PositiveIntegerField(default=0)),
+                ("rejections", models.JSONField(default=dict)),
+                ("solve_ms_histogram", models.JSONField(default=list)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "prompt stats",
+            },
+        ),
+    ]
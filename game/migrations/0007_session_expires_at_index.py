@@ -0,0 +1,16 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0006_prompt_stats"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(fields=["expires_at"], name="game_sessio_expires_6ea0c2_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0007_session_expires_at_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="leaderboardentry",
+            name="session",
+            field=models.OneToOneField(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="leaderboard_entry",
+                to="game.session",
+            ),
+        ),
+    ]
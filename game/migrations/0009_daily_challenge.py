@@ -0,0 +1,67 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0008_leaderboard_session_without_fk"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyChallenge",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                (
+                    "language",
+                    models.CharField(
+                        choices=[("lv", "Latvian"), ("lt", "Lithuanian"), ("et", "Estonian")],
+                        default="lv",
+                        max_length=8,
+                    ),
+                ),
+                ("prompts", models.JSONField(default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-date", "language"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="dailychallenge",
+            constraint=models.UniqueConstraint(
+                fields=("date", "language"), name="uniq_daily_challenge"
+            ),
+        ),
+        migrations.AddField(
+            model_name="leaderboardentry",
+            name="challenge",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="leaderboard_entries",
+                to="game.dailychallenge",
+            ),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="challenge",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sessions",
+                to="game.dailychallenge",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leaderboardentry",
+            index=models.Index(
+                fields=["challenge", "-score", "created_at"], name="game_leader_challen_f23ec1_idx"
+            ),
+        ),
+    ]
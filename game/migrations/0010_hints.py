@@ -0,0 +1,36 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0009_daily_challenge"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PromptWordList",
+            fields=[
+                (
+                    "prompt",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="word_list",
+                        serialize=False,
+                        to="game.prompt",
+                    ),
+                ),
+                ("words", models.TextField(blank=True, default="")),
+                ("dictionary_version", models.BigIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="hints_used",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
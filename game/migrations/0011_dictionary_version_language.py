@@ -0,0 +1,22 @@
+# Generated by Django 4.2.17 on 2026-10-19 12:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0010_hints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dictionaryversion",
+            name="language",
+            field=models.CharField(
+                choices=[("lv", "Latvian"), ("lt", "Lithuanian"), ("et", "Estonian")],
+                db_index=True,
+                default="lv",
+                max_length=8,
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-19 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0011_dictionary_version_language"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="session",
+            name="hinted_words",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
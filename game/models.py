@@ -2,20 +2,58 @@ import uuid
 
 from django.db import models
 
+from game.services.languages import DEFAULT_LANGUAGE, LANGUAGE_CHOICES
+
 
 class Word(models.Model):
     """
-    A canonical dictionary word entry in normalized form.
+    A canonical dictionary word entry in normalized form, scoped by language.
     """
 
     id = models.BigAutoField(primary_key=True)
-    word = models.TextField(unique=True)
+    language = models.CharField(max_length=8, choices=LANGUAGE_CHOICES, default=DEFAULT_LANGUAGE)
+    word = models.TextField()
 
     def __str__(self):
         return self.word
 
     class Meta:
         ordering = ["word"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["language", "word"], name="game_word_language_word_uniq"
+            ),
+        ]
+        indexes = [
+            # LIKE 'prefix%' lookups from rule_to_q within one language (Postgres)
+            models.Index(
+                fields=["language", "word"],
+                name="game_word_lang_word_like",
+                opclasses=["varchar_pattern_ops", "text_pattern_ops"],
+            ),
+        ]
+
+
+class DictionaryVersion(models.Model):
+    """
+    One row per change to one language's dictionary (import or full sync).
+    The latest id of a language is its live dictionary version that caches can key on.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    language = models.CharField(
+        max_length=8, choices=LANGUAGE_CHOICES, default=DEFAULT_LANGUAGE, db_index=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    # words in this language's dictionary after the change
+    word_count = models.IntegerField()
+    is_full_sync = models.BooleanField(default=False)
+
+    def __str__(self):
+        return f"Dictionary {self.language} v{self.id} ({self.word_count} words)"
+
+    class Meta:
+        ordering = ["-id"]
 
 
 class Prompt(models.Model):
@@ -24,9 +62,14 @@ class Prompt(models.Model):
     """
 
     id = models.BigAutoField(primary_key=True)
+    language = models.CharField(
+        max_length=8, choices=LANGUAGE_CHOICES, default=DEFAULT_LANGUAGE, db_index=True
+    )
     description = models.TextField()
     rule = models.JSONField()  # e.g. {"type":"starts_with","value":"a"}
     valid_words_count = models.IntegerField(null=True, blank=True)
+    # DictionaryVersion.id that valid_words_count was computed against
+    dictionary_version = models.BigIntegerField(null=True, blank=True)
 
     def __str__(self):
         return self.description
@@ -35,6 +78,72 @@ class Prompt(models.Model):
         ordering = ["id"]
 
 
+class PromptWordList(models.Model):
+    """
+    Up to HINT_WORDS valid words of one prompt, precomputed for hints so a hint never
+    scans Word. See game.services.hints.
+    """
+
+    prompt = models.OneToOneField(
+        Prompt, on_delete=models.CASCADE, primary_key=True, related_name="word_list"
+    )
+    # newline-separated normalized words
+    words = models.TextField(blank=True, default="")
+    # DictionaryVersion.id the words were taken from
+    dictionary_version = models.BigIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Word list for prompt {self.prompt_id}"
+
+
+class PromptStats(models.Model):
+    """
+    Gameplay counters for one prompt, accumulated incrementally from attempts.
+    See game.services.prompt_stats.
+    """
+
+    prompt = models.OneToOneField(
+        Prompt, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    times_shown = models.PositiveIntegerField(default=0)
+    times_solved = models.PositiveIntegerField(default=0)
+    # error_code -> count, e.g. {"not_in_dictionary": 12, "rule_mismatch": 3}
+    rejections = models.JSONField(default=dict)
+    # counts per bucket of prompt_stats.SOLVE_MS_BUCKETS, the last one unbounded
+    solve_ms_histogram = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for prompt {self.prompt_id}"
+
+    class Meta:
+        verbose_name_plural = "prompt stats"
+
+
+class DailyChallenge(models.Model):
+    """
+    The shared prompt set of one day's challenge in one language. Every challenge session
+    references it instead of snapshotting its own prompts. See game.services.daily_challenge.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    date = models.DateField()
+    language = models.CharField(max_length=8, choices=LANGUAGE_CHOICES, default=DEFAULT_LANGUAGE)
+    # same shape as Session.prompts
+    prompts = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Daily challenge {self.date} ({self.language})"
+
+    class Meta:
+        ordering = ["-date", "language"]
+        constraints = [
+            models.UniqueConstraint(fields=["date", "language"], name="uniq_daily_challenge"),
+        ]
+
+
 class Session(models.Model):
     """
     A game session instance.
@@ -48,6 +157,7 @@ class Session(models.Model):
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    language = models.CharField(max_length=8, choices=LANGUAGE_CHOICES, default=DEFAULT_LANGUAGE)
     created_at = models.DateTimeField(auto_now_add=True)
     started_at = models.DateTimeField()
     expires_at = models.DateTimeField()
@@ -58,9 +168,16 @@ class Session(models.Model):
     total_score = models.IntegerField(default=0)
     submitted_at = models.DateTimeField(null=True, blank=True)
     time_left_ms = models.IntegerField(null=True, blank=True)  # time remaining when submitted
+    hints_used = models.PositiveIntegerField(default=0)  # each costs scoring.HINT_PENALTY
+    # words revealed by hints, never revealed twice
+    hinted_words = models.JSONField(default=list, blank=True)
 
-    # snapshot of 21 prompts and their rules captured at session start
+    # snapshot of 21 prompts and their rules captured at session start; empty for daily
+    # challenge sessions, which share their challenge's prompts
     prompts = models.JSONField(default=list)
+    challenge = models.ForeignKey(
+        DailyChallenge, null=True, blank=True, on_delete=models.PROTECT, related_name="sessions"
+    )
     # answers = list of successful words with scoring metadata
     answers = models.JSONField(default=list)
 
@@ -72,6 +189,8 @@ class Session(models.Model):
         indexes = [
             models.Index(fields=["-created_at"]),
             models.Index(fields=["status"]),
+            # export_sessions watermark
+            models.Index(fields=["expires_at"]),
         ]
 
 
@@ -82,12 +201,22 @@ class LeaderboardEntry(models.Model):
     """
 
     id = models.BigAutoField(primary_key=True)
+    # no database foreign key: a partitioned Session table (game.services.session_partitions)
+    # cannot be referenced by id alone; the ORM still cascades deletes
     session = models.OneToOneField(
-        Session, on_delete=models.CASCADE, related_name="leaderboard_entry"
+        Session, on_delete=models.CASCADE, related_name="leaderboard_entry", db_constraint=False
     )
     player_name = models.CharField(max_length=64)
     score = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # the session's daily challenge: each challenge has its own board, null is the main one
+    challenge = models.ForeignKey(
+        DailyChallenge,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entries",
+    )
 
     def __str__(self):
         return f"{self.player_name} - {self.score}"
@@ -96,4 +225,40 @@ class LeaderboardEntry(models.Model):
         ordering = ["-score", "created_at"]
         indexes = [
             models.Index(fields=["-score", "created_at"]),
+            models.Index(fields=["challenge", "-score", "created_at"]),
+        ]
+
+
+class RequestProfile(models.Model):
+    """
+    cProfile top functions and SQL query log captured for one profiled request.
+    See game.profiling.
+    """
+
+    TRIGGER_CHOICES = [
+        ("header", "Header"),
+        ("sample", "Sample"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    method = models.CharField(max_length=8)
+    path = models.CharField(max_length=255)
+    view_name = models.CharField(max_length=128, blank=True)
+    status_code = models.PositiveSmallIntegerField()
+    trigger = models.CharField(max_length=8, choices=TRIGGER_CHOICES)
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField()
+    # [{"function", "ncalls", "tottime_ms", "cumtime_ms"}] sorted by cumulative time
+    stats = models.JSONField(default=list)
+    # [{"sql", "ms"}] in execution order
+    queries = models.JSONField(default=list)
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.1f} ms)"
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
         ]
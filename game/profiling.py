@@ -0,0 +1,160 @@
+"""
+On-demand request profiling.
+
+Views opt in with a `profile_requests = True` class attribute, or the @profiled decorator on
+function views. A request to an opted-in view is profiled when it sends an X-Profile header
+and either comes from a logged-in staff user or carries PROFILING_TOKEN as the header value,
+or when it is picked by PROFILING_SAMPLE_RATE. The view then runs under cProfile with every
+SQL statement timed. The top PROFILING_TOP_N functions by cumulative time are stored as a
+RequestProfile together with the query log. The response carries X-Profile-Id, and
+`python manage.py show_profiles` prints stored profiles.
+"""
+
+import cProfile
+import hmac
+import logging
+import pstats
+import random
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib import auth
+
+from game.query_budget import QueryCounter
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "HTTP_X_PROFILE"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def profiled(view):
+    """Allow requests to a function-based view to be profiled."""
+    view.profile_requests = True
+    return view
+
+
+def is_profilable(view_func) -> bool:
+    view_class = getattr(view_func, "view_class", None)
+    return bool(
+        getattr(view_class, "profile_requests", False)
+        or getattr(view_func, "profile_requests", False)
+    )
+
+
+def _session_user(request):
+    """The logged-in user for requests that skipped the auth middleware (the fast lane)."""
+    if not hasattr(request, "session"):
+        engine = import_module(settings.SESSION_ENGINE)
+        request.session = engine.SessionStore(request.COOKIES.get(settings.SESSION_COOKIE_NAME))
+    return auth.get_user(request)
+
+
+def profile_trigger(request) -> str | None:
+    """Why this request should be profiled ("header" or "sample"), or None."""
+    header = request.META.get(PROFILE_HEADER)
+    if header:
+        token = getattr(settings, "PROFILING_TOKEN", "")
+        # compared as bytes: compare_digest rejects str with non-ASCII characters
+        if token and hmac.compare_digest(header.encode(), token.encode()):
+            return "header"
+        # staff are logged in; without a session cookie, skip the session and user lookups
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            user = getattr(request, "user", None) or _session_user(request)
+            if user.is_active and user.is_staff:
+                return "header"
+
+    rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+    if rate > 0 and random.random() < rate:
+        return "sample"
+    return None
+
+
+class TimedQueryLog(QueryCounter):
+    """QueryCounter that also records how long each statement took."""
+
+    def __init__(self):
+        super().__init__()
+        self.log: list[dict] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(sql)
+            self.log.append({"sql": sql, "ms": round((time.perf_counter() - start) * 1000, 3)})
+
+
+def top_functions(profiler: cProfile.Profile, limit: int) -> list[dict]:
+    """The `limit` functions with the highest cumulative time."""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "ncalls": nc if nc == cc else f"{nc}/{cc}",
+                "tottime_ms": round(tt * 1000, 3),
+                "cumtime_ms": round(ct * 1000, 3),
+            }
+        )
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    return rows[:limit]
+
+
+class ProfilingMiddleware:
+    """
+    Runs opted-in views under the profiler. Keep it last in MIDDLEWARE so request.user is
+    available and the profile covers only the view.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not is_profilable(view_func):
+            return None
+        trigger = profile_trigger(request)
+        if trigger is None:
+            return None
+
+        profiler = cProfile.Profile()
+        query_log = TimedQueryLog()
+        start = time.perf_counter()
+        with query_log:
+            profiler.enable()
+            try:
+                response = view_func(request, *view_args, **view_kwargs)
+            finally:
+                profiler.disable()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        profile = self._store(request, response, trigger, profiler, query_log, duration_ms)
+        if profile is not None:
+            response[PROFILE_ID_HEADER] = str(profile.id)
+        return response
+
+    def _store(self, request, response, trigger, profiler, query_log, duration_ms):
+        from game.models import RequestProfile
+
+        try:
+            return RequestProfile.objects.create(
+                method=request.method,
+                path=request.path[:255],
+                view_name=request.resolver_match.view_name if request.resolver_match else "",
+                status_code=response.status_code,
+                trigger=trigger,
+                duration_ms=round(duration_ms, 3),
+                query_count=query_log.count,
+                stats=top_functions(profiler, getattr(settings, "PROFILING_TOP_N", 30)),
+                queries=query_log.log,
+            )
+        except Exception:
+            # profiling must never break the request it observed
+            logger.exception("Failed to store request profile path=%s", request.path)
+            return None
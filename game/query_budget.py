@@ -0,0 +1,90 @@
+"""
+Per-endpoint query budgets.
+
+Views declare how many SQL queries one request may run: a `query_budget` attribute on
+class-based views, or the @query_budget(n) decorator on function views. The middleware
+logs requests that go over budget (enable it in dev/staging with DJANGO_QUERY_BUDGETS=1),
+and the test suite asserts exact counts per endpoint so new queries fail CI.
+Savepoint statements are not counted: they depend on transaction nesting, not on the view.
+"""
+
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def query_budget(limit: int):
+    """Declare the query budget of a function-based view."""
+
+    def decorator(view):
+        view.query_budget = limit
+        return view
+
+    return decorator
+
+
+def get_view_budget(view_func) -> int | None:
+    view_class = getattr(view_func, "view_class", None)
+    budget = getattr(view_class, "query_budget", None)
+    if budget is None:
+        budget = getattr(view_func, "query_budget", None)
+    return budget
+
+
+class QueryCounter:
+    """Count SQL statements run on every configured database while the context is active."""
+
+    def __init__(self):
+        self.queries: list[str] = []
+        self._stack = ExitStack()
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(_SAVEPOINT_PREFIXES):
+            self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def __enter__(self):
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._stack.__exit__(*exc_info)
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_BUDGETS_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request._query_counter = QueryCounter()
+        with request._query_counter:
+            response = self.get_response(request)
+
+        budget = getattr(request, "_query_budget", None)
+        count = request._query_counter.count
+        if budget is not None and count > budget:
+            logger.warning(
+                "Query budget exceeded path=%s view=%s queries=%s budget=%s",
+                request.path,
+                request.resolver_match.view_name if request.resolver_match else None,
+                count,
+                budget,
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._query_budget = get_view_budget(view_func)
@@ -1,42 +1,61 @@
 import random
+from datetime import date
 
-from game.models import LeaderboardEntry, Prompt
+from game.models import DictionaryVersion, LeaderboardEntry, Prompt
+from game.services.languages import DEFAULT_LANGUAGE
+from game.services.prompt_catalog import get_prompt_catalog
 
 
-def get_random_prompts(limit: int) -> list[Prompt]:
-    prompt_ids = list(Prompt.objects.values_list("id", flat=True))
-    if len(prompt_ids) < limit:
+def get_random_prompts(limit: int, language: str = DEFAULT_LANGUAGE) -> list[Prompt]:
+    # shared, process-wide instances: read them, never modify them
+    prompts = get_prompt_catalog(language)
+    if len(prompts) < limit:
         return []
+    return random.sample(prompts, limit)
 
-    selected_ids = random.sample(prompt_ids, limit)
-    prompts_by_id = {prompt.id: prompt for prompt in Prompt.objects.filter(id__in=selected_ids)}
-    return [prompts_by_id[prompt_id] for prompt_id in selected_ids]
 
+def get_dictionary_version(language: str = DEFAULT_LANGUAGE) -> int:
+    """Id of the language's latest DictionaryVersion, or 0 before its first import."""
+    return (
+        DictionaryVersion.objects.filter(language=language).values_list("id", flat=True).first()
+        or 0
+    )
 
-def leaderboard_queryset():
-    return LeaderboardEntry.objects.order_by("-score", "created_at")
 
+def leaderboard_queryset(challenge_id: int | None = None):
+    """Entries of one board: the main leaderboard, or a daily challenge's when given its id."""
+    return LeaderboardEntry.objects.filter(challenge_id=challenge_id).order_by(
+        "-score", "created_at"
+    )
 
-def get_leaderboard_entries(limit: int = 100):
-    return leaderboard_queryset()[:limit]
 
+def get_leaderboard_entries(limit: int = 100, challenge_id: int | None = None):
+    return leaderboard_queryset(challenge_id)[:limit]
 
-def get_top_100_threshold() -> int | None:
-    scores = list(get_leaderboard_entries(100).values_list("score", flat=True))
+
+def get_daily_leaderboard_entries(day: date, language: str, limit: int = 100):
+    """A daily challenge's board, looked up by its date and language in the same query."""
+    return LeaderboardEntry.objects.filter(
+        challenge__date=day, challenge__language=language
+    ).order_by("-score", "created_at")[:limit]
+
+
+def get_top_100_threshold(challenge_id: int | None = None) -> int | None:
+    scores = list(get_leaderboard_entries(100, challenge_id).values_list("score", flat=True))
     if len(scores) < 100:
         return None
     return scores[-1]
 
 
-def get_top_100_candidate(score: int) -> tuple[bool, int | None]:
-    threshold = get_top_100_threshold()
+def get_top_100_candidate(score: int, challenge_id: int | None = None) -> tuple[bool, int | None]:
+    threshold = get_top_100_threshold(challenge_id)
     if threshold is None:
         return True, None
     return score >= threshold, threshold
 
 
-def get_rank_for_entry(entry_id: int) -> int | None:
-    ranked_ids = list(leaderboard_queryset().values_list("id", flat=True))
+def get_rank_for_entry(entry_id: int, challenge_id: int | None = None) -> int | None:
+    ranked_ids = list(leaderboard_queryset(challenge_id).values_list("id", flat=True))
     for idx, current_id in enumerate(ranked_ids, start=1):
         if current_id == entry_id:
             return idx
@@ -0,0 +1,116 @@
+"""
+Daily challenge: every player of a day and language gets the same 21 prompts.
+
+The prompt set is chosen once per (UTC date, language) and stored in DailyChallenge. That
+happens on the first request of the day, or earlier with
+`python manage.py create_daily_challenges`. Challenge sessions reference it instead of
+copying the prompts, so starting one is a single small INSERT. The choice is seeded by the
+date and language. Concurrent first requests therefore pick the same prompts, and the
+unique constraint on (date, language) lets exactly one insert win.
+
+Challenges never change once created, so each process keeps the recent ones in memory.
+"""
+
+import random
+import threading
+from datetime import date, timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from game.models import DailyChallenge, Session
+from game.services.languages import validate_language
+from game.services.prompt_catalog import get_prompt_catalog
+
+CHALLENGE_PROMPTS = 21
+
+# (date, language) -> challenge, and id -> challenge, for the last couple of days
+_by_day: dict[tuple[date, str], DailyChallenge] = {}
+_by_id: dict[int, DailyChallenge] = {}
+_lock = threading.Lock()
+
+
+class ChallengeUnavailableError(Exception):
+    pass
+
+
+def challenge_date() -> date:
+    return timezone.now().date()  # USE_TZ with TIME_ZONE = "UTC"
+
+
+def _remember(challenge: DailyChallenge) -> DailyChallenge:
+    with _lock:
+        # drop challenges from before yesterday; their sessions have long expired
+        oldest = challenge.date - timedelta(days=1)
+        for key in [key for key in _by_day if key[0] < oldest]:
+            del _by_id[_by_day.pop(key).id]
+        _by_day[(challenge.date, challenge.language)] = challenge
+        _by_id[challenge.id] = challenge
+    return challenge
+
+
+def load_daily_challenges() -> int:
+    """Cache today's existing challenges (warmup); returns how many there were."""
+    challenges = list(DailyChallenge.objects.filter(date=challenge_date()))
+    for challenge in challenges:
+        _remember(challenge)
+    return len(challenges)
+
+
+def forget_daily_challenges() -> None:
+    with _lock:
+        _by_day.clear()
+        _by_id.clear()
+
+
+def choose_prompts(day: date, language: str) -> list[dict]:
+    """The day's prompt snapshots: a sample of the catalog seeded by date and language."""
+    catalog = get_prompt_catalog(language)
+    if len(catalog) < CHALLENGE_PROMPTS:
+        raise ChallengeUnavailableError("Not enough prompts for a daily challenge.")
+    rng = random.Random(f"{day.isoformat()}:{language}")
+    return [
+        {
+            "prompt_id": prompt.id,
+            "description": prompt.description,
+            "rule": prompt.rule,
+            "valid_words_count": prompt.valid_words_count,
+        }
+        for prompt in rng.sample(catalog, CHALLENGE_PROMPTS)
+    ]
+
+
+def get_daily_challenge(language: str, day: date | None = None) -> DailyChallenge:
+    """The challenge of `day` (default today), created if this is its first request."""
+    validate_language(language)
+    day = day or challenge_date()
+    challenge = _by_day.get((day, language))
+    if challenge is not None:
+        return challenge
+
+    challenge = DailyChallenge.objects.filter(date=day, language=language).first()
+    if challenge is None:
+        prompts = choose_prompts(day, language)
+        try:
+            with transaction.atomic():
+                challenge = DailyChallenge.objects.create(
+                    date=day, language=language, prompts=prompts
+                )
+        except IntegrityError:
+            # another process created it first
+            challenge = DailyChallenge.objects.get(date=day, language=language)
+    return _remember(challenge)
+
+
+def get_challenge_by_id(challenge_id: int) -> DailyChallenge:
+    challenge = _by_id.get(challenge_id)
+    if challenge is None:
+        challenge = _remember(DailyChallenge.objects.get(id=challenge_id))
+    return challenge
+
+
+def session_prompts(session: Session) -> list[dict]:
+    """The session's prompt snapshots: its own, or its daily challenge's."""
+    if session.challenge_id is None:
+        return session.prompts
+    return get_challenge_by_id(session.challenge_id).prompts
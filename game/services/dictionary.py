@@ -0,0 +1,248 @@
+import logging
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from django.apps.registry import Apps
+from django.db import connection, models, transaction
+
+from game.models import DictionaryVersion, Word
+from game.services.languages import DEFAULT_LANGUAGE
+from game.services.wordlist import batched
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "game_word_import_staging"
+# arbitrary application-wide key for pg_advisory_lock, shared by all dictionary writers
+DICTIONARY_LOCK_KEY = 21_000_002
+
+
+@contextmanager
+def _dictionary_lock() -> Iterator[None]:
+    """
+    Serialize dictionary writers. A sync builds a shadow table and renames it over the live
+    one, so a plain import writing to the live table meanwhile would have its rows renamed
+    away; it waits for the sync instead. The sync spans several transactions, so Postgres
+    gets a session-level advisory lock. SQLite allows a single writer at a time, and runs
+    one import at a time in practice, so nothing is taken there.
+    """
+    if connection.vendor != "postgresql":
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [DICTIONARY_LOCK_KEY])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [DICTIONARY_LOCK_KEY])
+
+
+def _import_with_copy(
+    words: Iterable[str], *, language: str, batch_size: int, model: type[models.Model] = Word
+) -> dict[str, int]:
+    """
+    Postgres path: stream words through COPY into a temporary (unlogged, session-private)
+    staging table, then merge into Word with one INSERT ... ON CONFLICT DO NOTHING RETURNING.
+    """
+    qn = connection.ops.quote_name
+    word_table = qn(model._meta.db_table)
+    staging = qn(STAGING_TABLE)
+    read = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"CREATE TEMPORARY TABLE {staging} (word text NOT NULL) ON COMMIT DROP")
+        with cursor.copy(f"COPY {staging} (word) FROM STDIN") as copy:
+            for batch in batched(words, batch_size):
+                for word in batch:
+                    copy.write_row((word,))
+                read += len(batch)
+                logger.debug("Staged %d words...", read)
+        cursor.execute(
+            f"""
+            WITH inserted AS (
+                INSERT INTO {word_table} (language, word)
+                SELECT DISTINCT %s, word FROM {staging}
+                ON CONFLICT (language, word) DO NOTHING
+                RETURNING 1
+            )
+            SELECT count(*) FROM inserted
+            """,
+            [language],
+        )
+        (inserted,) = cursor.fetchone()
+    return {"read": read, "inserted": inserted, "duplicates": read - inserted}
+
+
+def _import_with_bulk_create(
+    words: Iterable[str], *, language: str, batch_size: int, model: type[models.Model] = Word
+) -> dict[str, int]:
+    """
+    Portable fallback (SQLite): batched bulk_create with ignore_conflicts.
+    Conflicts are invisible per row, so the exact inserted count comes from the table size.
+    """
+    read = 0
+    with transaction.atomic():
+        before = model.objects.filter(language=language).count()
+        for batch in batched(words, batch_size):
+            read += len(batch)
+            model.objects.bulk_create(
+                [model(language=language, word=word) for word in dict.fromkeys(batch)],
+                ignore_conflicts=True,
+            )
+            logger.debug("Processed %d words...", read)
+        inserted = model.objects.filter(language=language).count() - before
+    return {"read": read, "inserted": inserted, "duplicates": read - inserted}
+
+
+def _load_words(
+    words: Iterable[str], *, language: str, batch_size: int, model: type[models.Model] = Word
+) -> dict[str, int]:
+    loader = _import_with_copy if connection.vendor == "postgresql" else _import_with_bulk_create
+    return loader(words, language=language, batch_size=batch_size, model=model)
+
+
+def _bump_version(language: str, *, is_full_sync: bool = False) -> DictionaryVersion:
+    return DictionaryVersion.objects.create(
+        language=language,
+        word_count=Word.objects.filter(language=language).count(),
+        is_full_sync=is_full_sync,
+    )
+
+
+def import_words(
+    words: Iterable[str], *, language: str = DEFAULT_LANGUAGE, batch_size: int = 5000
+) -> dict[str, int]:
+    """
+    Insert normalized words into the `language` dictionary, skipping ones already present.
+    Returns exact counts: words read, newly inserted, and duplicates (already in the
+    dictionary or repeated in the input). Bumps the language's dictionary version if
+    anything changed. Waits for a sync in progress to finish first.
+    """
+    with _dictionary_lock():
+        stats = _load_words(words, language=language, batch_size=batch_size)
+        if stats["inserted"]:
+            stats["version"] = _bump_version(language).id
+    return stats
+
+
+def preview_import(
+    words: Iterable[str], *, language: str = DEFAULT_LANGUAGE, batch_size: int = 5000
+) -> dict[str, int]:
+    """
+    The counts import_words would report, without writing: words read, distinct words,
+    words new to the `language` dictionary, and duplicates. Distinct words are tracked in
+    memory, so this holds the whole deduplicated input.
+    """
+    read = inserted = 0
+    seen: set[str] = set()
+    for batch in batched(words, batch_size):
+        read += len(batch)
+        fresh = [word for word in dict.fromkeys(batch) if word not in seen]
+        seen.update(fresh)
+        existing = Word.objects.filter(language=language, word__in=fresh).count()
+        inserted += len(fresh) - existing
+    return {"read": read, "unique": len(seen), "inserted": inserted, "duplicates": read - inserted}
+
+
+def _word_table_model(db_table: str, *, name_suffix: str) -> type[models.Model]:
+    """
+    An unregistered copy of Word bound to another table, for schema operations on
+    shadow and retired dictionary tables. Index and constraint names get `name_suffix`
+    so they never collide with the live table's.
+    """
+
+    def renamed(item):
+        item = item.clone()
+        item.name = f"{item.name}_{name_suffix}"
+        return item
+
+    meta = type(
+        "Meta",
+        (),
+        {
+            "app_label": "game",
+            "db_table": db_table,
+            "apps": Apps(),
+            "constraints": [renamed(c) for c in Word._meta.constraints],
+            "indexes": [renamed(i) for i in Word._meta.indexes],
+        },
+    )
+    attrs = {"__module__": __name__, "Meta": meta}
+    for field in Word._meta.local_fields:
+        attrs[field.name] = field.clone()
+    return type(f"Word_{db_table}", (models.Model,), attrs)
+
+
+def _restore_canonical_names(editor, shadow: type[models.Model]) -> None:
+    """After the swap, give the live table's indexes and constraints their model names back."""
+    for shadow_index, index in zip(shadow._meta.indexes, Word._meta.indexes):
+        editor.rename_index(Word, shadow_index, index)
+    if connection.vendor == "postgresql":
+        # SQLite keeps unique constraints inline in the table definition, unnamed on disk
+        table = editor.quote_name(Word._meta.db_table)
+        for shadow_constraint, constraint in zip(shadow._meta.constraints, Word._meta.constraints):
+            editor.execute(
+                f"ALTER TABLE {table} RENAME CONSTRAINT "
+                f"{editor.quote_name(shadow_constraint.name)} TO {editor.quote_name(constraint.name)}"
+            )
+
+
+def sync_words(
+    words: Iterable[str], *, language: str = DEFAULT_LANGUAGE, batch_size: int = 5000
+) -> dict[str, int]:
+    """
+    Replace the whole `language` dictionary with `words`; other languages are kept as is.
+    The new dictionary is built and indexed in a shadow table while the live one keeps
+    serving games, then swapped in with table renames inside a single transaction, so
+    readers see either the old or the new dictionary and never a partial import.
+    Words missing from the input are gone afterwards.
+
+    Must run outside transaction.atomic(): SQLite cannot change schema inside one.
+    Plain imports wait until the sync is done (see _dictionary_lock).
+    """
+    with _dictionary_lock():
+        return _sync_words(words, language=language, batch_size=batch_size)
+
+
+def _sync_words(words: Iterable[str], *, language: str, batch_size: int) -> dict[str, int]:
+    live_table = Word._meta.db_table
+    suffix = uuid.uuid4().hex[:8]
+    shadow = _word_table_model(f"{live_table}_shadow_{suffix}", name_suffix=f"s{suffix}")
+    retired = _word_table_model(f"{live_table}_retired_{suffix}", name_suffix=f"r{suffix}")
+
+    with connection.schema_editor() as editor:
+        editor.create_model(shadow)
+    try:
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(shadow._meta.db_table)} (language, word) "
+                f"SELECT language, word FROM {qn(live_table)} WHERE language <> %s",
+                [language],
+            )
+        stats = _load_words(words, language=language, batch_size=batch_size, model=shadow)
+        with connection.schema_editor() as editor:
+            previous_count = Word.objects.filter(language=language).count()
+            editor.alter_db_table(Word, live_table, retired._meta.db_table)
+            editor.alter_db_table(shadow, shadow._meta.db_table, live_table)
+            editor.delete_model(retired)
+            _restore_canonical_names(editor, shadow)
+            version = _bump_version(language, is_full_sync=True)
+    except BaseException:
+        with connection.schema_editor() as editor:
+            editor.execute(f"DROP TABLE IF EXISTS {editor.quote_name(shadow._meta.db_table)}")
+        raise
+
+    logger.info(
+        "Dictionary synced version=%s language=%s words=%s previous=%s",
+        version.id,
+        language,
+        version.word_count,
+        previous_count,
+    )
+    return {
+        "read": stats["read"],
+        "words": version.word_count,
+        "previous": previous_count,
+        "version": version.id,
+    }
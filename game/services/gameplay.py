@@ -1,15 +1,23 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.utils import timezone
 
 from game.models import Session, Word
 from game.selectors import get_top_100_candidate
-from game.services.scoring import calculate_time_bonus, calculate_word_points
-from game.services.validation import matches_rule, normalize_word
+from game.services.daily_challenge import session_prompts
+from game.services.hints import get_word_list, pick_hint
+from game.services.metrics import PhaseTimer
+from game.services.prompt_stats import prompt_stats
+from game.services.scoring import HINT_PENALTY, calculate_time_bonus, calculate_word_points
+from game.services.validation import matches_rule, normalize_word_cached
 
 logger = logging.getLogger(__name__)
 
+# an attempt that read the clock just before expiry may still be committing this long
+# after expires_at; batch jobs leave a session alone until its grace has passed too
+EXPIRY_GRACE = timedelta(minutes=1)
+
 
 class SessionExpiredError(Exception):
     pass
@@ -19,15 +27,20 @@ class SessionNotActiveError(Exception):
     pass
 
 
+class NoHintAvailableError(Exception):
+    pass
+
+
 def get_current_prompt_payload(session: Session) -> dict | None:
     if session.status != "active":
         return None
 
+    prompts = session_prompts(session)
     idx = session.current_ordinal - 1
-    if idx < 0 or idx >= len(session.prompts):
+    if idx < 0 or idx >= len(prompts):
         return None
 
-    current = session.prompts[idx]
+    current = prompts[idx]
     return {
         "ordinal": session.current_ordinal,
         "prompt_id": current["prompt_id"],
@@ -51,8 +64,12 @@ def _make_response(
     just_scored: dict | None,
     is_finished: bool,
     finished_reason: str | None,
+    timer: PhaseTimer,
 ) -> dict:
-    is_candidate, threshold = get_top_100_candidate(session.total_score)
+    with timer.phase("leaderboard"):
+        is_candidate, threshold = get_top_100_candidate(
+            session.total_score, challenge_id=session.challenge_id
+        )
     time_left_ms = session.time_left_ms
     if time_left_ms is None and session.status == "active":
         time_left_ms = _get_time_left_ms(expires_at=session.expires_at, now=now)
@@ -76,9 +93,31 @@ def _make_response(
     }
 
 
-def process_attempt(*, session: Session, raw_word: str, now: datetime | None = None) -> dict:
-    now = now or timezone.now()
+def _reject(
+    *, session: Session, prompt_id: int, error_code: str, now: datetime, timer: PhaseTimer
+) -> dict:
+    prompt_stats.record_rejection(prompt_id, error_code)
+    return _make_response(
+        session=session,
+        now=now,
+        is_valid=False,
+        error_code=error_code,
+        just_scored=None,
+        is_finished=False,
+        finished_reason=None,
+        timer=timer,
+    )
+
+
+def _prompt_shown_at(session: Session) -> datetime:
+    """When the current prompt appeared: at the start, or when the previous one was solved."""
+    if session.answers:
+        return datetime.fromisoformat(session.answers[-1]["created_at"])
+    return session.started_at
 
+
+def _require_current_prompt(session: Session, now: datetime) -> dict:
+    """The prompt the session is on; expires the session if its time is up."""
     if session.status == "submitted":
         raise SessionNotActiveError("Session already submitted.")
     if session.status == "expired":
@@ -92,53 +131,106 @@ def process_attempt(*, session: Session, raw_word: str, now: datetime | None = N
     prompt_payload = get_current_prompt_payload(session)
     if prompt_payload is None:
         raise SessionNotActiveError("No active prompt available for this session.")
+    return prompt_payload
+
+
+def take_hint(*, session: Session, now: datetime | None = None) -> dict:
+    """
+    Reveal a valid word for the current prompt that the session has neither used nor been
+    shown by an earlier hint, so every penalty buys a new word.
+    """
+    now = now or timezone.now()
+    prompt_payload = _require_current_prompt(session, now)
+
+    used_words = {answer.get("normalized_word") for answer in session.answers}
+    used_words.update(session.hinted_words)
+    word = pick_hint(get_word_list(prompt_payload["prompt_id"]), used_words)
+    if word is None:
+        raise NoHintAvailableError("No hint available for this prompt.")
 
-    normalized_word = normalize_word(raw_word or "")
+    session.hints_used += 1
+    session.total_score -= HINT_PENALTY
+    session.hinted_words = [*session.hinted_words, word]
+    session.save(update_fields=["hints_used", "total_score", "hinted_words"])
+    logger.info(
+        "Hint taken session=%s ordinal=%s hints_used=%s",
+        session.id,
+        session.current_ordinal,
+        session.hints_used,
+    )
+    return {
+        "session_id": str(session.id),
+        "ordinal": session.current_ordinal,
+        "prompt_id": prompt_payload["prompt_id"],
+        "word": word,
+        "penalty": HINT_PENALTY,
+        "hints_used": session.hints_used,
+        "total_score": session.total_score,
+    }
+
+
+def process_attempt(
+    *,
+    session: Session,
+    raw_word: str,
+    now: datetime | None = None,
+    timer: PhaseTimer | None = None,
+) -> dict:
+    now = now or timezone.now()
+    timer = timer or PhaseTimer()
+
+    prompt_payload = _require_current_prompt(session, now)
+
+    normalized_word = normalize_word_cached(raw_word or "")
     if not normalized_word:
-        return _make_response(
+        return _reject(
             session=session,
-            now=now,
-            is_valid=False,
+            prompt_id=prompt_payload["prompt_id"],
             error_code="empty",
-            just_scored=None,
-            is_finished=False,
-            finished_reason=None,
+            now=now,
+            timer=timer,
         )
 
     used_words = {answer.get("normalized_word") for answer in session.answers}
     if normalized_word in used_words:
-        return _make_response(
+        return _reject(
             session=session,
-            now=now,
-            is_valid=False,
+            prompt_id=prompt_payload["prompt_id"],
             error_code="duplicate",
-            just_scored=None,
-            is_finished=False,
-            finished_reason=None,
+            now=now,
+            timer=timer,
         )
 
-    if not Word.objects.filter(word=normalized_word).exists():
-        return _make_response(
+    with timer.phase("dictionary"):
+        in_dictionary = Word.objects.filter(
+            language=session.language, word=normalized_word
+        ).exists()
+    if not in_dictionary:
+        return _reject(
             session=session,
-            now=now,
-            is_valid=False,
+            prompt_id=prompt_payload["prompt_id"],
             error_code="not_in_dictionary",
-            just_scored=None,
-            is_finished=False,
-            finished_reason=None,
+            now=now,
+            timer=timer,
         )
 
-    if not matches_rule(normalized_word, prompt_payload["rule"]):
-        return _make_response(
+    with timer.phase("rule"):
+        rule_matched = matches_rule(
+            normalized_word, prompt_payload["rule"], language=session.language
+        )
+    if not rule_matched:
+        return _reject(
             session=session,
-            now=now,
-            is_valid=False,
+            prompt_id=prompt_payload["prompt_id"],
             error_code="rule_mismatch",
-            just_scored=None,
-            is_finished=False,
-            finished_reason=None,
+            now=now,
+            timer=timer,
         )
 
+    prompt_stats.record_solved(
+        prompt_payload["prompt_id"],
+        int((now - _prompt_shown_at(session)).total_seconds() * 1000),
+    )
     points = calculate_word_points(ordinal=session.current_ordinal, word_length=len(normalized_word))
     answer_row = {
         "ordinal": session.current_ordinal,
@@ -166,17 +258,22 @@ def process_attempt(*, session: Session, raw_word: str, now: datetime | None = N
         session.time_left_ms = time_left_ms
         session.submitted_at = now
         session.status = "submitted"
+    else:
+        prompt_stats.record_shown(
+            session_prompts(session)[session.current_ordinal - 1]["prompt_id"]
+        )
 
-    session.save(
-        update_fields=[
-            "answers",
-            "total_score",
-            "current_ordinal",
-            "status",
-            "time_left_ms",
-            "submitted_at",
-        ]
-    )
+    with timer.phase("save"):
+        session.save(
+            update_fields=[
+                "answers",
+                "total_score",
+                "current_ordinal",
+                "status",
+                "time_left_ms",
+                "submitted_at",
+            ]
+        )
     logger.info(
         "Attempt accepted session=%s ordinal=%s score=%s status=%s",
         session.id,
@@ -192,4 +289,5 @@ def process_attempt(*, session: Session, raw_word: str, now: datetime | None = N
         just_scored=points,
         is_finished=is_finished,
         finished_reason=finished_reason,
+        timer=timer,
     )
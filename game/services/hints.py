@@ -0,0 +1,100 @@
+"""
+Hints: reveal an unused valid word for the session's current prompt.
+
+Finding a matching word means a LIKE scan over Word, so it is done ahead of time.
+`recompute_prompt_valid_words_count` stores a random sample of up to HINT_WORDS words per
+prompt in PromptWordList, as one newline-separated text column. A hint reads that list, at
+most once per PROMPT_CATALOG_TTL seconds per process, and picks a random word the session
+has neither used nor been shown by an earlier hint (Session.hinted_words). A session uses
+few of the words, so a few random picks almost always find one. Each hint costs
+scoring.HINT_PENALTY points.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from django.conf import settings
+
+from game.models import Prompt, PromptWordList, Word
+from game.services.validation import rule_to_q
+
+# words stored per prompt; plenty to always find one a session has not used
+HINT_WORDS = 200
+# prompts whose word lists a process keeps, least recently used evicted first
+HINT_CACHE_SIZE = 4096
+_RANDOM_PICKS = 8
+
+# prompt id -> (expires at, words)
+_word_lists: OrderedDict[int, tuple[float, tuple[str, ...]]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def build_word_list(prompt: Prompt) -> list[str]:
+    """
+    A random sample of HINT_WORDS of the prompt's valid words, in dictionary order. Sampled
+    rather than the first ones alphabetically, so hints come from the whole word list.
+    """
+    q = rule_to_q(prompt.rule or {}, language=prompt.language)
+    sample = (
+        Word.objects.filter(q, language=prompt.language)
+        .order_by("?")
+        .values_list("word", flat=True)[:HINT_WORDS]
+    )
+    return sorted(sample)
+
+
+def save_word_lists(word_lists: Iterable[tuple[int, list[str]]], *, version: int) -> int:
+    """Store (prompt_id, words) pairs, replacing existing lists. Returns how many."""
+    rows = [
+        PromptWordList(prompt_id=prompt_id, words="\n".join(words), dictionary_version=version)
+        for prompt_id, words in word_lists
+    ]
+    PromptWordList.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["prompt"],
+        update_fields=["words", "dictionary_version", "updated_at"],
+    )
+    invalidate_word_lists()
+    return len(rows)
+
+
+def get_word_list(prompt_id: int) -> tuple[str, ...]:
+    now = time.monotonic()
+    with _lock:
+        entry = _word_lists.get(prompt_id)
+        if entry is not None and now < entry[0]:
+            _word_lists.move_to_end(prompt_id)
+            return entry[1]
+
+    text = (
+        PromptWordList.objects.filter(prompt_id=prompt_id).values_list("words", flat=True).first()
+    )
+    words = tuple(text.split("\n")) if text else ()
+    with _lock:
+        _word_lists[prompt_id] = (now + settings.PROMPT_CATALOG_TTL, words)
+        _word_lists.move_to_end(prompt_id)
+        while len(_word_lists) > HINT_CACHE_SIZE:
+            _word_lists.popitem(last=False)
+    return words
+
+
+def invalidate_word_lists() -> None:
+    with _lock:
+        _word_lists.clear()
+
+
+def pick_hint(words: tuple[str, ...], used: set[str]) -> str | None:
+    """A random word not in `used`, or None when every word is used."""
+    if not words:
+        return None
+    for _ in range(_RANDOM_PICKS):
+        word = random.choice(words)
+        if word not in used:
+            return word
+    unused = [word for word in words if word not in used]
+    return random.choice(unused) if unused else None
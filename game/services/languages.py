@@ -0,0 +1,60 @@
+from functools import lru_cache
+
+DEFAULT_LANGUAGE = "lv"
+
+# per-language letters with diacritics (lowercase) and prompt description templates
+LANGUAGES = {
+    "lv": {
+        "name": "Latvian",
+        "diacritics": "āčēģīķļņšūž",
+        "descriptions": {
+            "starts_with": "Vārdi, kas sākas ar '{value}'",
+            "ends_with": "Vārdi, kas beidzas ar '{value}'",
+            "contains": "Vārdi, kas satur '{value}'",
+            "contains_double": "Vārdi ar dubultu '{value}'",
+        },
+    },
+    "lt": {
+        "name": "Lithuanian",
+        "diacritics": "ąčęėįšųūž",
+        "descriptions": {
+            "starts_with": "Žodžiai, prasidedantys '{value}'",
+            "ends_with": "Žodžiai, kurie baigiasi '{value}'",
+            "contains": "Žodžiai, kuriuose yra '{value}'",
+            "contains_double": "Žodžiai su dvigubu '{value}'",
+        },
+    },
+    "et": {
+        "name": "Estonian",
+        "diacritics": "äöõüšž",
+        "descriptions": {
+            "starts_with": "Sõnad, mis algavad '{value}'",
+            "ends_with": "Sõnad, mis lõpevad '{value}'",
+            "contains": "Sõnad, mis sisaldavad '{value}'",
+            "contains_double": "Sõnad topelt '{value}'",
+        },
+    },
+}
+
+LANGUAGE_CHOICES = [(code, config["name"]) for code, config in LANGUAGES.items()]
+
+
+class UnsupportedLanguageError(ValueError):
+    pass
+
+
+def validate_language(language: str) -> str:
+    # request bodies are arbitrary JSON; lists and dicts are not hashable
+    if not isinstance(language, str) or language not in LANGUAGES:
+        raise UnsupportedLanguageError(f"Unsupported language: {language!r}")
+    return language
+
+
+@lru_cache(maxsize=None)
+def get_diacritics(language: str) -> frozenset[str]:
+    """Lowercase diacritic letters of `language`, built once per process."""
+    return frozenset(LANGUAGES[validate_language(language)]["diacritics"])
+
+
+def get_description_templates(language: str) -> dict[str, str]:
+    return LANGUAGES[validate_language(language)]["descriptions"]
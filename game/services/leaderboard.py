@@ -1,10 +1,18 @@
 import logging
+from collections.abc import Sequence
+
+from django.db import connection, transaction
 
 from game.models import LeaderboardEntry, Session
-from game.selectors import get_rank_for_entry, get_top_100_candidate, leaderboard_queryset
+from game.selectors import get_top_100_threshold, leaderboard_queryset
+from game.services.leaderboard_stream import broadcast_entry, broadcast_removed
 
 logger = logging.getLogger(__name__)
 
+LEADERBOARD_SIZE = 100
+# arbitrary application-wide key for pg_advisory_xact_lock, shared by all leaderboard writers
+LEADERBOARD_LOCK_KEY = 21_000_001
+
 
 class PublishError(Exception):
     pass
@@ -26,46 +34,130 @@ class NotTop100Error(PublishError):
     pass
 
 
-def _prune_leaderboard(max_size: int = 100) -> None:
-    ranked_ids = list(leaderboard_queryset().values_list("id", flat=True))
-    if len(ranked_ids) <= max_size:
+def _acquire_leaderboard_lock() -> None:
+    """
+    Serialize leaderboard writers until the surrounding transaction ends.
+    Postgres gets a transaction-scoped advisory lock so concurrent publishes queue up
+    instead of interleaving inserts and deletes on LeaderboardEntry (lock waits, deadlocks).
+    SQLite already allows a single writer at a time, so nothing is needed there.
+    """
+    if connection.vendor != "postgresql":
         return
-
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [LEADERBOARD_LOCK_KEY])
+
+
+def _prune_and_rank(
+    max_size: int = LEADERBOARD_SIZE, challenge_id: int | None = None
+) -> tuple[dict[int, int], list[int]]:
+    """
+    Trim a leaderboard (the main one, or a daily challenge's) to `max_size` entries.
+    Returns {entry_id: rank} for the survivors and the ids of the pruned entries.
+    Reads the ranked ids once and uses them for both the prune and the ranks.
+    """
+    ranked_ids = list(leaderboard_queryset(challenge_id).values_list("id", flat=True))
     stale_ids = ranked_ids[max_size:]
-    LeaderboardEntry.objects.filter(id__in=stale_ids).delete()
+    if stale_ids:
+        LeaderboardEntry.objects.filter(id__in=stale_ids).delete()
+    ranks = {entry_id: rank for rank, entry_id in enumerate(ranked_ids[:max_size], start=1)}
+    return ranks, stale_ids
 
 
-def publish_session(*, session: Session, player_name: str) -> tuple[LeaderboardEntry, int]:
+def _validate_publish(session: Session, player_name: str) -> str:
     if session.status != "submitted":
         raise SessionNotSubmittedError("Session is not submitted.")
 
     normalized_name = (player_name or "").strip()
     if not 1 <= len(normalized_name) <= 64:
         raise InvalidPlayerNameError("Player name must be 1 to 64 characters.")
+    return normalized_name
+
+
+def publish_sessions(
+    requests: Sequence[tuple[Session, str]],
+) -> list[tuple[LeaderboardEntry, int] | PublishError]:
+    """
+    Publish a batch of (session, player_name) requests under one leaderboard lock.
+    Daily challenge sessions go to their challenge's board. The batch shares one threshold
+    read, one prune and one rank computation per board it touches.
+    Returns one result per request, in order: either (entry, rank) or the PublishError
+    that rejected it.
+    """
+    results: list[tuple[LeaderboardEntry, int] | PublishError | None] = [None] * len(requests)
+    with transaction.atomic():
+        _acquire_leaderboard_lock()
+
+        published_ids = set(
+            LeaderboardEntry.objects.filter(
+                session_id__in=[session.id for session, _ in requests]
+            ).values_list("session_id", flat=True)
+        )
+        # challenge_id (None for the main board) -> that board's top 100 threshold
+        thresholds: dict[int | None, int | None] = {}
+
+        created: list[tuple[int, LeaderboardEntry]] = []
+        for idx, (session, player_name) in enumerate(requests):
+            try:
+                normalized_name = _validate_publish(session, player_name)
+                if session.id in published_ids:
+                    raise AlreadyPublishedError("Session already published.")
+                board = session.challenge_id
+                if board not in thresholds:
+                    thresholds[board] = get_top_100_threshold(board)
+                threshold = thresholds[board]
+                if threshold is not None and session.total_score < threshold:
+                    raise NotTop100Error("Not in top 100.")
+            except PublishError as exc:
+                results[idx] = exc
+                continue
+
+            published_ids.add(session.id)
+            entry = LeaderboardEntry.objects.create(
+                session=session,
+                challenge_id=session.challenge_id,
+                player_name=normalized_name,
+                score=session.total_score,
+            )
+            created.append((idx, entry))
+
+        ranks: dict[int, int] = {}
+        pruned_ids: list[int] = []
+        for board in {entry.challenge_id for _, entry in created}:
+            board_ranks, stale_ids = _prune_and_rank(max_size=LEADERBOARD_SIZE, challenge_id=board)
+            ranks.update(board_ranks)
+            if board is None:
+                pruned_ids = stale_ids
+        # delivered to live leaderboard streams once the transaction commits
+        for _, entry in created:
+            if entry.challenge_id is None and entry.id in ranks:
+                broadcast_entry(entry, ranks[entry.id])
+        # entries pushed out of the top 100; ones created in this batch were never announced
+        created_ids = {entry.id for _, entry in created}
+        evicted_ids = [entry_id for entry_id in pruned_ids if entry_id not in created_ids]
+        if evicted_ids:
+            broadcast_removed(evicted_ids)
+
+    for idx, entry in created:
+        rank = ranks.get(entry.id)
+        if rank is None:
+            results[idx] = NotTop100Error("Not in top 100.")
+            continue
+        results[idx] = (entry, rank)
+        logger.info(
+            "Published leaderboard entry session=%s entry_id=%s score=%s rank=%s",
+            entry.session_id,
+            entry.id,
+            entry.score,
+            rank,
+        )
+    return results
+
+
+def publish_session(*, session: Session, player_name: str) -> tuple[LeaderboardEntry, int]:
+    # validate before taking the leaderboard lock so bad requests never queue behind writers
+    _validate_publish(session, player_name)
 
-    if LeaderboardEntry.objects.filter(session=session).exists():
-        raise AlreadyPublishedError("Session already published.")
-
-    is_candidate, _ = get_top_100_candidate(session.total_score)
-    if not is_candidate:
-        raise NotTop100Error("Not in top 100.")
-
-    entry = LeaderboardEntry.objects.create(
-        session=session,
-        player_name=normalized_name,
-        score=session.total_score,
-    )
-    _prune_leaderboard(max_size=100)
-
-    rank = get_rank_for_entry(entry.id)
-    if rank is None:
-        raise NotTop100Error("Not in top 100.")
-
-    logger.info(
-        "Published leaderboard entry session=%s entry_id=%s score=%s rank=%s",
-        session.id,
-        entry.id,
-        session.total_score,
-        rank,
-    )
-    return entry, rank
+    (result,) = publish_sessions([(session, player_name)])
+    if isinstance(result, PublishError):
+        raise result
+    return result
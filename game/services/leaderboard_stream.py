@@ -0,0 +1,274 @@
+"""
+Live leaderboard updates for /api/v1/leaderboard/stream/ (server-sent events).
+
+A stream opens with a snapshot of the top 100, then receives one `entry` event per new
+leaderboard entry, and a `remove` event with the ids of entries a publish pushed out of the
+top 100. publish_sessions() hands each new main-board entry to the broadcast
+backend inside its transaction, and the backend delivers it once that transaction commits
+to the broadcaster of every process. A broadcaster encodes the event once and queues the
+bytes on every open stream in its process. A publish costs one notification however many
+clients watch. A stream costs one query, its snapshot, however long it stays open.
+
+Backends, chosen by LEADERBOARD_BROADCAST_BACKEND (a dotted path; by default NOTIFY on
+PostgreSQL and the local backend elsewhere):
+- LocalBackend delivers within the publishing process only: one worker, or tests.
+- PostgresNotifyBackend sends NOTIFY, which Postgres delivers on commit. In every process a
+  thread LISTENs on its own connection; it starts when the process opens its first stream.
+
+A stream whose client reads too slowly to keep LEADERBOARD_STREAM_QUEUE events queued is
+closed, as is every stream when the listener had to reconnect and may have missed events.
+EventSource clients reconnect by themselves and start again from a fresh snapshot.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, transaction
+from django.utils.module_loading import import_string
+
+from game.models import LeaderboardEntry
+from game.selectors import get_leaderboard_entries
+from game.services.metrics import CallbackGauge
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "wordrush_leaderboard"
+# milliseconds an EventSource waits before reconnecting
+RETRY_MS = 2000
+LISTEN_RECONNECT_SECONDS = 5
+
+# queued in place of a frame to end the stream
+_CLOSE = object()
+
+
+def serialize_entry(entry: LeaderboardEntry, rank: int) -> dict:
+    return {
+        "id": entry.id,
+        "rank": rank,
+        "player_name": entry.player_name,
+        "score": entry.score,
+        "created_at": entry.created_at,
+    }
+
+
+def encode_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n".encode()
+
+
+class Subscription:
+    """The queue of encoded frames of one open stream."""
+
+    def __init__(self, broadcaster: "Broadcaster", maxsize: int):
+        self._broadcaster = broadcaster
+        self._frames: queue.Queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def push(self, frame) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._frames.put_nowait(frame)
+                return
+            except queue.Full:
+                pass
+            # the client fell behind: drop what it has not read and end its stream, so it
+            # reconnects and resyncs from a snapshot
+            self._closed = True
+            self._broadcaster.unsubscribe(self)
+            while True:
+                try:
+                    self._frames.get_nowait()
+                except queue.Empty:
+                    break
+            self._frames.put_nowait(_CLOSE)
+
+    def get(self, timeout: float):
+        """The next frame, None if none arrived within `timeout`, or _CLOSE."""
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+
+
+class Broadcaster:
+    """Fan-out of leaderboard events to the open streams of this process."""
+
+    def __init__(self):
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self, settings.LEADERBOARD_STREAM_QUEUE)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def deliver(self, event: dict) -> None:
+        """Queue `event` ({"type": ..., **data}) on every stream, encoded once."""
+        if event["type"] == "reset":
+            frame = _CLOSE
+        else:
+            frame = encode_event(event["type"], {k: v for k, v in event.items() if k != "type"})
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.push(frame)
+
+
+broadcaster = Broadcaster()
+
+CallbackGauge(
+    "wordrush_leaderboard_streams",
+    "Leaderboard event streams open in this process.",
+    (),
+    lambda: {(): broadcaster.subscriber_count()},
+)
+
+
+class LocalBackend:
+    """Delivers to the streams of the publishing process only."""
+
+    def publish(self, event: dict) -> None:
+        transaction.on_commit(lambda: broadcaster.deliver(event))
+
+    def start(self) -> None:
+        pass
+
+
+class PostgresNotifyBackend:
+    """Delivers to the streams of every process through NOTIFY/LISTEN."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listener_pid = None
+        self._listening = threading.Event()
+
+    def publish(self, event: dict) -> None:
+        # sent when the surrounding transaction commits, and dropped if it rolls back
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, %s)",
+                [NOTIFY_CHANNEL, json.dumps(event, cls=DjangoJSONEncoder)],
+            )
+
+    def start(self) -> None:
+        # once per process; forked workers do not inherit the parent's thread
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._lock:
+            if self._listener_pid != pid:
+                self._listening.clear()
+                threading.Thread(
+                    target=self._listen, name="leaderboard-listen", daemon=True
+                ).start()
+                self._listener_pid = pid
+        # a stream's snapshot must not be read before this process listens for changes
+        self._listening.wait(LISTEN_RECONNECT_SECONDS)
+
+    def _listen(self) -> None:
+        import psycopg
+
+        reconnecting = False
+        while True:
+            try:
+                params = connections["default"].get_connection_params()
+                with psycopg.connect(**params, autocommit=True) as listen_connection:
+                    listen_connection.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    self._listening.set()
+                    if reconnecting:
+                        broadcaster.deliver({"type": "reset"})
+                    reconnecting = True
+                    for notify in listen_connection.notifies():
+                        broadcaster.deliver(json.loads(notify.payload))
+            except Exception:
+                logger.exception("Leaderboard listener failed; reconnecting")
+                reconnecting = True
+                time.sleep(LISTEN_RECONNECT_SECONDS)
+
+
+_backends: dict[str, object] = {}
+
+
+def get_backend():
+    path = settings.LEADERBOARD_BROADCAST_BACKEND
+    if not path:
+        path = (
+            "game.services.leaderboard_stream.PostgresNotifyBackend"
+            if connections["default"].vendor == "postgresql"
+            else "game.services.leaderboard_stream.LocalBackend"
+        )
+    backend = _backends.get(path)
+    if backend is None:
+        backend = _backends.setdefault(path, import_string(path)())
+    return backend
+
+
+def broadcast_entry(entry: LeaderboardEntry, rank: int) -> None:
+    """Announce a new main-board entry to every stream once the transaction commits."""
+    get_backend().publish({"type": "entry", "entry": serialize_entry(entry, rank)})
+
+
+def broadcast_removed(entry_ids: list[int]) -> None:
+    """Announce main-board entries pruned from the top 100, once the transaction commits."""
+    get_backend().publish({"type": "remove", "ids": entry_ids})
+
+
+class EventStream:
+    """
+    The body of one stream: the snapshot, then events as they arrive, with a comment line
+    every LEADERBOARD_STREAM_HEARTBEAT seconds so dead connections are noticed. It ends
+    after LEADERBOARD_STREAM_MAX_SECONDS, and the client reconnects.
+    """
+
+    def __init__(self, subscription: Subscription, snapshot: list[dict]):
+        self._subscription = subscription
+        self._snapshot = snapshot
+
+    def __iter__(self):
+        yield f"retry: {RETRY_MS}\n\n".encode() + encode_event(
+            "snapshot", {"items": self._snapshot}
+        )
+        deadline = time.monotonic() + settings.LEADERBOARD_STREAM_MAX_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            frame = self._subscription.get(
+                timeout=min(settings.LEADERBOARD_STREAM_HEARTBEAT, remaining)
+            )
+            if frame is _CLOSE:
+                return
+            yield b": keepalive\n\n" if frame is None else frame
+
+    def close(self) -> None:
+        # called by the response when the request ends, streamed to the end or not
+        self._subscription.close()
+
+
+def open_stream() -> EventStream:
+    """Subscribe, then read the snapshot, so no entry committed in between is missed."""
+    get_backend().start()
+    subscription = broadcaster.subscribe()
+    try:
+        entries = get_leaderboard_entries(limit=100)
+        snapshot = [serialize_entry(entry, rank) for rank, entry in enumerate(entries, start=1)]
+    except BaseException:
+        subscription.close()
+        raise
+    return EventStream(subscription, snapshot)
@@ -0,0 +1,140 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Values are per worker process; scrape every worker (or run a single one) to see them all.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_registry: list = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Histogram:
+    """A labelled histogram with cumulative buckets, safe to observe from any thread."""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...], buckets=DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # per-bucket counts, then sum
+                series = self._series[key] = [[0] * len(self.buckets), 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = sorted(
+                (key, list(series[0]), series[1]) for key, series in self._series.items()
+            )
+        for key, counts, total in snapshot:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total!r}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class CallbackGauge:
+    """
+    Gauges whose values are read at scrape time from `callback`, which returns a mapping of
+    label-value tuples (in `labelnames` order) to numbers.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...], callback):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.callback = callback
+        _registry.append(self)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self.callback().items()):
+            labels = dict(zip(self.labelnames, key))
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+ATTEMPT_PHASE_SECONDS = Histogram(
+    "wordrush_attempt_phase_seconds",
+    "Time spent in each phase of an attempt request, by outcome.",
+    ("phase", "outcome"),
+)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "wordrush_db_pool_wait_seconds",
+    "Time spent waiting for a pooled database connection.",
+    ("alias",),
+)
+
+
+class PhaseTimer:
+    """
+    Collects durations of named phases for one request and records them together once the
+    outcome is known, so every phase is labelled with the same outcome.
+    """
+
+    def __init__(self, histogram: Histogram = ATTEMPT_PHASE_SECONDS):
+        self.histogram = histogram
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+    def observe(self, outcome: str) -> None:
+        for name, seconds in self.durations.items():
+            self.histogram.observe(seconds, phase=name, outcome=outcome)
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
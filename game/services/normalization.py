@@ -0,0 +1,69 @@
+"""
+Word normalization: strip, Unicode NFC, lowercase.
+
+str.strip() and unicodedata.normalize() already return their argument when there is nothing
+to change; normalize() runs the NFC quick-check in C first. The one copy left was lower(),
+which is now skipped when islower() says the text is already lowercase. (islower() implies
+lower() is a no-op for every code point.) Already-normalized input therefore comes back as
+the same object. A regex pre-check over allowed letters measured slower than these C calls.
+
+The remaining cost is Python call overhead, so there are two variants:
+- normalize_lines inlines the steps for bulk imports;
+- normalize_word_cached memoizes the attempt path in a bounded LRU, for word-sized input.
+
+game/tests/test_normalization.py checks all of them against the reference definition on a
+fuzz corpus.
+"""
+
+import unicodedata
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+# raw attempts remembered per process; bounded so arbitrary input cannot grow it
+NORMALIZE_CACHE_SIZE = 4096
+# longer input is no word; it is normalized uncached, so the cache cannot pin large strings
+NORMALIZE_CACHE_MAX_LENGTH = 64
+
+
+def normalize_word(text: str) -> str:
+    """
+    Normalize a word for storage and comparison.
+    - Strips whitespace
+    - Unicode normalize to NFC
+    - Lowercase (case-insensitive comparison)
+    - Does NOT remove diacritics (é, ñ, etc. are preserved)
+    """
+    text = unicodedata.normalize("NFC", text.strip())
+    return text if text.islower() else text.lower()
+
+
+_normalize_word_lru = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(normalize_word)
+
+
+def normalize_word_cached(text: str) -> str:
+    """normalize_word for the attempt path, where the same raw inputs repeat."""
+    if len(text) > NORMALIZE_CACHE_MAX_LENGTH:
+        return normalize_word(text)
+    return _normalize_word_lru(text)
+
+
+normalize_word_cached.cache_info = _normalize_word_lru.cache_info
+normalize_word_cached.cache_clear = _normalize_word_lru.cache_clear
+
+
+def normalize_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Normalized words from word-list lines (one word per line), for bulk imports.
+    Blank lines and multi-word entries are skipped.
+    """
+    normalize = unicodedata.normalize
+    for line in lines:
+        raw = line.strip()
+        # skip blanks and multi-word entries
+        if not raw or " " in raw:
+            continue
+        word = normalize("NFC", raw)
+        if not word.islower():
+            word = word.lower()
+        if word:
+            yield word
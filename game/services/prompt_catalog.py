@@ -0,0 +1,59 @@
+"""
+In-process catalog of prompts per language, so session creation picks prompts without a query.
+
+The catalog is loaded during warmup. Under gunicorn --preload that happens before the fork,
+so workers share it copy-on-write. It is reloaded once it is older than
+PROMPT_CATALOG_TTL seconds. Saving or deleting a Prompt clears it in the current process,
+and bulk writers call invalidate_prompt_catalog(). Other processes see the change when
+their copy expires. With a read replica configured the catalog is read from it, except
+for REPLICA_PIN_SECONDS after an invalidation, when the replica may not have the change yet.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from game.db_router import replica_reads
+from game.models import Prompt
+from game.services.languages import LANGUAGES
+
+# language -> (expires at, prompts ordered by id)
+_catalog: dict[str, tuple[float, tuple[Prompt, ...]]] = {}
+_lock = threading.Lock()
+# monotonic time until which the catalog is loaded from the primary
+_primary_until = 0.0
+
+
+def get_prompt_catalog(language: str) -> tuple[Prompt, ...]:
+    entry = _catalog.get(language)
+    now = time.monotonic()
+    if entry is None or now >= entry[0]:
+        with _lock:
+            entry = _catalog.get(language)
+            if entry is None or now >= entry[0]:
+                source = replica_reads() if now >= _primary_until else nullcontext()
+                with source:
+                    prompts = tuple(Prompt.objects.filter(language=language).order_by("id"))
+                entry = _catalog[language] = (now + settings.PROMPT_CATALOG_TTL, prompts)
+    return entry[1]
+
+
+def load_prompt_catalog() -> int:
+    """Load every language's prompts; returns how many were loaded."""
+    return sum(len(get_prompt_catalog(language)) for language in LANGUAGES)
+
+
+def invalidate_prompt_catalog() -> None:
+    global _primary_until
+    _catalog.clear()
+    _primary_until = time.monotonic() + settings.REPLICA_PIN_SECONDS
+
+
+@receiver(post_save, sender=Prompt)
+@receiver(post_delete, sender=Prompt)
+def _prompt_changed(sender, **kwargs):
+    invalidate_prompt_catalog()
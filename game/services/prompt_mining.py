@@ -0,0 +1,58 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from game.services.languages import DEFAULT_LANGUAGE, get_description_templates
+
+RULE_TYPES = ["starts_with", "ends_with", "contains", "contains_double"]
+
+
+def word_patterns(word: str, *, max_affix_length: int = 2) -> set[tuple[str, str]]:
+    """
+    All (rule type, value) pairs a normalized word satisfies: prefixes and suffixes up to
+    `max_affix_length`, substring bigrams and trigrams, and doubled letters.
+    Doubled-letter bigrams are reported as contains_double rather than contains.
+    """
+    patterns = set()
+    for n in range(1, min(max_affix_length, len(word)) + 1):
+        patterns.add(("starts_with", word[:n]))
+        patterns.add(("ends_with", word[-n:]))
+    for n in (2, 3):
+        for i in range(len(word) - n + 1):
+            sub = word[i : i + n]
+            if n == 2 and sub[0] == sub[1]:
+                patterns.add(("contains_double", sub))
+            else:
+                patterns.add(("contains", sub))
+    return patterns
+
+
+def count_patterns(words: Iterable[str], *, max_affix_length: int = 2) -> Counter:
+    """
+    Count, in one pass, how many words satisfy each pattern.
+    Each word counts once per pattern, so counts equal what valid_words_count would be.
+    """
+    counts = Counter()
+    for word in words:
+        counts.update(word_patterns(word, max_affix_length=max_affix_length))
+    return counts
+
+
+def prompt_candidates(
+    counts: Counter, *, min_count: int, max_count: int, language: str = DEFAULT_LANGUAGE
+) -> list[tuple[str, dict, int]]:
+    """
+    (description, rule, valid_words_count) for every pattern whose count falls within
+    [min_count, max_count], ordered by rule type then descending count.
+    Descriptions use the `language` templates.
+    """
+    descriptions = get_description_templates(language)
+    selected = [
+        (typ, value, count)
+        for (typ, value), count in counts.items()
+        if min_count <= count <= max_count
+    ]
+    selected.sort(key=lambda item: (RULE_TYPES.index(item[0]), -item[2], item[1]))
+    return [
+        (descriptions[typ].format(value=value), {"type": typ, "value": value}, count)
+        for typ, value, count in selected
+    ]
@@ -0,0 +1,222 @@
+"""
+Per-prompt gameplay analytics: times shown, times solved, rejections by error code and
+time to solve.
+
+Sessions and attempts record into an in-process buffer, which costs no queries. The buffer
+is written to PromptStats in one transaction after a request has finished. That happens
+once PROMPT_STATS_FLUSH_EVENTS events are pending or PROMPT_STATS_FLUSH_INTERVAL seconds
+have passed, whichever comes first. Gunicorn flushes it again when a worker exits. Events
+buffered in a worker that is killed are lost, so the counters are approximate.
+
+Solve times go into a fixed-bucket histogram, from which the median is estimated.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import DatabaseError, connections, router, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+
+from game.models import Prompt, PromptStats
+
+logger = logging.getLogger(__name__)
+
+# upper bounds in milliseconds; a last, unbounded bucket follows
+SOLVE_MS_BUCKETS = (
+    250, 500, 750, 1000, 1500, 2000, 2500, 3000, 4000, 5000,
+    6000, 8000, 10000, 15000, 20000, 30000, 45000, 60000,
+)  # fmt: skip
+
+
+class _PromptDelta:
+    __slots__ = ("shown", "solved", "rejections", "solve_ms")
+
+    def __init__(self):
+        self.shown = 0
+        self.solved = 0
+        self.rejections = Counter()
+        self.solve_ms = Counter()  # bucket index -> count
+
+
+class PromptStatsBuffer:
+    """Counters accumulated in this process since the last flush, safe from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[int, _PromptDelta] = {}
+        self._events = 0
+        self._last_flush = time.monotonic()
+
+    def _delta(self, prompt_id: int) -> _PromptDelta:
+        delta = self._pending.get(prompt_id)
+        if delta is None:
+            delta = self._pending[prompt_id] = _PromptDelta()
+        self._events += 1
+        return delta
+
+    def record_shown(self, prompt_id: int) -> None:
+        with self._lock:
+            self._delta(prompt_id).shown += 1
+
+    def record_solved(self, prompt_id: int, solve_ms: int) -> None:
+        bucket = bisect.bisect_left(SOLVE_MS_BUCKETS, solve_ms)
+        with self._lock:
+            delta = self._delta(prompt_id)
+            delta.solved += 1
+            delta.solve_ms[bucket] += 1
+
+    def record_rejection(self, prompt_id: int, error_code: str) -> None:
+        with self._lock:
+            self._delta(prompt_id).rejections[error_code] += 1
+
+    @property
+    def pending_events(self) -> int:
+        return self._events
+
+    def flush_due(self) -> bool:
+        if not self._events:
+            return False
+        return (
+            self._events >= settings.PROMPT_STATS_FLUSH_EVENTS
+            or time.monotonic() - self._last_flush >= settings.PROMPT_STATS_FLUSH_INTERVAL
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = {}
+            self._events = 0
+            self._last_flush = time.monotonic()
+
+    def _take(self) -> dict[int, _PromptDelta]:
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._events = 0
+            self._last_flush = time.monotonic()
+        return pending
+
+    def _restore(self, pending: dict[int, _PromptDelta]) -> None:
+        with self._lock:
+            for prompt_id, old in pending.items():
+                delta = self._pending.get(prompt_id)
+                if delta is None:
+                    self._pending[prompt_id] = old
+                else:
+                    delta.shown += old.shown
+                    delta.solved += old.solved
+                    delta.rejections.update(old.rejections)
+                    delta.solve_ms.update(old.solve_ms)
+                self._events += old.shown + old.solved + sum(old.rejections.values())
+
+    def flush(self) -> int:
+        """Write pending counters to the database; returns how many prompts were updated."""
+        pending = self._take()
+        if not pending:
+            return 0
+        try:
+            return _apply(pending)
+        except DatabaseError:
+            logger.exception("Could not flush prompt stats; keeping them for the next flush")
+            self._restore(pending)
+            return 0
+
+
+def _apply(pending: dict[int, _PromptDelta]) -> int:
+    using = router.db_for_write(PromptStats)
+    now = timezone.now()
+    with transaction.atomic(using=using):
+        # prompts deleted since the events were recorded are dropped
+        ids = list(
+            Prompt.objects.using(using)
+            .filter(id__in=list(pending))
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not ids:
+            return 0
+        PromptStats.objects.using(using).bulk_create(
+            [PromptStats(prompt_id=prompt_id) for prompt_id in ids], ignore_conflicts=True
+        )
+        rows = list(
+            PromptStats.objects.using(using)
+            .select_for_update()
+            .filter(prompt_id__in=ids)
+            .order_by("prompt_id")
+        )
+        for row in rows:
+            delta = pending[row.prompt_id]
+            row.times_shown += delta.shown
+            row.times_solved += delta.solved
+            row.rejections = dict(Counter(row.rejections) + delta.rejections)
+            histogram = row.solve_ms_histogram or [0] * (len(SOLVE_MS_BUCKETS) + 1)
+            for bucket, count in delta.solve_ms.items():
+                histogram[bucket] += count
+            row.solve_ms_histogram = histogram
+            row.updated_at = now  # bulk_update skips auto_now
+        PromptStats.objects.using(using).bulk_update(
+            rows,
+            ["times_shown", "times_solved", "rejections", "solve_ms_histogram", "updated_at"],
+        )
+    return len(rows)
+
+
+prompt_stats = PromptStatsBuffer()
+
+
+def flush_prompt_stats() -> int:
+    return prompt_stats.flush()
+
+
+@receiver(request_finished)
+def _flush_after_request(sender, **kwargs):
+    # runs after the response has been sent, so no client waits for the flush
+    if not prompt_stats.flush_due():
+        return
+    prompt_stats.flush()
+    # Django's own request_finished handler has already run; close the connection the flush
+    # may have reopened the same way (skipped inside an atomic block, e.g. under tests)
+    connection = connections[router.db_for_write(PromptStats)]
+    if not connection.in_atomic_block:
+        connection.close_if_unusable_or_obsolete()
+
+
+def median_solve_ms(histogram: list[int]) -> int | None:
+    """Median solve time estimated from a histogram, interpolating within its bucket."""
+    total = sum(histogram)
+    if not total:
+        return None
+    half = total / 2
+    cumulative = 0
+    for bucket, count in enumerate(histogram):
+        if count and cumulative + count >= half:
+            lower = SOLVE_MS_BUCKETS[bucket - 1] if bucket else 0
+            if bucket == len(SOLVE_MS_BUCKETS):
+                return lower
+            upper = SOLVE_MS_BUCKETS[bucket]
+            return round(lower + (upper - lower) * (half - cumulative) / count)
+        cumulative += count
+    return None
+
+
+def serialize_prompt_stats(stats: PromptStats) -> dict:
+    prompt = stats.prompt
+    return {
+        "prompt_id": prompt.id,
+        "language": prompt.language,
+        "description": prompt.description,
+        "rule": prompt.rule,
+        "times_shown": stats.times_shown,
+        "times_solved": stats.times_solved,
+        "solve_rate": round(stats.times_solved / stats.times_shown, 4)
+        if stats.times_shown
+        else None,
+        "rejections": stats.rejections,
+        "median_solve_ms": median_solve_ms(stats.solve_ms_histogram),
+        "updated_at": stats.updated_at,
+    }
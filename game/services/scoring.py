@@ -1,3 +1,7 @@
+# points deducted from the session total per hint taken
+HINT_PENALTY = 15
+
+
 def calculate_length_points(length: int) -> int:
     if length <= 0:
         return 0
@@ -23,3 +27,55 @@ def calculate_time_bonus(time_left_ms: int) -> int:
     if time_left_ms <= 0:
         return 0
     return (time_left_ms // 100) * 5
+
+
+def calculate_hint_penalty(hints_used: int) -> int:
+    return max(0, hints_used) * HINT_PENALTY
+
+
+def score_answers(
+    answers: list[dict], *, time_left_ms: int | None, hints_used: int = 0
+) -> tuple[list[dict], int]:
+    """
+    Recompute per-answer points and the session total from stored answer rows.
+    The time bonus only applies to completed sessions, which are the ones with time_left_ms.
+    Hints taken are deducted from the total.
+    """
+    rescored = []
+    total = 0
+    for answer in answers:
+        points = calculate_word_points(
+            ordinal=answer["ordinal"], word_length=len(answer["normalized_word"])
+        )
+        rescored.append(
+            {
+                **answer,
+                "points_index": points["index_points"],
+                "points_length": points["length_points"],
+                "points_total": points["total"],
+            }
+        )
+        total += points["total"]
+    if time_left_ms is not None:
+        total += calculate_time_bonus(time_left_ms)
+    return rescored, total - calculate_hint_penalty(hints_used)
+
+
+def rescore_batch(rows: list[tuple]) -> list[tuple]:
+    """
+    Score a batch of (session_id, answers, time_left_ms, hints_used, total_score) rows.
+    Returns (session_id, old_total, new_total, rescored_answers) per row, with
+    rescored_answers None when every answer's stored points are already current (the total
+    alone can stay the same while points move between answers). Pure, so it can run in a
+    worker process.
+    """
+    results = []
+    for session_id, answers, time_left_ms, hints_used, old_total in rows:
+        answers = answers or []
+        rescored, new_total = score_answers(
+            answers, time_left_ms=time_left_ms, hints_used=hints_used
+        )
+        results.append(
+            (session_id, old_total, new_total, rescored if rescored != answers else None)
+        )
+    return results
@@ -0,0 +1,151 @@
+"""
+Streaming export of accepted answers, one flattened row per answer, for offline analysis.
+
+Sessions are read through a server-side cursor (QuerySet.iterator; on Postgres a named
+cursor), so only one fetch batch of `answers` blobs is in memory at a time. Rows go to
+numbered, compressed files of at most `rows_per_file` rows: gzip CSV, or Parquet (zstd, one
+row group per `PARQUET_ROW_GROUP` rows) with the optional pyarrow dependency.
+
+Incremental exports use `expires_at` as the watermark. A session cannot change once its
+play window has closed and gameplay.EXPIRY_GRACE has passed, so an export of (since, until]
+with `until` at least that far in the past covers each session exactly once. The next
+export continues from `until`.
+"""
+
+import csv
+import gzip
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from game.models import Session
+
+EXPORT_COLUMNS = (
+    "session_id",
+    "language",
+    "ordinal",
+    "prompt_id",
+    "normalized_word",
+    "points",
+    "created_at",
+)
+EXPORT_FORMATS = ("csv", "parquet")
+PARQUET_ROW_GROUP = 50_000
+
+
+def iter_answer_rows(
+    *, since: datetime | None, until: datetime, fetch_size: int = 2000
+) -> Iterator[tuple]:
+    """Rows of EXPORT_COLUMNS for sessions whose play window closed in (since, until]."""
+    sessions = Session.objects.filter(expires_at__lte=until)
+    if since is not None:
+        sessions = sessions.filter(expires_at__gt=since)
+    sessions = sessions.order_by("expires_at", "id").values_list("id", "language", "answers")
+    for session_id, language, answers in sessions.iterator(chunk_size=fetch_size):
+        session_id = str(session_id)
+        for answer in answers:
+            yield (
+                session_id,
+                language,
+                answer["ordinal"],
+                answer["prompt_id"],
+                answer["normalized_word"],
+                answer["points_total"],
+                answer["created_at"],
+            )
+
+
+class _CsvGzipFile:
+    suffix = ".csv.gz"
+
+    def __init__(self, path: Path):
+        self._fh = gzip.open(path, "wt", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._fh)
+        self._writer.writerow(EXPORT_COLUMNS)
+
+    def write(self, row: tuple) -> None:
+        self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetFile:
+    suffix = ".parquet"
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires the 'pyarrow' package (pip install '.[parquet]')."
+            ) from exc
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("session_id", pa.string()),
+                ("language", pa.string()),
+                ("ordinal", pa.int16()),
+                ("prompt_id", pa.int64()),
+                ("normalized_word", pa.string()),
+                ("points", pa.int32()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+            ]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+        self._rows: list[tuple] = []
+
+    def write(self, row: tuple) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= PARQUET_ROW_GROUP:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        columns = list(zip(*self._rows))
+        columns[-1] = [datetime.fromisoformat(value) for value in columns[-1]]
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+        self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+_WRITERS = {"csv": _CsvGzipFile, "parquet": _ParquetFile}
+
+
+def write_chunked(
+    rows: Iterator[tuple],
+    *,
+    out_dir: Path,
+    prefix: str,
+    file_format: str = "csv",
+    rows_per_file: int = 1_000_000,
+) -> dict:
+    """
+    Write `rows` to `out_dir/<prefix>-00001<suffix>`, `-00002`, ... with at most
+    `rows_per_file` rows each. Returns {"rows", "files"}; no file is written for no rows.
+    """
+    writer_class = _WRITERS[file_format]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files: list[Path] = []
+    current = None
+    written = 0
+    try:
+        for row in rows:
+            if current is None:
+                path = out_dir / f"{prefix}-{len(files) + 1:05d}{writer_class.suffix}"
+                current = writer_class(path)
+                files.append(path)
+            current.write(row)
+            written += 1
+            if written % rows_per_file == 0:
+                current.close()
+                current = None
+    finally:
+        if current is not None:
+            current.close()
+    return {"rows": written, "files": files}
@@ -5,6 +5,9 @@ from django.utils import timezone
 
 from game.models import Session
 from game.selectors import get_random_prompts
+from game.services.daily_challenge import get_daily_challenge
+from game.services.languages import DEFAULT_LANGUAGE, validate_language
+from game.services.prompt_stats import prompt_stats
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +16,11 @@ class NotEnoughPromptsError(Exception):
     pass
 
 
-def create_session(*, duration_seconds: int = 60, target_words: int = 21) -> Session:
-    prompts = get_random_prompts(target_words)
+def create_session(
+    *, duration_seconds: int = 60, target_words: int = 21, language: str = DEFAULT_LANGUAGE
+) -> Session:
+    validate_language(language)
+    prompts = get_random_prompts(target_words, language=language)
     if len(prompts) < target_words:
         raise NotEnoughPromptsError("Not enough prompts to create a session.")
 
@@ -31,6 +37,7 @@ def create_session(*, duration_seconds: int = 60, target_words: int = 21) -> Ses
     ]
 
     session = Session.objects.create(
+        language=language,
         started_at=started_at,
         expires_at=expires_at,
         duration_seconds=duration_seconds,
@@ -41,10 +48,38 @@ def create_session(*, duration_seconds: int = 60, target_words: int = 21) -> Ses
         prompts=prompt_snapshots,
         answers=[],
     )
+    prompt_stats.record_shown(prompt_snapshots[0]["prompt_id"])
     logger.info(
-        "Created session=%s duration=%s target_words=%s",
+        "Created session=%s language=%s duration=%s target_words=%s",
         session.id,
+        language,
         duration_seconds,
         target_words,
     )
     return session
+
+
+def create_daily_session(
+    *, duration_seconds: int = 60, language: str = DEFAULT_LANGUAGE
+) -> Session:
+    """A session on today's daily challenge; it references the shared prompts, copying none."""
+    challenge = get_daily_challenge(language)
+    started_at = timezone.now()
+    session = Session.objects.create(
+        language=language,
+        challenge=challenge,
+        started_at=started_at,
+        expires_at=started_at + timedelta(seconds=duration_seconds),
+        duration_seconds=duration_seconds,
+        target_words=len(challenge.prompts),
+        status="active",
+        current_ordinal=1,
+        total_score=0,
+        prompts=[],
+        answers=[],
+    )
+    prompt_stats.record_shown(challenge.prompts[0]["prompt_id"])
+    logger.info(
+        "Created daily session=%s challenge=%s language=%s", session.id, challenge.id, language
+    )
+    return session
@@ -0,0 +1,281 @@
+"""
+Optional daily range partitioning of the Session table by `created_at` (Postgres only).
+
+A session is written for about a minute and then only read, so new rows land in small, hot
+partitions with small indexes. Retention becomes a DETACH or DROP of whole partitions
+instead of a DELETE. The ORM does not notice: the table keeps its name, columns,
+indexes and foreign keys, and queries on `id` still work. The database primary key becomes
+(id, created_at), because Postgres requires the partition key in unique constraints. For
+the same reason no foreign key may point at Session; LeaderboardEntry.session is ORM-only.
+
+enable_partitioning() converts the table once. The existing table becomes the partition
+`<table>_upto_<YYYYMMDD>`, which holds every row from before the first daily partition.
+New rows go to daily partitions `<table>_p<YYYYMMDD>`, with a DEFAULT partition catching
+anything outside them. maintain_partitions() creates upcoming days and retires old ones.
+"""
+
+import logging
+import re
+from datetime import UTC, date, datetime, time, timedelta
+
+from django.db import connection, transaction
+
+from game.models import LeaderboardEntry, Session
+
+logger = logging.getLogger(__name__)
+
+TABLE = Session._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+_PARTITION_RE = re.compile(rf"^{TABLE}_(p|upto_)(\d{{8}})$")
+
+
+class PartitioningError(Exception):
+    pass
+
+
+def partition_name(day: date) -> str:
+    return f"{TABLE}_p{day:%Y%m%d}"
+
+
+def partition_end(name: str) -> date | None:
+    """First day after the rows a partition holds; None for the DEFAULT partition."""
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        return None
+    day = datetime.strptime(match.group(2), "%Y%m%d").date()
+    return day + timedelta(days=1) if match.group(1) == "p" else day
+
+
+def _bound(day: date) -> str:
+    # partition bounds are UTC midnights, inlined as literals (DDL takes no parameters)
+    return datetime.combine(day, time.min, tzinfo=UTC).isoformat()
+
+
+def plan_partitions(
+    existing: list[str], *, today: date, ahead: int, retain_days: int | None
+) -> tuple[list[date], list[str]]:
+    """
+    Days (today .. today + ahead) that still need a partition, and existing partitions
+    whose rows are all older than `retain_days` days (none when retain_days is None).
+    """
+    present = set(existing)
+    # days before the end of the converted table's partition are already covered by it
+    covered_until = max(
+        (partition_end(name) for name in existing if name.startswith(f"{TABLE}_upto_")),
+        default=None,
+    )
+    days = [today + timedelta(days=offset) for offset in range(ahead + 1)]
+    missing = [
+        day
+        for day in days
+        if partition_name(day) not in present and (covered_until is None or day >= covered_until)
+    ]
+    expired = []
+    if retain_days is not None:
+        cutoff = today - timedelta(days=retain_days)
+        expired = sorted(
+            name for name in existing if (end := partition_end(name)) and end <= cutoff
+        )
+    return missing, expired
+
+
+def _require_postgres() -> None:
+    if connection.vendor != "postgresql":
+        raise PartitioningError(
+            f"Session partitioning needs PostgreSQL (the database is {connection.vendor})."
+        )
+
+
+def is_partitioned() -> bool:
+    _require_postgres()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [TABLE])
+        return cursor.fetchone()[0] == "p"
+
+
+def list_partitions() -> list[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass ORDER BY c.relname",
+            [TABLE],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+def _create_partition(cursor, day: date) -> None:
+    qn = connection.ops.quote_name
+    cursor.execute(
+        f"CREATE TABLE {qn(partition_name(day))} PARTITION OF {qn(TABLE)} "
+        f"FOR VALUES FROM ('{_bound(day)}') TO ('{_bound(day + timedelta(days=1))}')"
+    )
+
+
+def enable_partitioning(*, today: date, ahead: int = 7) -> str:
+    """
+    Convert Session into a partitioned table. Returns the name of the partition holding
+    the existing rows. Runs in one transaction that locks the table while the new primary
+    key index is built over the existing rows.
+    """
+    _require_postgres()
+    if is_partitioned():
+        raise PartitioningError(f"{TABLE} is already partitioned.")
+    qn = connection.ops.quote_name
+    first_day = today + timedelta(days=1)
+    legacy = f"{TABLE}_upto_{first_day:%Y%m%d}"
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conrelid::regclass::text FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = %s::regclass",
+            [TABLE],
+        )
+        referencing = [name for (name,) in cursor.fetchall()]
+        if referencing:
+            raise PartitioningError(
+                f"Foreign keys from {', '.join(referencing)} reference {TABLE}; "
+                "apply all migrations first."
+            )
+
+        # the table's secondary indexes (model and foreign key ones), to recreate on the
+        # partitioned table under the same names
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "WHERE i.indrelid = %s::regclass AND NOT i.indisprimary ORDER BY i.indexrelid",
+            [TABLE],
+        )
+        index_definitions = [definition for (definition,) in cursor.fetchall()]
+        # and its own foreign keys (LIKE does not copy them)
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE contype = 'f' AND conrelid = %s::regclass ORDER BY conname",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(legacy)}")
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() "
+            "AND tablename = %s ORDER BY indexname",
+            [legacy],
+        )
+        for number, (index,) in enumerate(cursor.fetchall(), start=1):
+            cursor.execute(f"ALTER INDEX {qn(index)} RENAME TO {qn(f'{legacy}_{number}')}")
+
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE)} (LIKE {qn(legacy)} INCLUDING DEFAULTS "
+            f"INCLUDING CONSTRAINTS) PARTITION BY RANGE ({qn('created_at')})"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(f'{TABLE}_pkey')} "
+            f"PRIMARY KEY ({qn('id')}, {qn('created_at')})"
+        )
+        for definition in index_definitions:
+            # the definitions name the table as it was, which is now the partitioned one
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(name)} {definition}")
+
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(legacy)} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{_bound(first_day)}')"
+        )
+        cursor.execute(f"CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(TABLE)} DEFAULT")
+        for offset in range(ahead + 1):
+            _create_partition(cursor, first_day + timedelta(days=offset))
+    logger.info("Partitioned %s; existing rows are in %s", TABLE, legacy)
+    return legacy
+
+
+def _default_rows(cursor, day: date) -> int:
+    """Rows in the DEFAULT partition that belong to `day`'s partition."""
+    qn = connection.ops.quote_name
+    cursor.execute(
+        f"SELECT count(*) FROM {qn(DEFAULT_PARTITION)} WHERE {qn('created_at')} >= "
+        f"'{_bound(day)}' AND {qn('created_at')} < '{_bound(day + timedelta(days=1))}'"
+    )
+    return cursor.fetchone()[0]
+
+
+def _create_partitions_moving_default_rows(cursor, days: list[date]) -> None:
+    """
+    Create partitions for days whose rows already landed in DEFAULT (maintenance fell
+    behind). Postgres refuses to create a partition while DEFAULT holds rows in its
+    range, so DEFAULT is detached, the rows moved, and DEFAULT attached again. The
+    caller's transaction keeps the parent locked throughout.
+    """
+    qn = connection.ops.quote_name
+    cursor.execute(f"ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(DEFAULT_PARTITION)}")
+    for day in days:
+        _create_partition(cursor, day)
+        in_range = (
+            f"{qn('created_at')} >= '{_bound(day)}' "
+            f"AND {qn('created_at')} < '{_bound(day + timedelta(days=1))}'"
+        )
+        cursor.execute(
+            f"INSERT INTO {qn(partition_name(day))} "
+            f"SELECT * FROM {qn(DEFAULT_PARTITION)} WHERE {in_range}"
+        )
+        cursor.execute(f"DELETE FROM {qn(DEFAULT_PARTITION)} WHERE {in_range}")
+    cursor.execute(f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(DEFAULT_PARTITION)} DEFAULT")
+
+
+def _has_leaderboard_sessions(cursor, partition: str) -> bool:
+    qn = connection.ops.quote_name
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {qn(LeaderboardEntry._meta.db_table)} entry "
+        f"JOIN {qn(partition)} s ON s.{qn('id')} = entry.{qn('session_id')})"
+    )
+    return cursor.fetchone()[0]
+
+
+def maintain_partitions(
+    *,
+    today: date,
+    ahead: int = 7,
+    retain_days: int | None = None,
+    drop: bool = False,
+    dry_run: bool = False,
+) -> dict[str, list[str]]:
+    """
+    Create the partitions for today .. today + ahead and detach (or drop) partitions older
+    than `retain_days`. Partitions holding a session that is still on the leaderboard are
+    kept. Rows the DEFAULT partition caught for a day being created move to that day's
+    partition. Returns {"created", "retired", "kept", "moved"}: partition names, and
+    {partition name: rows moved from DEFAULT}.
+    """
+    if not is_partitioned():
+        raise PartitioningError(f"{TABLE} is not partitioned; run with --enable first.")
+    qn = connection.ops.quote_name
+    missing, expired = plan_partitions(
+        list_partitions(), today=today, ahead=ahead, retain_days=retain_days
+    )
+    result = {
+        "created": [partition_name(day) for day in missing],
+        "retired": [],
+        "kept": [],
+        "moved": {},
+    }
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name in expired:
+            if _has_leaderboard_sessions(cursor, name):
+                result["kept"].append(name)
+            else:
+                result["retired"].append(name)
+        # DEFAULT is empty unless maintenance fell behind, so these counts are cheap
+        caught = {day: rows for day in missing if (rows := _default_rows(cursor, day))}
+        result["moved"] = {partition_name(day): rows for day, rows in caught.items()}
+        if dry_run:
+            return result
+
+        if caught:
+            _create_partitions_moving_default_rows(cursor, list(caught))
+        for day in missing:
+            if day not in caught:
+                _create_partition(cursor, day)
+        for name in result["retired"]:
+            cursor.execute(f"ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(name)}")
+            if drop:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+    return result
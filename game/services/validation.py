@@ -1,23 +1,12 @@
-import unicodedata
+from functools import lru_cache
 
 from django.db.models import Q
 
-
-def normalize_word(text: str) -> str:
-    """
-    Normalize a word for storage and comparison.
-    - Strips whitespace
-    - Unicode normalize to NFC
-    - Lowercase (case-insensitive comparison)
-    - Does NOT remove diacritics (é, ñ, etc. are preserved)
-    """
-    text = text.strip()
-    text = unicodedata.normalize("NFC", text)
-    text = text.lower()
-    return text
+from game.services.languages import DEFAULT_LANGUAGE, get_diacritics
+from game.services.normalization import normalize_word, normalize_word_cached  # noqa: F401
 
 
-def matches_rule(normalized_word: str, rule: dict) -> bool:
+def matches_rule(normalized_word: str, rule: dict, language: str = DEFAULT_LANGUAGE) -> bool:
     """
     Determine if a normalized word matches the given rule dict.
     Supported rule types:
@@ -25,7 +14,7 @@ def matches_rule(normalized_word: str, rule: dict) -> bool:
       - ends_with: {'type':'ends_with','value':'s'}
       - contains: {'type':'contains','value':'ie'}
       - contains_double: {'type':'contains_double','value':'ll'}
-      - contains_diacritic: {'type':'contains_diacritic'}
+      - contains_diacritic: {'type':'contains_diacritic'} (letters depend on `language`)
 
     Expects `normalized_word` already NFC-normalized and lowercased.
     """
@@ -44,17 +33,25 @@ def matches_rule(normalized_word: str, rule: dict) -> bool:
         # check for the double substring
         return val in normalized_word
     if typ == "contains_diacritic":
-        # Latvian diacritic letters (lowercase)
-        diacritics = set("āčēģīķļņšūž")
+        diacritics = get_diacritics(language)
         return any(ch in diacritics for ch in normalized_word)
 
     return False
 
 
-def rule_to_q(rule: dict) -> Q:
+@lru_cache(maxsize=None)
+def _diacritic_q(language: str) -> Q:
+    q = Q(pk__in=[])
+    for ch in sorted(get_diacritics(language)):
+        q = q | Q(word__contains=ch)
+    return q
+
+
+def rule_to_q(rule: dict, language: str = DEFAULT_LANGUAGE) -> Q:
     """
     Convert a rule dict into a Django Q object that can be used to filter
     `Word` objects by their `word` field. This allows counting matches in SQL.
+    Callers still filter `Word` by language; `language` only picks the diacritic set.
     Returns an empty Q() that matches nothing if the rule is invalid.
     """
     if not rule or "type" not in rule:
@@ -74,10 +71,6 @@ def rule_to_q(rule: dict) -> Q:
     if typ == "contains_double":
         return Q(word__contains=val)
     if typ == "contains_diacritic":
-        diacritics = list("āčēģīķļņšūž")
-        q = Q(pk__in=[])
-        for ch in diacritics:
-            q = q | Q(word__contains=ch)
-        return q
+        return _diacritic_q(language)
 
     return Q(pk__in=[])
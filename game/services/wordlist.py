@@ -0,0 +1,106 @@
+"""
+Word-list reading helpers for dictionary import.
+
+Normalization runs in the importing process: it is far faster than the database takes
+rows, and shipping words between processes would cost more than normalizing them.
+"""
+
+import glob
+import gzip
+import io
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from game.services.normalization import normalize_lines
+
+STDIN_PATH = "-"
+
+
+class DecompressorUnavailableError(Exception):
+    """The module needed to decompress a word-list source is not installed."""
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def expand_paths(patterns: Iterable[str]) -> list[str]:
+    """
+    Expand user paths and glob patterns into a list of sources, keeping argument order.
+    "-" stands for stdin. Raises FileNotFoundError for a path or pattern matching nothing.
+    """
+    sources = []
+    for pattern in patterns:
+        if pattern == STDIN_PATH:
+            sources.append(STDIN_PATH)
+            continue
+        pattern = str(Path(pattern).expanduser())
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else []
+        if not matches:
+            if not Path(pattern).is_file():
+                raise FileNotFoundError(pattern)
+            matches = [pattern]
+        sources.extend(matches)
+    return sources
+
+
+@contextmanager
+def open_source(source: str) -> Iterator[TextIO]:
+    """
+    Open a word-list source as UTF-8 text, decompressing .gz/.xz/.zst on the fly.
+    Decompression is streamed, so nothing is ever unpacked to disk or held whole in memory.
+    """
+    if source == STDIN_PATH:
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+        try:
+            yield stream
+        finally:
+            # leave the process's stdin open
+            stream.detach()
+        return
+
+    suffix = Path(source).suffix.lower()
+    if suffix == ".gz":
+        fh = gzip.open(source, "rt", encoding="utf-8")
+    elif suffix == ".xz":
+        try:
+            import lzma
+        except ImportError as exc:
+            raise DecompressorUnavailableError(
+                "Reading .xz files requires a Python built with lzma support."
+            ) from exc
+        fh = lzma.open(source, "rt", encoding="utf-8")
+    elif suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise DecompressorUnavailableError(
+                "Reading .zst files requires the 'zstandard' package (pip install '.[zstd]')."
+            ) from exc
+        raw = zstandard.ZstdDecompressor().stream_reader(open(source, "rb"), closefd=True)
+        fh = io.TextIOWrapper(raw, encoding="utf-8")
+    else:
+        fh = open(source, encoding="utf-8")
+    with fh:
+        yield fh
+
+
+def iter_source_lines(sources: Iterable[str]) -> Iterator[str]:
+    """Yield lines from each source in turn, opening one source at a time."""
+    for source in sources:
+        with open_source(source) as fh:
+            yield from fh
+
+
+def iter_normalized_words(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield normalized dictionary words from raw lines (one word per line).
+    Blank lines and multi-word entries are skipped.
+    """
+    yield from normalize_lines(lines)
@@ -0,0 +1,93 @@
+import copy
+from contextlib import contextmanager
+
+import pytest
+from django.conf import settings
+from django.core.signals import request_started
+from django.urls import resolve
+
+from game.query_budget import QueryCounter, get_view_budget
+from game.services.daily_challenge import forget_daily_challenges
+from game.services.hints import invalidate_word_lists
+from game.services.prompt_catalog import invalidate_prompt_catalog
+from game.services.prompt_stats import prompt_stats
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    # a `replica` alias mirroring the test database, for the read-replica routing tests;
+    # nothing is routed to it unless a test sets DATABASE_REPLICA_ALIAS
+    if "replica" not in settings.DATABASES:
+        replica = copy.deepcopy(settings.DATABASES["default"])
+        replica["TEST"] = {**replica.get("TEST", {}), "MIRROR": "default"}
+        settings.DATABASES["replica"] = replica
+
+
+@pytest.fixture(autouse=True)
+def _fresh_prompt_catalog():
+    # the catalog is process-wide; prompts from one test's (rolled back) data must not leak
+    invalidate_prompt_catalog()
+    yield
+    invalidate_prompt_catalog()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_prompt_stats():
+    # buffered counters are process-wide too; start each test with none and a fresh interval
+    prompt_stats.clear()
+    yield
+    prompt_stats.clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_daily_challenges():
+    forget_daily_challenges()
+    yield
+    forget_daily_challenges()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_word_lists():
+    invalidate_word_lists()
+    yield
+    invalidate_word_lists()
+
+
+@pytest.fixture(scope="session")
+def query_counted_endpoints() -> set[str]:
+    """URL names whose requests passed an assert_endpoint_queries check in this run."""
+    return set()
+
+
+@pytest.fixture
+def assert_endpoint_queries(query_counted_endpoints):
+    """
+    Assert that the wrapped request runs exactly `expected` queries (savepoints excluded)
+    and stays within the budget declared on the view serving `path`.
+    """
+
+    @contextmanager
+    def check(path: str, expected: int):
+        match = resolve(path)
+        budget = get_view_budget(match.func)
+        assert budget is not None, f"{path} has no declared query budget"
+        assert expected <= budget, f"{path}: expected {expected} queries exceeds budget {budget}"
+        served = set()
+
+        def record(sender, environ, **kwargs):
+            served.add(resolve(environ["PATH_INFO"]).url_name)
+
+        request_started.connect(record)
+        try:
+            with QueryCounter() as counter:
+                yield counter
+        finally:
+            request_started.disconnect(record)
+        assert counter.count == expected, (
+            f"{path}: expected {expected} queries, got {counter.count}:\n"
+            + "\n".join(counter.queries)
+        )
+        assert match.url_name in served, f"{path}: no request to it was made"
+        query_counted_endpoints.add(match.url_name)
+
+    return check
@@ -232,3 +232,22 @@ def test_attempt_expired_session_returns_409_and_marks_expired():
     assert response.json()["detail"] == "Session expired."
     session.refresh_from_db()
     assert session.status == "expired"
+
+
+@pytest.mark.django_db
+def test_attempt_checks_dictionary_and_diacritics_of_session_language():
+    Word.objects.create(language="lv", word="šalle")
+    Word.objects.create(language="lt", word="ąžuolas")
+    session = _create_session(
+        prompts=[_prompt_snapshot(prompt_id=1, description="Diacritic", rule={"type": "contains_diacritic"})]
+        * 21
+    )
+    session.language = "lt"
+    session.save(update_fields=["language"])
+    client = APIClient()
+
+    lv_word = client.post(f"/api/v1/sessions/{session.id}/attempt/", data={"word": "šalle"}, format="json")
+    lt_word = client.post(f"/api/v1/sessions/{session.id}/attempt/", data={"word": "Ąžuolas"}, format="json")
+
+    assert lv_word.json()["error_code"] == "not_in_dictionary"
+    assert lt_word.json()["is_valid"] is True
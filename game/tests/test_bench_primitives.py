@@ -0,0 +1,47 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from game.benchmarks.primitives import CALIBRATION, compare, run_benchmarks
+
+
+def test_run_benchmarks_times_selected_cases():
+    results = run_benchmarks(repeat=1, pattern="calculate_time_bonus")
+
+    assert set(results) == {CALIBRATION, "calculate_time_bonus"}
+    assert all(ns > 0 for ns in results.values())
+
+
+def test_compare_scales_baseline_by_calibration():
+    baseline = {CALIBRATION: 100.0, "fast": 10.0, "slow": 10.0}
+    # machine is twice as slow: "fast" kept pace, "slow" got 3x slower
+    results = {CALIBRATION: 200.0, "fast": 20.0, "slow": 60.0, "new": 5.0}
+
+    rows = {row[0]: row for row in compare(results, baseline, threshold=0.25)}
+
+    assert CALIBRATION not in rows
+    assert rows["fast"][2:] == (20.0, 0.0, False)
+    assert rows["slow"][3] == pytest.approx(2.0) and rows["slow"][4] is True
+    assert rows["new"][2:] == (None, None, False)
+
+
+def test_command_fails_on_regression(tmp_path):
+    path = tmp_path / "baseline.json"
+    call_command(
+        "bench_primitives",
+        "--save-baseline",
+        f"--baseline={path}",
+        "--repeat=1",
+        "-k",
+        "calculate_time_bonus",
+    )
+    saved = json.loads(path.read_text())
+    saved["results"]["calculate_time_bonus"] /= 100
+    path.write_text(json.dumps(saved))
+
+    with pytest.raises(CommandError, match="calculate_time_bonus"):
+        call_command(
+            "bench_primitives", f"--baseline={path}", "--repeat=1", "-k", "calculate_time_bonus"
+        )
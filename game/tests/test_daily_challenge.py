@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.models import DailyChallenge, LeaderboardEntry, Prompt, Session, Word
+from game.services.daily_challenge import (
+    choose_prompts,
+    forget_daily_challenges,
+    get_daily_challenge,
+)
+from game.services.leaderboard import publish_sessions
+
+DAY = date(2026, 3, 10)
+
+
+def _create_prompts(count: int = 30, language: str = "lv") -> None:
+    for i in range(count):
+        Prompt.objects.create(
+            language=language,
+            description=f"P{i}",
+            rule={"type": "starts_with", "value": "a"},
+        )
+
+
+def _submitted(score: int, challenge: DailyChallenge | None = None) -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        challenge=challenge,
+        started_at=now - timedelta(seconds=60),
+        expires_at=now,
+        status="submitted",
+        total_score=score,
+        prompts=[],
+        answers=[],
+    )
+
+
+@pytest.mark.django_db
+def test_challenge_sessions_share_the_day_prompts_without_copying_them():
+    Word.objects.create(word="aplis")
+    _create_prompts()
+    client = APIClient()
+
+    first = client.post("/api/v1/daily/sessions/", data={}, format="json").json()
+    second = client.post("/api/v1/daily/sessions/", data={}, format="json").json()
+
+    challenge = DailyChallenge.objects.get()
+    assert first["challenge_id"] == second["challenge_id"] == challenge.id
+    assert first["prompt"] == second["prompt"]
+    assert first["prompt"]["prompt_id"] == challenge.prompts[0]["prompt_id"]
+    assert first["target_words"] == 21
+    assert Session.objects.get(id=first["id"]).prompts == []
+
+    body = client.post(
+        f"/api/v1/sessions/{first['id']}/attempt/", data={"word": "aplis"}, format="json"
+    ).json()
+    assert body["is_valid"] is True
+    assert body["prompt"]["prompt_id"] == challenge.prompts[1]["prompt_id"]
+
+
+@pytest.mark.django_db
+def test_prompt_choice_is_seeded_by_date_and_language():
+    _create_prompts()
+
+    assert choose_prompts(DAY, "lv") == choose_prompts(DAY, "lv")
+    assert choose_prompts(DAY, "lv") != choose_prompts(DAY + timedelta(days=1), "lv")
+
+
+@pytest.mark.django_db
+def test_challenge_is_created_once_and_reused_by_other_processes():
+    _create_prompts()
+    challenge = get_daily_challenge("lv", DAY)
+
+    forget_daily_challenges()  # as in another process
+    assert get_daily_challenge("lv", DAY) == challenge
+    assert DailyChallenge.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_daily_sessions_need_enough_prompts():
+    _create_prompts(count=5)
+
+    response = APIClient().post("/api/v1/daily/sessions/", data={}, format="json")
+
+    assert response.status_code == 503
+    assert not DailyChallenge.objects.exists()
+
+
+@pytest.mark.django_db
+def test_daily_scores_go_to_the_challenge_leaderboard_only():
+    _create_prompts()
+    today = get_daily_challenge("lv")
+    yesterday = get_daily_challenge("lv", today.date - timedelta(days=1))
+    results = publish_sessions(
+        [
+            (_submitted(50, today), "Daily"),
+            (_submitted(70, yesterday), "Yesterday"),
+            (_submitted(30), "Main"),
+        ]
+    )
+
+    assert [result[1] for result in results] == [1, 1, 1]
+    assert LeaderboardEntry.objects.get(player_name="Daily").challenge == today
+    client = APIClient()
+    main = client.get("/api/v1/leaderboard/").json()["items"]
+    daily = client.get("/api/v1/daily/leaderboard/?language=lv").json()
+    past = client.get(f"/api/v1/daily/leaderboard/?date={yesterday.date}").json()
+    assert [item["player_name"] for item in main] == ["Main"]
+    assert daily["date"] == today.date.isoformat()
+    assert [item["player_name"] for item in daily["items"]] == ["Daily"]
+    assert [item["player_name"] for item in past["items"]] == ["Yesterday"]
+    assert client.get("/api/v1/daily/leaderboard/?date=soon").status_code == 400
+
+
+@pytest.mark.django_db
+def test_create_daily_challenges_command(capsys):
+    _create_prompts(language="lv")
+
+    call_command("create_daily_challenges", "--date", "2026-03-10", "--language", "lv")
+    call_command("create_daily_challenges", "--date", "2026-03-10", "--language", "lv")
+
+    assert DailyChallenge.objects.filter(date=DAY, language="lv").count() == 1
+    assert "2026-03-10 lv: challenge" in capsys.readouterr().out
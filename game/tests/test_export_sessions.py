@@ -0,0 +1,127 @@
+import csv
+import gzip
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from game.models import Session
+from game.services.session_export import EXPORT_COLUMNS
+
+
+def _answer(ordinal: int, word: str) -> dict:
+    return {
+        "ordinal": ordinal,
+        "prompt_id": 100 + ordinal,
+        "word": word.upper(),
+        "normalized_word": word,
+        "points_index": ordinal,
+        "points_length": 1,
+        "points_total": ordinal + 1,
+        "created_at": timezone.now().isoformat(),
+    }
+
+
+def _create_session(*, expired_seconds_ago: int, words: list[str]) -> Session:
+    expires_at = timezone.now() - timedelta(seconds=expired_seconds_ago)
+    return Session.objects.create(
+        started_at=expires_at - timedelta(seconds=60),
+        expires_at=expires_at,
+        status="submitted",
+        prompts=[],
+        answers=[_answer(i, word) for i, word in enumerate(words, start=1)],
+    )
+
+
+def _read_csv(paths) -> list[list[str]]:
+    rows = []
+    for path in sorted(paths):
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as fh:
+            reader = csv.reader(fh)
+            assert tuple(next(reader)) == EXPORT_COLUMNS
+            rows.extend(reader)
+    return rows
+
+
+@pytest.mark.django_db
+def test_export_flattens_answers_into_chunked_gzip_csv(tmp_path):
+    first = _create_session(expired_seconds_ago=300, words=["aplis", "ābols", "aka"])
+    second = _create_session(expired_seconds_ago=200, words=["zirgs", "zars"])
+    # still in play: its answers may change, so it is not exported yet
+    _create_session(expired_seconds_ago=-30, words=["suns"])
+    out = StringIO()
+
+    call_command("export_sessions", "--out-dir", str(tmp_path), "--rows-per-file", "2", stdout=out)
+
+    files = sorted(tmp_path.glob("answers-*.csv.gz"))
+    assert len(files) == 3
+    rows = _read_csv(files)
+    assert [row[0] for row in rows] == [str(first.id)] * 3 + [str(second.id)] * 2
+    assert rows[1][1:6] == ["lv", "2", "102", "ābols", "3"]
+    assert "Exported 5 rows to 3 file(s)" in out.getvalue()
+    assert "rows/s" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_watermark_exports_each_session_once(tmp_path):
+    watermark = tmp_path / "watermark.json"
+    _create_session(expired_seconds_ago=300, words=["aplis"])
+    args = ["export_sessions", "--watermark-file", str(watermark), "--out-dir"]
+
+    first_until = (timezone.now() - timedelta(seconds=200)).isoformat()
+    call_command(*args, str(tmp_path / "first"), "--until", first_until, stdout=StringIO())
+    until = json.loads(watermark.read_text())["until"]
+    _create_session(expired_seconds_ago=100, words=["zirgs", "zars"])
+    call_command(*args, str(tmp_path / "second"), stdout=StringIO())
+
+    assert [row[3] for row in _read_csv((tmp_path / "first").glob("*.csv.gz"))] == ["101"]
+    second = _read_csv((tmp_path / "second").glob("*.csv.gz"))
+    assert [row[4] for row in second] == ["zirgs", "zars"]
+    assert json.loads(watermark.read_text())["until"] > until
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("seconds_ago", [-300, 30])
+def test_export_rejects_an_until_inside_the_expiry_grace(tmp_path, seconds_ago):
+    until = (timezone.now() - timedelta(seconds=seconds_ago)).isoformat()
+
+    with pytest.raises(CommandError, match="in the past"):
+        call_command("export_sessions", "--out-dir", str(tmp_path), "--until", until)
+
+
+@pytest.mark.django_db
+def test_session_expired_inside_the_grace_waits_for_the_next_export(tmp_path):
+    watermark = tmp_path / "watermark.json"
+    # an attempt that read the clock before expiry may still commit to this one
+    recent = _create_session(expired_seconds_ago=30, words=["aplis"])
+
+    call_command(
+        "export_sessions",
+        "--watermark-file",
+        str(watermark),
+        "--out-dir",
+        str(tmp_path),
+        stdout=StringIO(),
+    )
+
+    assert _read_csv(tmp_path.glob("*.csv.gz")) == []
+    assert json.loads(watermark.read_text())["until"] < recent.expires_at.isoformat()
+
+
+@pytest.mark.django_db
+def test_export_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _create_session(expired_seconds_ago=60, words=["aplis", "aka"])
+
+    call_command(
+        "export_sessions", "--out-dir", str(tmp_path), "--format", "parquet", stdout=StringIO()
+    )
+
+    (path,) = tmp_path.glob("answers-*.parquet")
+    table = pq.read_table(path)
+    assert table.column_names == list(EXPORT_COLUMNS)
+    assert table.column("normalized_word").to_pylist() == ["aplis", "aka"]
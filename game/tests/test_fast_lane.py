@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.signals import request_finished
+from django.db import close_old_connections
+from django.test import Client
+from django.utils import timezone
+
+from game.benchmarks.fast_lane import call
+from game.fast_lane import FastLaneDispatcher, FastLaneWSGIHandler
+from game.models import RequestProfile, Session
+
+
+@pytest.fixture
+def keep_test_connection():
+    # like Django's test client: the test transaction must survive request_finished
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_finished.connect(close_old_connections)
+
+
+def test_fast_lane_chain_skips_session_auth_csrf_and_clickjacking(settings):
+    skipped = set(settings.MIDDLEWARE) - set(settings.FAST_LANE_MIDDLEWARE)
+    handler = FastLaneWSGIHandler()
+
+    view_middleware = {type(method.__self__).__name__ for method in handler._view_middleware}
+
+    assert {
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    } <= skipped
+    assert "corsheaders.middleware.CorsMiddleware" in settings.FAST_LANE_MIDDLEWARE
+    assert view_middleware == {"ProfilingMiddleware"}
+
+
+@pytest.mark.django_db
+def test_fast_lane_serves_api_without_full_stack_headers(keep_test_connection):
+    status, headers, _ = call(FastLaneWSGIHandler(), "GET", "/api/v1/leaderboard/")
+    full_status, full_headers, _ = call(WSGIHandler(), "GET", "/api/v1/leaderboard/")
+
+    assert status == full_status == "200 OK"
+    assert "X-Frame-Options" not in headers
+    assert full_headers["X-Frame-Options"] == "DENY"
+
+
+@pytest.mark.django_db
+def test_staff_session_can_profile_through_the_fast_lane(keep_test_connection, settings):
+    settings.PROFILING_TOKEN = ""
+    staff = get_user_model().objects.create_user("ops", password="pw", is_staff=True)
+    client = Client()
+    client.force_login(staff)
+    cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+    session = Session.objects.create(
+        started_at=timezone.now(), expires_at=timezone.now(), status="submitted"
+    )
+
+    status, headers, _ = call(
+        FastLaneWSGIHandler(),
+        "POST",
+        f"/api/v1/sessions/{session.id}/publish/",
+        b'{"player_name": ""}',
+        HTTP_X_PROFILE="1",
+        HTTP_COOKIE=cookie,
+    )
+
+    assert status.startswith("400")
+    assert RequestProfile.objects.filter(id=headers["X-Profile-Id"]).exists()
+
+
+def test_dispatcher_routes_only_fast_lane_prefixes():
+    calls = []
+
+    def handler(name):
+        def app(environ, start_response):
+            calls.append((name, environ["PATH_INFO"]))
+            return []
+
+        return app
+
+    dispatcher = FastLaneDispatcher(handler("full"), fast=handler("fast"))
+    for path in ("/api/v1/leaderboard/", "/admin/", "/api/health/"):
+        dispatcher({"PATH_INFO": path}, None)
+
+    assert calls == [
+        ("fast", "/api/v1/leaderboard/"),
+        ("full", "/admin/"),
+        ("full", "/api/health/"),
+    ]
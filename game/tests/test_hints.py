@@ -0,0 +1,108 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.models import Prompt, PromptWordList, Session, Word
+from game.services.hints import build_word_list, pick_hint
+from game.services.scoring import HINT_PENALTY, score_answers
+
+
+def _create_session(prompt: Prompt, *, answers: list[dict] | None = None) -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        prompts=[{"prompt_id": prompt.id, "description": prompt.description, "rule": prompt.rule}]
+        * 21,
+        answers=answers or [],
+    )
+
+
+def test_pick_hint_skips_used_words():
+    assert pick_hint(("aplis", "auto"), {"aplis"}) == "auto"
+    assert pick_hint(("aplis",), {"aplis"}) is None
+    assert pick_hint((), set()) is None
+
+
+def test_hint_penalty_is_part_of_the_rescored_total():
+    _, total = score_answers([], time_left_ms=None, hints_used=2)
+
+    assert total == -2 * HINT_PENALTY
+
+
+@pytest.mark.django_db
+def test_recompute_stores_the_word_lists_hints_use():
+    for word in ["aplis", "auto", "bumba"]:
+        Word.objects.create(word=word)
+    prompt = Prompt.objects.create(description="A", rule={"type": "starts_with", "value": "a"})
+    empty = Prompt.objects.create(description="Z", rule={"type": "starts_with", "value": "z"})
+
+    call_command("recompute_prompt_valid_words_count", stdout=StringIO())
+
+    assert PromptWordList.objects.get(prompt=prompt).words == "aplis\nauto"
+    assert PromptWordList.objects.get(prompt=empty).words == ""
+
+
+@pytest.mark.django_db
+def test_hint_reveals_an_unused_word_and_costs_points():
+    prompt = Prompt.objects.create(description="A", rule={"type": "starts_with", "value": "a"})
+    PromptWordList.objects.create(prompt=prompt, words="aplis\nauto")
+    session = _create_session(prompt, answers=[{"normalized_word": "aplis"}])
+    client = APIClient()
+    path = f"/api/v1/sessions/{session.id}/hint/"
+
+    body = client.post(path, format="json").json()
+
+    assert body["word"] == "auto"
+    assert (body["hints_used"], body["total_score"]) == (1, -HINT_PENALTY)
+    session.refresh_from_db()
+    assert (session.hints_used, session.total_score) == (1, -HINT_PENALTY)
+    assert client.get(f"/api/v1/sessions/{session.id}/").json()["hints_used"] == 1
+
+
+@pytest.mark.django_db
+def test_hint_is_404_without_an_unused_word_and_costs_nothing():
+    prompt = Prompt.objects.create(description="A", rule={"type": "starts_with", "value": "a"})
+    session = _create_session(prompt)
+
+    response = APIClient().post(f"/api/v1/sessions/{session.id}/hint/", format="json")
+
+    assert response.status_code == 404
+    session.refresh_from_db()
+    assert (session.hints_used, session.total_score) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_second_hint_reveals_a_different_word():
+    prompt = Prompt.objects.create(description="A", rule={"type": "starts_with", "value": "a"})
+    PromptWordList.objects.create(prompt=prompt, words="aplis\nauto")
+    session = _create_session(prompt)
+    client = APIClient()
+    path = f"/api/v1/sessions/{session.id}/hint/"
+
+    first = client.post(path, format="json").json()["word"]
+    second = client.post(path, format="json").json()["word"]
+    third = client.post(path, format="json")
+
+    assert {first, second} == {"aplis", "auto"}
+    assert third.status_code == 404
+    session.refresh_from_db()
+    assert (session.hints_used, session.hinted_words) == (2, [first, second])
+
+
+@pytest.mark.django_db
+def test_word_list_is_sampled_from_all_matching_words(monkeypatch):
+    monkeypatch.setattr("game.services.hints.HINT_WORDS", 20)
+    Word.objects.bulk_create(Word(word=f"a{i:03d}") for i in range(200))
+    prompt = Prompt.objects.create(description="A", rule={"type": "starts_with", "value": "a"})
+
+    words = build_word_list(prompt)
+
+    assert len(words) == 20
+    assert words == sorted(words)
+    # the first 20 alphabetically would all be below a020
+    assert words[-1] > "a020"
@@ -1,7 +1,17 @@
+import gzip
+import io
+import lzma
+import sys
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, transaction
 
-from game.models import Word
+from game.models import DictionaryVersion, Prompt, Word
+from game.selectors import get_dictionary_version
+from game.services.wordlist import expand_paths
 
 
 @pytest.mark.django_db
@@ -17,3 +27,204 @@ def test_import_words_creates_words(tmp_path):
     assert "apple" in words
     # multi word should be ignored
     assert all(" " not in w for w in words)
+
+
+@pytest.mark.django_db
+def test_import_words_reports_exact_inserted_and_duplicates(tmp_path):
+    Word.objects.create(word="apple")
+    p = tmp_path / "sample.txt"
+    p.write_text("Ābols\nābols\napple\nbumbieris\n")
+    out = StringIO()
+
+    call_command("import_words", f"--path={p}", stdout=out)
+
+    assert "Read 4, inserted 2, duplicates 2" in out.getvalue()
+    assert Word.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_bench_import_words_rolls_back_by_default():
+    out = StringIO()
+
+    call_command("bench_import_words", "--lines=500", stdout=out)
+
+    assert "rows/s" in out.getvalue()
+    assert Word.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_import_words_reports_peak_memory(tmp_path):
+    p = tmp_path / "sample.txt"
+    p.write_text("Ābols\nābols\napple\n")
+    out = StringIO()
+
+    call_command("import_words", f"--path={p}", stdout=out)
+
+    assert set(Word.objects.values_list("word", flat=True)) == {"ābols", "apple"}
+    assert "Peak memory" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_words_reads_compressed_globs_and_stdin(tmp_path, monkeypatch):
+    with gzip.open(tmp_path / "part-1.txt.gz", "wt", encoding="utf-8") as fh:
+        fh.write("Ābols\nkoks\n")
+    with lzma.open(tmp_path / "part-2.txt.xz", "wt", encoding="utf-8") as fh:
+        fh.write("koks\nmāja\n")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO("Šalle\n".encode())))
+    out = StringIO()
+
+    call_command("import_words", f"--path={tmp_path}/part-*", "--path=-", stdout=out)
+
+    assert set(Word.objects.values_list("word", flat=True)) == {"ābols", "koks", "māja", "šalle"}
+    assert "Read 5, inserted 4, duplicates 1" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_words_dry_run_writes_nothing(tmp_path):
+    Word.objects.create(word="apple")
+    p = tmp_path / "sample.txt"
+    p.write_text("Ābols\nābols\napple\nbumba\n")
+    out = StringIO()
+
+    call_command("import_words", f"--path={p}", "--dry-run", "--batch=2", stdout=out)
+
+    assert Word.objects.count() == 1
+    assert "Read 4 words from 1 source(s), 3 unique, would insert 2, duplicates 2" in out.getvalue()
+
+
+def test_import_words_missing_decompressor_is_a_command_error(tmp_path, monkeypatch):
+    (tmp_path / "words.zst").write_bytes(b"")
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(CommandError, match="zstandard"):
+        call_command("import_words", f"--path={tmp_path}/words.zst", "--dry-run")
+
+
+def test_import_words_does_not_mask_other_import_errors(tmp_path, monkeypatch):
+    p = tmp_path / "sample.txt"
+    p.write_text("apple\n")
+
+    def broken(*args, **kwargs):
+        raise ImportError("broken dictionary code")
+
+    monkeypatch.setattr("game.management.commands.import_words.import_words", broken)
+
+    with pytest.raises(ImportError, match="broken dictionary code"):
+        call_command("import_words", f"--path={p}")
+
+
+def test_expand_paths_rejects_unmatched_glob(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        expand_paths([f"{tmp_path}/*.txt"])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_words_sync_replaces_dictionary_and_bumps_version(tmp_path):
+    Word.objects.create(word="vecs")
+    Word.objects.create(word="koks")
+    p = tmp_path / "sample.txt"
+    p.write_text("Koks\nmāja\nmāja\n")
+    out = StringIO()
+
+    call_command("import_words", f"--path={p}", "--sync", stdout=out)
+
+    assert set(Word.objects.values_list("word", flat=True)) == {"koks", "māja"}
+    version = DictionaryVersion.objects.get()
+    assert version.is_full_sync
+    assert version.word_count == 2
+    assert get_dictionary_version() == version.id
+    assert f"Dictionary version {version.id}: 2 words (was 2)" in out.getvalue()
+    # the swapped-in table keeps the unique constraint and accepts new rows
+    Word.objects.create(word="zirgs")
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Word.objects.create(word="koks")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_words_sync_twice_and_plain_import_bump_version(tmp_path):
+    p = tmp_path / "sample.txt"
+    p.write_text("koks\n")
+
+    call_command("import_words", f"--path={p}", "--sync", stdout=StringIO())
+    call_command("import_words", f"--path={p}", "--sync", stdout=StringIO())
+    first_sync_version = get_dictionary_version()
+    call_command("import_words", f"--path={p}", stdout=StringIO())
+    assert get_dictionary_version() == first_sync_version
+
+    p.write_text("māja\n")
+    call_command("import_words", f"--path={p}", stdout=StringIO())
+    assert get_dictionary_version() > first_sync_version
+    assert Word.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_dictionary_versions_are_per_language(tmp_path):
+    Word.objects.create(language="lv", word="koks")
+    p = tmp_path / "sample.txt"
+    p.write_text("medis\nąžuolas\n")
+
+    call_command("import_words", f"--path={p}", "--language=lt", stdout=StringIO())
+
+    version = DictionaryVersion.objects.get()
+    assert (version.language, version.word_count) == ("lt", 2)
+    assert get_dictionary_version("lt") == version.id
+    assert get_dictionary_version("lv") == 0
+
+
+@pytest.mark.django_db
+def test_recompute_stale_only_compares_each_prompt_with_its_language_version():
+    Word.objects.create(language="lt", word="ąžuolas")
+    lv_version = DictionaryVersion.objects.create(language="lv", word_count=0)
+    lt_version = DictionaryVersion.objects.create(language="lt", word_count=1)
+    rule = {"type": "starts_with", "value": "ą"}
+    current = Prompt.objects.create(
+        language="lv", description="a", rule=rule, dictionary_version=lv_version.id
+    )
+    stale = Prompt.objects.create(
+        language="lt", description="b", rule=rule, dictionary_version=lv_version.id
+    )
+
+    call_command("recompute_prompt_valid_words_count", "--stale-only", stdout=StringIO())
+
+    current.refresh_from_db()
+    stale.refresh_from_db()
+    assert current.valid_words_count is None
+    assert (stale.valid_words_count, stale.dictionary_version) == (1, lt_version.id)
+
+
+@pytest.mark.django_db
+def test_recompute_prompt_counts_keys_on_dictionary_version():
+    Word.objects.create(word="aplis")
+    version = DictionaryVersion.objects.create(word_count=1)
+    stale = Prompt.objects.create(description="a", rule={"type": "starts_with", "value": "a"})
+    fresh = Prompt.objects.create(
+        description="b",
+        rule={"type": "starts_with", "value": "a"},
+        valid_words_count=99,
+        dictionary_version=version.id,
+    )
+
+    call_command("recompute_prompt_valid_words_count", "--stale-only", stdout=StringIO())
+
+    stale.refresh_from_db()
+    fresh.refresh_from_db()
+    assert (stale.valid_words_count, stale.dictionary_version) == (1, version.id)
+    assert fresh.valid_words_count == 99
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_words_sync_only_replaces_requested_language(tmp_path):
+    Word.objects.create(language="lv", word="koks")
+    Word.objects.create(language="lt", word="medis")
+    p = tmp_path / "sample.txt"
+    p.write_text("Ąžuolas\nmedis\n")
+
+    call_command("import_words", f"--path={p}", "--sync", "--language=lt", stdout=StringIO())
+    call_command("import_words", f"--path={p}", "--sync", "--language=lt", stdout=StringIO())
+
+    assert set(Word.objects.values_list("language", "word")) == {
+        ("lv", "koks"),
+        ("lt", "ąžuolas"),
+        ("lt", "medis"),
+    }
+    Word.objects.create(language="lv", word="medis")
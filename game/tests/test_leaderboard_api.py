@@ -1,10 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import pytest
+from django.db import connection
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from game.models import LeaderboardEntry, Session
+from game.selectors import leaderboard_queryset
+from game.services.leaderboard import (
+    AlreadyPublishedError,
+    NotTop100Error,
+    PublishError,
+    publish_sessions,
+)
 
 
 def _create_session(*, score: int, status: str = "submitted") -> Session:
@@ -114,3 +123,59 @@ def test_leaderboard_ordering_desc_score_then_created_at():
     assert response.status_code == 200
     items = response.json()["items"]
     assert [item["player_name"] for item in items] == ["C", "A", "B"]
+
+
+@pytest.mark.django_db
+def test_publish_batch_ranks_every_caller_with_single_prune():
+    _seed_leaderboard(60, start_score=600)
+    sessions = [_create_session(score=(i * 37) % 1000, status="submitted") for i in range(300)]
+
+    results = publish_sessions([(session, f"Batch {i}") for i, session in enumerate(sessions)])
+
+    assert LeaderboardEntry.objects.count() == 100
+    ranked_ids = list(leaderboard_queryset().values_list("id", flat=True))
+    published = [result for result in results if not isinstance(result, PublishError)]
+    assert published
+    for entry, rank in published:
+        assert ranked_ids[rank - 1] == entry.id
+    rejected = [result for result in results if isinstance(result, PublishError)]
+    assert all(isinstance(result, NotTop100Error) for result in rejected)
+    assert len(published) + len(rejected) == 300
+
+
+@pytest.mark.django_db
+def test_publish_batch_rejects_duplicate_session_in_same_batch():
+    session = _create_session(score=300, status="submitted")
+
+    first, second = publish_sessions([(session, "Once"), (session, "Twice")])
+
+    assert first[1] == 1
+    assert isinstance(second, AlreadyPublishedError)
+    assert LeaderboardEntry.objects.count() == 1
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="concurrent writers need Postgres")
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_publishes_stress():
+    sessions = [_create_session(score=(i * 53) % 5000, status="submitted") for i in range(300)]
+
+    def publish(session: Session) -> int:
+        try:
+            response = APIClient().post(
+                f"/api/v1/sessions/{session.id}/publish/",
+                data={"player_name": "Stress"},
+                format="json",
+            )
+            return response.status_code
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        codes = list(pool.map(publish, sessions))
+
+    assert set(codes) <= {201, 403}
+    assert LeaderboardEntry.objects.count() == 100
+    top_scores = sorted((s.total_score for s in sessions), reverse=True)[:100]
+    assert (
+        sorted(leaderboard_queryset().values_list("score", flat=True), reverse=True) == top_scores
+    )
@@ -0,0 +1,132 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.models import LeaderboardEntry, Session
+from game.services.leaderboard import publish_sessions
+from game.services.leaderboard_stream import broadcaster
+
+local_backend = override_settings(
+    LEADERBOARD_BROADCAST_BACKEND="game.services.leaderboard_stream.LocalBackend"
+)
+# the test client reports a single-threaded server, which the stream refuses
+THREADED = {"wsgi.multithread": True}
+
+
+def _submitted(score: int) -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        started_at=now - timedelta(seconds=60),
+        expires_at=now,
+        status="submitted",
+        total_score=score,
+        prompts=[],
+        answers=[],
+    )
+
+
+def _events(chunk: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for block in chunk.decode().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.django_db
+@local_backend
+def test_stream_sends_a_snapshot_then_committed_entries(django_capture_on_commit_callbacks):
+    LeaderboardEntry.objects.create(session=_submitted(50), player_name="Ieva", score=50)
+    response = APIClient().get("/api/v1/leaderboard/stream/", **THREADED)
+    chunks = iter(response.streaming_content)
+
+    assert response["Content-Type"] == "text/event-stream"
+    ((name, snapshot),) = _events(next(chunks))
+    assert name == "snapshot"
+    assert [(item["rank"], item["player_name"]) for item in snapshot["items"]] == [(1, "Ieva")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        publish_sessions([(_submitted(70), "Anna")])
+    ((name, data),) = _events(next(chunks))
+    assert name == "entry"
+    assert (data["entry"]["rank"], data["entry"]["player_name"]) == (1, "Anna")
+
+    response.close()
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.django_db
+@local_backend
+@override_settings(LEADERBOARD_STREAM_HEARTBEAT=0.01, LEADERBOARD_STREAM_MAX_SECONDS=0.05)
+def test_idle_stream_sends_keepalives_and_ends():
+    response = APIClient().get("/api/v1/leaderboard/stream/", **THREADED)
+
+    chunks = list(response.streaming_content)
+    response.close()
+
+    assert chunks[0].startswith(b"retry: ")
+    assert set(chunks[1:]) == {b": keepalive\n\n"}
+
+
+@pytest.mark.django_db
+@local_backend
+@override_settings(LEADERBOARD_STREAM_QUEUE=2)
+def test_slow_client_stream_is_closed_to_resync():
+    response = APIClient().get("/api/v1/leaderboard/stream/", **THREADED)
+    for score in range(3):
+        broadcaster.deliver({"type": "entry", "entry": {"score": score}})
+
+    chunks = list(response.streaming_content)
+    response.close()
+
+    # the snapshot only; the client reconnects for a new one
+    assert [name for chunk in chunks for name, _ in _events(chunk)] == ["snapshot"]
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.django_db
+@local_backend
+def test_stream_is_refused_on_a_single_threaded_server():
+    response = APIClient().get("/api/v1/leaderboard/stream/")
+
+    assert response.status_code == 503
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.django_db
+@local_backend
+@override_settings(LEADERBOARD_STREAM_MAX_PER_PROCESS=1)
+def test_stream_is_refused_once_the_process_holds_its_maximum():
+    client = APIClient()
+    first = client.get("/api/v1/leaderboard/stream/", **THREADED)
+
+    second = client.get("/api/v1/leaderboard/stream/", **THREADED)
+    first.close()
+
+    assert second.status_code == 503
+    assert second["Retry-After"] == "10"
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.django_db
+@local_backend
+def test_stream_announces_entries_pruned_from_the_top_100(django_capture_on_commit_callbacks):
+    lowest = LeaderboardEntry.objects.create(session=_submitted(0), player_name="P0", score=0)
+    for score in range(1, 100):
+        LeaderboardEntry.objects.create(session=_submitted(score), player_name="P", score=score)
+    response = APIClient().get("/api/v1/leaderboard/stream/", **THREADED)
+    chunks = iter(response.streaming_content)
+    next(chunks)  # snapshot
+
+    with django_capture_on_commit_callbacks(execute=True):
+        publish_sessions([(_submitted(500), "Anna")])
+    events = _events(next(chunks)) + _events(next(chunks))
+    response.close()
+
+    assert [name for name, _ in events] == ["entry", "remove"]
+    assert events[1][1] == {"ids": [lowest.id]}
@@ -0,0 +1,31 @@
+import logging
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from game.models import LeaderboardEntry, Session
+
+
+@pytest.mark.django_db
+def test_loadtest_smoke_runs_full_games():
+    out = StringIO()
+    request_log_level = logging.getLogger("django.request").level
+
+    call_command(
+        "loadtest",
+        "--words=3000",
+        "--prompts=40",
+        "--players=3",
+        "--concurrency=1",
+        "--typo-ratio=0.2",
+        stdout=out,
+    )
+
+    output = out.getvalue()
+    assert "attempt" in output and "p99 ms" in output
+    assert "database connects:" in output
+    assert Session.objects.filter(status="submitted").count() == 3
+    assert LeaderboardEntry.objects.count() == 3
+    # request error logging is only muted while the players run
+    assert logging.getLogger("django.request").level == request_log_level
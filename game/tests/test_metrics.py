@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.models import Session, Word
+from game.services import metrics
+from game.services.metrics import ATTEMPT_PHASE_SECONDS, CallbackGauge, Histogram
+
+
+@pytest.fixture
+def throwaway_registry(monkeypatch):
+    # metrics register themselves on creation; keep test ones out of /api/metrics/
+    registry = []
+    monkeypatch.setattr(metrics, "_registry", registry)
+    return registry
+
+
+def test_histogram_renders_cumulative_buckets(throwaway_registry):
+    histogram = Histogram("test_seconds", "Test histogram.", ("outcome",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, outcome="ok")
+    histogram.observe(0.5, outcome="ok")
+    histogram.observe(5.0, outcome="ok")
+
+    lines = histogram.render()
+
+    assert 'test_seconds_bucket{outcome="ok",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{outcome="ok",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{outcome="ok",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{outcome="ok"} 3' in lines
+    assert throwaway_registry == [histogram]
+
+
+def test_callback_gauge_reads_values_at_render_time(throwaway_registry):
+    values = {}
+    gauge = CallbackGauge("test_pool", "Test gauge.", ("alias", "stat"), lambda: values)
+    values[("default", "pool_size")] = 4
+
+    lines = gauge.render()
+
+    assert lines == [
+        "# HELP test_pool Test gauge.",
+        "# TYPE test_pool gauge",
+        'test_pool{alias="default",stat="pool_size"} 4.0',
+    ]
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_attempt_phases_by_outcome():
+    ATTEMPT_PHASE_SECONDS.clear()
+    Word.objects.create(word="aplis")
+    now = timezone.now()
+    session = Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        prompts=[
+            {
+                "prompt_id": 1,
+                "description": "Starts with a",
+                "rule": {"type": "starts_with", "value": "a"},
+            }
+        ]
+        * 21,
+    )
+    client = APIClient()
+    client.post(f"/api/v1/sessions/{session.id}/attempt/", data={"word": "zzz"}, format="json")
+    client.post(f"/api/v1/sessions/{session.id}/attempt/", data={"word": "aplis"}, format="json")
+
+    response = client.get("/api/metrics/")
+
+    assert response.status_code == 200
+    assert "test_seconds" not in response.content.decode()
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    for phase in ("transaction", "lock", "dictionary", "leaderboard"):
+        assert (
+            f'wordrush_attempt_phase_seconds_count{{phase="{phase}",outcome="not_in_dictionary"}} 1'
+            in body
+        )
+    for phase in ("rule", "save"):
+        assert (
+            f'wordrush_attempt_phase_seconds_count{{phase="{phase}",outcome="accepted"}} 1' in body
+        )
@@ -0,0 +1,49 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from game.models import Prompt, Word
+from game.services.prompt_mining import count_patterns, word_patterns
+from game.services.validation import rule_to_q
+
+
+def test_word_patterns_covers_affixes_ngrams_and_doubles():
+    patterns = word_patterns("šalle")
+
+    assert ("starts_with", "š") in patterns
+    assert ("starts_with", "ša") in patterns
+    assert ("ends_with", "le") in patterns
+    assert ("contains", "all") in patterns
+    assert ("contains_double", "ll") in patterns
+    assert ("contains", "ll") not in patterns
+
+
+@pytest.mark.django_db
+def test_mined_counts_match_rule_queries():
+    words = ["aplis", "ābols", "šalle", "galle", "abols", "māja", "saule"]
+    Word.objects.bulk_create([Word(word=w) for w in words])
+
+    counts = count_patterns(words)
+
+    for (typ, value), count in counts.items():
+        rule = {"type": typ, "value": value}
+        assert Word.objects.filter(rule_to_q(rule)).count() == count, rule
+
+
+@pytest.mark.django_db
+def test_mine_prompts_inserts_band_with_counts_and_skips_existing():
+    Word.objects.bulk_create([Word(word=w) for w in ["šalle", "galle", "zelle", "aplis"]])
+    Prompt.objects.create(description="existing", rule={"type": "contains_double", "value": "ll"})
+
+    call_command("mine_prompts", "--min-count=3", "--max-count=3", stdout=StringIO())
+
+    mined = {
+        p.description: p.valid_words_count for p in Prompt.objects.exclude(description="existing")
+    }
+    assert mined == {
+        "Vārdi, kas beidzas ar 'e'": 3,
+        "Vārdi, kas beidzas ar 'le'": 3,
+        "Vārdi, kas satur 'le'": 3,
+        "Vārdi, kas satur 'lle'": 3,
+    }
@@ -0,0 +1,93 @@
+import random
+import unicodedata
+
+import pytest
+
+from game.services.normalization import normalize_lines, normalize_word, normalize_word_cached
+from game.services.wordlist import iter_normalized_words
+
+# ASCII, Baltic letters in both cases, combining marks (NFD input), whitespace, and
+# characters whose NFC or lowercase forms are tricky
+ALPHABET = (
+    list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'-.")
+    + list("āčēģīķļņšūžĀČĒĢĪĶĻŅŠŪŽąęėįųĄĘĖĮŲäöõüÄÖÕÜ")
+    # combining macron, caron, cedilla, ogonek, tilde, diaeresis
+    + ["\u0304", "\u030c", "\u0327", "\u0328", "\u0303", "\u0308"]
+    # space, tab, newline, carriage return, no-break space, em space
+    + [" ", "\t", "\n", "\r", "\u00a0", "\u2003"]
+    # sharp s, dotted I, sigma forms, titlecase Dz, angstrom and kelvin signs, fi ligature,
+    # capital sharp s, Latin small beta
+    + ["ß", "İ", "Σ", "ς", "ǅ", "\u212b", "\u212a", "\ufb01", "ẞ", "\ua7b5"]
+)
+CORPUS_SIZE = 200_000
+
+
+def reference_normalize(text: str) -> str:
+    """normalize_word as originally defined."""
+    return unicodedata.normalize("NFC", text.strip()).lower()
+
+
+def reference_lines(lines):
+    for line in lines:
+        raw = line.strip()
+        if not raw or " " in raw:
+            continue
+        word = reference_normalize(raw)
+        if word:
+            yield word
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[str]:
+    rng = random.Random(43)
+    words = []
+    for _ in range(CORPUS_SIZE):
+        if rng.random() < 0.5:
+            # mostly-clean words, like real attempts and word lists
+            text = "".join(
+                rng.choice("abcdeiklmnoprstuvzāēīšūž") for _ in range(rng.randint(1, 12))
+            )
+            if rng.random() < 0.3:
+                text = unicodedata.normalize("NFD", text)
+            if rng.random() < 0.3:
+                text = text.capitalize()
+        else:
+            text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 10)))
+        if rng.random() < 0.2:
+            text = rng.choice([" ", "\t", "\n", "\r\n"]) + text + rng.choice(["", "\n", " "])
+        words.append(text)
+    return words
+
+
+def test_normalize_word_matches_reference_on_fuzz_corpus(corpus):
+    mismatches = [t for t in corpus if normalize_word(t) != reference_normalize(t)]
+
+    assert mismatches == []
+
+
+def test_cached_normalization_matches_reference(corpus):
+    normalize_word_cached.cache_clear()
+
+    assert all(normalize_word_cached(t) == reference_normalize(t) for t in corpus[:20_000])
+    assert normalize_word_cached.cache_info().currsize <= normalize_word_cached.cache_info().maxsize
+
+
+def test_cached_normalization_does_not_keep_long_input():
+    normalize_word_cached.cache_clear()
+
+    assert normalize_word_cached(" A" * 1000) == reference_normalize(" A" * 1000)
+    assert normalize_word_cached.cache_info().currsize == 0
+
+
+def test_normalize_lines_matches_reference_on_fuzz_corpus(corpus):
+    lines = [text + "\n" for text in corpus]
+
+    assert list(normalize_lines(lines)) == list(reference_lines(lines))
+    assert list(iter_normalized_words(corpus)) == list(reference_lines(corpus))
+
+
+@pytest.mark.parametrize("word", ["ābols", "ķirbis", "žodis", "öö", "a-b", "o'neil"])
+def test_normalized_input_is_returned_without_copying(word):
+    word = "".join(word)  # not an interned literal
+
+    assert normalize_word(word) is word
@@ -1,5 +1,7 @@
 from django.test import Client
 
+from game.api.schema import clear_schema_cache
+
 
 def test_openapi_schema_endpoint_returns_200():
     client = Client()
@@ -7,3 +9,41 @@ def test_openapi_schema_endpoint_returns_200():
     response = client.get("/api/schema/")
 
     assert response.status_code == 200
+
+
+def test_openapi_schema_is_served_from_precomputed_file(settings, tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text('{"openapi": "3.0.3"}')
+    settings.OPENAPI_SCHEMA_PATH = path
+    clear_schema_cache()
+
+    response = Client().get("/api/schema/")
+    # read once, then served from memory
+    path.write_text("changed")
+    again = Client().get("/api/schema/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/vnd.oai.openapi+json"
+    assert response.json() == {"openapi": "3.0.3"}
+    assert again.content == response.content
+
+
+def test_openapi_schema_missing_without_docs_is_404(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_PATH = tmp_path / "missing.json"
+    settings.ENABLE_API_DOCS = False
+
+    response = Client().get("/api/schema/")
+
+    assert response.status_code == 404
+
+
+def test_openapi_schema_written_after_a_miss_is_served(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_PATH = tmp_path / "schema.json"
+    settings.ENABLE_API_DOCS = False
+
+    missing = Client().get("/api/schema/")
+    settings.OPENAPI_SCHEMA_PATH.write_text('{"openapi": "3.0.3"}')
+    written = Client().get("/api/schema/")
+
+    assert missing.status_code == 404
+    assert written.status_code == 200
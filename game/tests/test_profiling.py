@@ -0,0 +1,142 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game import profiling
+from game.models import RequestProfile, Session, Word
+
+RULE = {"type": "starts_with", "value": "a"}
+
+
+def _create_session() -> Session:
+    now = timezone.now()
+    prompt = {"prompt_id": 1, "description": "Starts with a", "rule": RULE, "valid_words_count": 1}
+    return Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        status="active",
+        prompts=[prompt] * 21,
+    )
+
+
+def _attempt(client: APIClient, session: Session, **headers):
+    return client.post(
+        f"/api/v1/sessions/{session.id}/attempt/", data={"word": "abols"}, format="json", **headers
+    )
+
+
+@pytest.mark.django_db
+def test_attempt_is_not_profiled_by_default(settings):
+    settings.PROFILING_TOKEN = "secret"
+    session = _create_session()
+
+    response = _attempt(APIClient(), session)
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response
+    assert not RequestProfile.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("header", ["guess", "sëcret"])
+def test_profile_header_needs_token_or_staff(settings, header):
+    settings.PROFILING_TOKEN = "secret"
+    session = _create_session()
+
+    response = _attempt(APIClient(), session, HTTP_X_PROFILE=header)
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response
+    assert not RequestProfile.objects.exists()
+
+
+def test_anonymous_profile_header_does_not_look_up_a_user(settings, monkeypatch, rf):
+    settings.PROFILING_TOKEN = "secret"
+
+    def lookup(request):
+        raise AssertionError("session user looked up")
+
+    monkeypatch.setattr(profiling, "_session_user", lookup)
+
+    assert profiling.profile_trigger(rf.get("/", HTTP_X_PROFILE="guess")) is None
+    assert profiling.profile_trigger(rf.get("/", HTTP_X_PROFILE="secret")) == "header"
+
+
+@pytest.mark.django_db
+def test_token_header_stores_profile_with_query_log(settings):
+    settings.PROFILING_TOKEN = "secret"
+    settings.PROFILING_TOP_N = 5
+    Word.objects.create(word="abols")
+    session = _create_session()
+
+    response = _attempt(APIClient(), session, HTTP_X_PROFILE="secret")
+
+    assert response.status_code == 200
+    assert response.json()["is_valid"] is True
+    profile = RequestProfile.objects.get(id=int(response["X-Profile-Id"]))
+    assert profile.trigger == "header"
+    assert profile.view_name == "session_attempt"
+    assert profile.status_code == 200
+    assert len(profile.stats) == 5
+    cumulative = [row["cumtime_ms"] for row in profile.stats]
+    assert cumulative == sorted(cumulative, reverse=True)
+    assert profile.query_count == len(profile.queries) >= 3
+    assert any('"game_word"' in query["sql"] for query in profile.queries)
+
+
+@pytest.mark.django_db
+def test_staff_user_can_profile_without_token(settings):
+    settings.PROFILING_TOKEN = ""
+    staff = get_user_model().objects.create_user("ops", password="pw", is_staff=True)
+    client = APIClient()
+    client.force_login(staff)
+    session = _create_session()
+
+    response = client.post(
+        f"/api/v1/sessions/{session.id}/publish/",
+        data={"player_name": "Ops"},
+        format="json",
+        HTTP_X_PROFILE="1",
+    )
+
+    assert response.status_code == 409
+    profile = RequestProfile.objects.get()
+    assert profile.view_name == "session_publish"
+    assert profile.status_code == 409
+
+
+@pytest.mark.django_db
+def test_sample_rate_profiles_only_opted_in_views(settings):
+    settings.PROFILING_SAMPLE_RATE = 1.0
+    session = _create_session()
+    client = APIClient()
+
+    client.get(f"/api/v1/sessions/{session.id}/")
+    _attempt(client, session)
+
+    assert list(RequestProfile.objects.values_list("view_name", "trigger")) == [
+        ("session_attempt", "sample")
+    ]
+
+
+@pytest.mark.django_db
+def test_show_profiles_lists_and_prints(settings):
+    settings.PROFILING_SAMPLE_RATE = 1.0
+    session = _create_session()
+    response = _attempt(APIClient(), session)
+    profile_id = response["X-Profile-Id"]
+
+    listing = StringIO()
+    call_command("show_profiles", stdout=listing)
+    assert f"/api/v1/sessions/{session.id}/attempt/" in listing.getvalue()
+
+    detail = StringIO()
+    call_command("show_profiles", profile_id, "--top=3", stdout=detail)
+    output = detail.getvalue()
+    assert "cumtime ms" in output
+    assert "game_session" in output
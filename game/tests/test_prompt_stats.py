@@ -0,0 +1,165 @@
+import pytest
+from django.db import DatabaseError
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from game.models import Prompt, PromptStats, Word
+from game.services import prompt_stats as prompt_stats_module
+from game.services.prompt_stats import (
+    SOLVE_MS_BUCKETS,
+    PromptStatsBuffer,
+    median_solve_ms,
+    prompt_stats,
+)
+
+
+def _prompts(count: int = 21, rule: dict | None = None) -> list[Prompt]:
+    rule = rule or {"type": "starts_with", "value": "a"}
+    return [Prompt.objects.create(description=f"P{i}", rule=rule) for i in range(count)]
+
+
+def _histogram(**counts_by_bucket) -> list[int]:
+    histogram = [0] * (len(SOLVE_MS_BUCKETS) + 1)
+    for bucket, count in counts_by_bucket.items():
+        histogram[int(bucket.lstrip("b"))] = count
+    return histogram
+
+
+def test_median_solve_ms_interpolates_within_the_bucket():
+    assert median_solve_ms([]) is None
+    assert median_solve_ms(_histogram()) is None
+    # 4 solves in (1000, 1500]: the median sits halfway into the bucket
+    assert median_solve_ms(_histogram(b4=4)) == 1250
+    # 1 fast, 3 slow: the median falls in the slow bucket
+    assert median_solve_ms(_histogram(b0=1, b9=3)) == 4000 + round(1000 * 1 / 3)
+    # beyond the last bound only the lower bound is known
+    assert median_solve_ms(_histogram(b18=2)) == SOLVE_MS_BUCKETS[-1]
+
+
+@pytest.mark.django_db
+def test_flush_creates_and_then_increments_rows():
+    first, second = _prompts(2)
+    buffer = PromptStatsBuffer()
+    buffer.record_shown(first.id)
+    buffer.record_shown(first.id)
+    buffer.record_rejection(first.id, "not_in_dictionary")
+    buffer.record_solved(first.id, 1200)
+    buffer.record_shown(second.id)
+
+    assert buffer.pending_events == 5
+    assert buffer.flush() == 2
+    assert buffer.pending_events == 0
+
+    buffer.record_rejection(first.id, "not_in_dictionary")
+    buffer.record_rejection(first.id, "rule_mismatch")
+    buffer.record_solved(first.id, 90_000)
+    assert buffer.flush() == 1
+
+    stats = PromptStats.objects.get(prompt=first)
+    assert stats.times_shown == 2
+    assert stats.times_solved == 2
+    assert stats.rejections == {"not_in_dictionary": 2, "rule_mismatch": 1}
+    assert stats.solve_ms_histogram == _histogram(b4=1, b18=1)
+    assert PromptStats.objects.get(prompt=second).times_shown == 1
+
+
+@pytest.mark.django_db
+def test_flush_skips_deleted_prompts():
+    kept, deleted = _prompts(2)
+    buffer = PromptStatsBuffer()
+    buffer.record_shown(kept.id)
+    buffer.record_shown(deleted.id)
+    deleted.delete()
+
+    assert buffer.flush() == 1
+    assert list(PromptStats.objects.values_list("prompt_id", flat=True)) == [kept.id]
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_the_counters(monkeypatch):
+    (prompt,) = _prompts(1)
+    buffer = PromptStatsBuffer()
+    buffer.record_shown(prompt.id)
+
+    def fail(pending):
+        raise DatabaseError("down")
+
+    monkeypatch.setattr(prompt_stats_module, "_apply", fail)
+    assert buffer.flush() == 0
+    monkeypatch.undo()
+
+    buffer.record_shown(prompt.id)
+    assert buffer.pending_events == 2
+    buffer.flush()
+    assert PromptStats.objects.get(prompt=prompt).times_shown == 2
+
+
+@pytest.mark.django_db
+def test_gameplay_records_shown_solved_and_rejections():
+    _prompts()
+    Word.objects.create(word="aplis")
+    Word.objects.create(word="bumba")
+    client = APIClient()
+    session = client.post("/api/v1/sessions/", data={}, format="json").json()
+    first_prompt = session["prompt"]["prompt_id"]
+    path = f"/api/v1/sessions/{session['id']}/attempt/"
+
+    for word in ["", "zzz", "bumba", "aplis", "aplis"]:
+        body = client.post(path, data={"word": word}, format="json").json()
+    second_prompt = body["prompt"]["prompt_id"]
+    assert prompt_stats.pending_events == 7
+    prompt_stats.flush()
+
+    stats = PromptStats.objects.get(prompt_id=first_prompt)
+    assert stats.times_shown == 1 + (second_prompt == first_prompt)
+    assert stats.times_solved == 1
+    assert stats.rejections == {"empty": 1, "not_in_dictionary": 1, "rule_mismatch": 1}
+    assert sum(stats.solve_ms_histogram) == 1
+    second = PromptStats.objects.get(prompt_id=second_prompt)
+    assert second.rejections.get("duplicate") == 1
+
+
+@pytest.mark.django_db
+def test_buffer_is_flushed_after_a_request_once_due():
+    _prompts()
+    client = APIClient()
+
+    with override_settings(PROMPT_STATS_FLUSH_EVENTS=2):
+        client.post("/api/v1/sessions/", data={}, format="json")
+        assert not PromptStats.objects.exists()
+        client.post("/api/v1/sessions/", data={}, format="json")
+
+    assert prompt_stats.pending_events == 0
+    assert sum(PromptStats.objects.values_list("times_shown", flat=True)) == 2
+
+
+@pytest.mark.django_db
+def test_prompt_stats_api():
+    easy, hard = _prompts(2)
+    lithuanian = Prompt.objects.create(
+        language="lt", description="L", rule={"type": "starts_with", "value": "e"}
+    )
+    PromptStats.objects.create(prompt=easy, times_shown=10, times_solved=9)
+    PromptStats.objects.create(
+        prompt=hard,
+        times_shown=20,
+        times_solved=5,
+        rejections={"rule_mismatch": 7},
+        solve_ms_histogram=_histogram(b9=5),
+    )
+    PromptStats.objects.create(prompt=lithuanian, times_shown=1)
+    client = APIClient()
+
+    body = client.get("/api/v1/prompts/stats/?language=lv").json()
+    assert [item["prompt_id"] for item in body["items"]] == [hard.id, easy.id]
+    assert body["items"][0]["solve_rate"] == 0.25
+    assert body["items"][0]["rejections"] == {"rule_mismatch": 7}
+    assert body["items"][0]["median_solve_ms"] == 4500
+    assert len(client.get("/api/v1/prompts/stats/?limit=1").json()["items"]) == 1
+    assert client.get("/api/v1/prompts/stats/?language=xx").status_code == 400
+
+    detail = client.get(f"/api/v1/prompts/{lithuanian.id}/stats/").json()
+    assert detail["language"] == "lt"
+    assert detail["median_solve_ms"] is None
+    missing = Prompt.objects.create(description="M", rule={"type": "starts_with", "value": "m"})
+    assert client.get(f"/api/v1/prompts/{missing.id}/stats/").status_code == 404
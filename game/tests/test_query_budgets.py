@@ -0,0 +1,209 @@
+import logging
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.urls import URLPattern
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.api.urls import urlpatterns
+from game.api.views import SessionDetailView
+from game.models import LeaderboardEntry, Prompt, PromptStats, PromptWordList, Session, Word
+from game.services.daily_challenge import forget_daily_challenges
+from game.warmup import warm_up
+
+# advisory lock statement taken by leaderboard writers on Postgres only
+PG_LOCK = 1 if connection.vendor == "postgresql" else 0
+# NOTIFY sent to leaderboard streams per published entry or prune, also on Postgres only
+PG_NOTIFY = 1 if connection.vendor == "postgresql" else 0
+
+
+def _create_session(*, status: str = "active", total_score: int = 0) -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        status=status,
+        total_score=total_score,
+        prompts=[
+            {
+                "prompt_id": 1,
+                "description": "Starts with a",
+                "rule": {"type": "starts_with", "value": "a"},
+            }
+        ]
+        * 21,
+    )
+
+
+@pytest.mark.django_db
+def test_health_and_metrics_queries(assert_endpoint_queries):
+    client = APIClient()
+
+    with assert_endpoint_queries("/api/health/", 0):
+        client.get("/api/health/")
+    with assert_endpoint_queries("/api/metrics/", 0):
+        client.get("/api/metrics/")
+    warm_up(close_connections=False)
+    with assert_endpoint_queries("/api/ready/", 0):
+        client.get("/api/ready/")
+
+
+@pytest.mark.django_db
+def test_session_create_and_detail_queries(assert_endpoint_queries):
+    for i in range(21):
+        Prompt.objects.create(description=f"P{i}", rule={"type": "starts_with", "value": "a"})
+    client = APIClient()
+
+    # cold prompt catalog: load it, then insert; afterwards only the insert
+    with assert_endpoint_queries("/api/v1/sessions/", 2):
+        client.post("/api/v1/sessions/", data={}, format="json")
+    with assert_endpoint_queries("/api/v1/sessions/", 1):
+        response = client.post("/api/v1/sessions/", data={}, format="json")
+    path = f"/api/v1/sessions/{response.json()['id']}/"
+    with assert_endpoint_queries(path, 1):
+        client.get(path)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("word", "expected"),
+    [("", 2), ("zzz", 3), ("bumba", 3), ("aplis", 4)],
+    ids=["empty", "not_in_dictionary", "rule_mismatch", "accepted"],
+)
+def test_session_attempt_queries(assert_endpoint_queries, word, expected):
+    Word.objects.create(word="aplis")
+    Word.objects.create(word="bumba")
+    session = _create_session()
+    path = f"/api/v1/sessions/{session.id}/attempt/"
+
+    with assert_endpoint_queries(path, expected):
+        APIClient().post(path, data={"word": word}, format="json")
+
+
+@pytest.mark.django_db
+def test_session_hint_queries(assert_endpoint_queries):
+    PromptWordList.objects.create(
+        prompt=Prompt.objects.create(
+            id=1, description="Starts with a", rule={"type": "starts_with", "value": "a"}
+        ),
+        words="aplis\nauto",
+    )
+    session = _create_session()
+    path = f"/api/v1/sessions/{session.id}/hint/"
+
+    # locked session, word list, save; afterwards the word list is cached
+    with assert_endpoint_queries(path, 3):
+        APIClient().post(path, format="json")
+    with assert_endpoint_queries(path, 2):
+        APIClient().post(path, format="json")
+
+
+@pytest.mark.django_db
+def test_session_publish_queries(assert_endpoint_queries):
+    session = _create_session(status="submitted", total_score=100)
+    path = f"/api/v1/sessions/{session.id}/publish/"
+
+    with assert_endpoint_queries(path, 5 + PG_LOCK + PG_NOTIFY):
+        response = APIClient().post(path, data={"player_name": "Ieva"}, format="json")
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_session_publish_with_prune_queries(assert_endpoint_queries):
+    for i in range(100):
+        seeded = _create_session(status="submitted", total_score=i)
+        LeaderboardEntry.objects.create(session=seeded, player_name=f"P{i}", score=i)
+    session = _create_session(status="submitted", total_score=500)
+    path = f"/api/v1/sessions/{session.id}/publish/"
+
+    # NOTIFYs of the new entry and of the pruned one
+    with assert_endpoint_queries(path, 6 + PG_LOCK + 2 * PG_NOTIFY):
+        APIClient().post(path, data={"player_name": "Ieva"}, format="json")
+
+
+@pytest.mark.django_db
+def test_leaderboard_queries(assert_endpoint_queries):
+    with assert_endpoint_queries("/api/v1/leaderboard/", 1):
+        APIClient().get("/api/v1/leaderboard/")
+
+
+@pytest.mark.django_db
+def test_leaderboard_stream_queries(assert_endpoint_queries):
+    # the snapshot; events reach the open stream without queries
+    with assert_endpoint_queries("/api/v1/leaderboard/stream/", 1):
+        response = APIClient().get("/api/v1/leaderboard/stream/", **{"wsgi.multithread": True})
+    response.close()
+
+
+@pytest.mark.django_db
+def test_daily_challenge_queries(assert_endpoint_queries):
+    Word.objects.create(word="aplis")
+    for i in range(21):
+        Prompt.objects.create(description=f"P{i}", rule={"type": "starts_with", "value": "a"})
+    client = APIClient()
+    path = "/api/v1/daily/sessions/"
+
+    # first of the day: look up the challenge, load the catalog, create the challenge,
+    # insert the session; afterwards only the insert
+    with assert_endpoint_queries(path, 4):
+        client.post(path, data={}, format="json")
+    with assert_endpoint_queries(path, 1):
+        session_id = client.post(path, data={}, format="json").json()["id"]
+
+    # another process, without the challenge cached, reads it once
+    forget_daily_challenges()
+    path = f"/api/v1/sessions/{session_id}/"
+    with assert_endpoint_queries(path, 2):
+        client.get(path)
+    forget_daily_challenges()
+    path = f"/api/v1/sessions/{session_id}/attempt/"
+    with assert_endpoint_queries(path, 5):
+        client.post(path, data={"word": "aplis"}, format="json")
+
+    with assert_endpoint_queries("/api/v1/daily/leaderboard/", 1):
+        client.get("/api/v1/daily/leaderboard/?language=lv")
+
+
+@pytest.mark.django_db
+def test_prompt_stats_queries(assert_endpoint_queries):
+    prompt = Prompt.objects.create(description="P", rule={"type": "starts_with", "value": "a"})
+    PromptStats.objects.create(prompt=prompt, times_shown=3)
+    client = APIClient()
+
+    with assert_endpoint_queries("/api/v1/prompts/stats/", 1):
+        client.get("/api/v1/prompts/stats/?language=lv")
+    path = f"/api/v1/prompts/{prompt.id}/stats/"
+    with assert_endpoint_queries(path, 1):
+        client.get(path)
+
+
+@pytest.mark.django_db
+def test_middleware_logs_requests_over_budget(caplog):
+    session = _create_session()
+
+    with (
+        override_settings(QUERY_BUDGETS_ENABLED=True),
+        caplog.at_level(logging.WARNING, logger="game.query_budget"),
+    ):
+        SessionDetailView.query_budget = 0
+        try:
+            APIClient().get(f"/api/v1/sessions/{session.id}/")
+        finally:
+            SessionDetailView.query_budget = 2
+
+    assert "Query budget exceeded" in caplog.text
+    assert "budget=0" in caplog.text
+
+
+def test_every_api_endpoint_has_a_query_count_test(request, query_counted_endpoints):
+    # runs last in this module: coverage is what the tests above actually requested
+    tests = [name for name in globals() if name.startswith("test_")]
+    selected = [item for item in request.session.items if item.module is request.module]
+    if len(selected) < len(tests):
+        pytest.skip("only checked when the whole module runs")
+    names = {p.name for p in urlpatterns if isinstance(p, URLPattern)}
+
+    assert names - query_counted_endpoints == set()
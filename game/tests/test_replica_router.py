@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connections, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.db_router import REPLICA_PIN_COOKIE, ReplicaRouter, replica_lag_seconds, replica_reads
+from game.models import LeaderboardEntry, Session, Word
+
+with_replica = override_settings(DATABASE_REPLICA_ALIAS="replica")
+
+
+def _create_session() -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        prompts=[
+            {
+                "prompt_id": 1,
+                "description": "Starts with a",
+                "rule": {"type": "starts_with", "value": "a"},
+            }
+        ]
+        * 21,
+    )
+
+
+class _Queries:
+    """Queries run on the primary and on the replica while the context is active."""
+
+    def __enter__(self):
+        self.primary = CaptureQueriesContext(connections["default"]).__enter__()
+        self.replica = CaptureQueriesContext(connections["replica"]).__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.replica.__exit__(*exc_info)
+        self.primary.__exit__(*exc_info)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_router_sends_only_marked_reads_outside_transactions_to_the_replica():
+    router = ReplicaRouter()
+
+    with replica_reads():
+        assert router.db_for_read(Session) is None  # no replica configured
+    with with_replica:
+        assert router.db_for_read(Session) is None
+        with replica_reads():
+            assert router.db_for_read(Session) == "replica"
+            with transaction.atomic():
+                assert router.db_for_read(Session) is None
+        assert router.db_for_write(Session) == "default"
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@with_replica
+def test_read_only_endpoints_use_the_replica_until_the_client_writes():
+    Word.objects.create(word="aplis")
+    session = _create_session()
+    LeaderboardEntry.objects.create(
+        session=_create_session(), player_name="Ieva", score=5, created_at=timezone.now()
+    )
+    client = APIClient()
+    detail = f"/api/v1/sessions/{session.id}/"
+
+    with _Queries() as queries:
+        assert client.get("/api/v1/leaderboard/").json()["items"][0]["player_name"] == "Ieva"
+    assert (len(queries.primary), len(queries.replica)) == (0, 1)
+
+    response = client.post(f"{detail}attempt/", data={"word": "aplis"}, format="json")
+    assert response.cookies[REPLICA_PIN_COOKIE]["max-age"] == 10
+
+    # pinned: the client's next reads see its own writes on the primary
+    with _Queries() as queries:
+        client.get("/api/v1/leaderboard/")
+    assert (len(queries.primary), len(queries.replica)) == (1, 0)
+
+    # other clients keep reading from the replica
+    with _Queries() as queries:
+        APIClient().get("/api/v1/leaderboard/")
+    assert (len(queries.primary), len(queries.replica)) == (0, 1)
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@with_replica
+def test_session_detail_reads_the_primary_without_the_pin_cookie():
+    Word.objects.create(word="aplis")
+    session = _create_session()
+    detail = f"/api/v1/sessions/{session.id}/"
+    APIClient().post(f"{detail}attempt/", data={"word": "aplis"}, format="json")
+
+    # e.g. a cross-origin fetch without credentials: the pin cookie never comes back
+    with _Queries() as queries:
+        assert APIClient().get(detail).json()["current_ordinal"] == 2
+    assert (len(queries.primary), len(queries.replica)) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_replica_lag_is_not_reported_without_a_postgres_replica():
+    assert replica_lag_seconds() is None
+    if connections["replica"].vendor == "postgresql":
+        pytest.skip("lag is measurable on Postgres")
+    with with_replica:
+        assert replica_lag_seconds() is None
+        body = APIClient().get("/api/metrics/").content.decode()
+    assert "# TYPE wordrush_db_replica_lag_seconds gauge" in body
+    assert "wordrush_db_replica_lag_seconds{" not in body
@@ -0,0 +1,118 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from game.models import LeaderboardEntry, Session
+from game.services.scoring import score_answers
+
+
+def _answer(ordinal: int, word: str, points_total: int = 0) -> dict:
+    return {
+        "ordinal": ordinal,
+        "prompt_id": ordinal,
+        "word": word,
+        "normalized_word": word,
+        "points_index": 0,
+        "points_length": 0,
+        "points_total": points_total,
+        "created_at": timezone.now().isoformat(),
+    }
+
+
+def _create_session(*, answers: list[dict], total_score: int, time_left_ms=None) -> Session:
+    now = timezone.now()
+    return Session.objects.create(
+        started_at=now - timedelta(seconds=60),
+        expires_at=now,
+        status="submitted" if time_left_ms is not None else "expired",
+        total_score=total_score,
+        time_left_ms=time_left_ms,
+        prompts=[],
+        answers=answers,
+    )
+
+
+def test_score_answers_matches_live_scoring():
+    answers, total = score_answers([_answer(1, "koks"), _answer(2, "wastes")], time_left_ms=1000)
+
+    assert [a["points_total"] for a in answers] == [1 + 9, 2 + 15]
+    assert total == 10 + 17 + 50
+
+
+@pytest.mark.django_db
+def test_rescore_dry_run_reports_without_writing():
+    session = _create_session(answers=[_answer(1, "koks")], total_score=3)
+    out = StringIO()
+
+    call_command("rescore_sessions", "--dry-run", stdout=out)
+
+    session.refresh_from_db()
+    assert session.total_score == 3
+    assert "Would change 1 of 1 sessions" in out.getvalue()
+    assert "After:  n=1 min=10" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rescore_updates_sessions_and_leaderboard_scores():
+    stale = _create_session(answers=[_answer(1, "koks", 3)], total_score=3, time_left_ms=200)
+    current = _create_session(answers=[_answer(1, "koks", 10)], total_score=10)
+    LeaderboardEntry.objects.create(session=stale, player_name="Ieva", score=3)
+
+    call_command("rescore_sessions", "--chunk-size=1", stdout=StringIO())
+
+    stale.refresh_from_db()
+    current.refresh_from_db()
+    assert stale.total_score == 10 + 10
+    assert stale.answers[0]["points_total"] == 10
+    assert current.total_score == 10
+    assert LeaderboardEntry.objects.get(session=stale).score == 20
+
+
+@pytest.mark.django_db
+def test_rescore_skips_sessions_still_in_play():
+    now = timezone.now()
+    active = Session.objects.create(
+        started_at=now,
+        expires_at=now + timedelta(seconds=60),
+        total_score=3,
+        prompts=[],
+        answers=[_answer(1, "koks", 3)],
+    )
+    out = StringIO()
+
+    call_command("rescore_sessions", stdout=out)
+
+    active.refresh_from_db()
+    assert active.total_score == 3
+    assert "Changed 0 of 0 sessions" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rescore_rewrites_answer_points_even_when_the_total_is_unchanged():
+    # points moved between answers: 17 + 10 stored where the rules give 10 + 17
+    session = _create_session(
+        answers=[_answer(1, "koks", 17), _answer(2, "wastes", 10)], total_score=27
+    )
+    out = StringIO()
+
+    call_command("rescore_sessions", stdout=out)
+
+    session.refresh_from_db()
+    assert session.total_score == 27
+    assert [answer["points_total"] for answer in session.answers] == [10, 17]
+    assert "Changed 1 of 1 sessions" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rescore_updates_only_the_total_when_answer_points_are_current():
+    answers, _ = score_answers([_answer(1, "koks")], time_left_ms=None)
+    session = _create_session(answers=answers, total_score=99)
+
+    call_command("rescore_sessions", stdout=StringIO())
+
+    session.refresh_from_db()
+    assert session.total_score == 10
+    assert session.answers == answers
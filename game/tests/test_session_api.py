@@ -62,3 +62,37 @@ def test_get_session_returns_current_prompt_and_answers():
     assert body["current_ordinal"] == 1
     assert body["prompt"]["ordinal"] == 1
     assert body["answers"] == []
+
+
+@pytest.mark.django_db
+def test_create_session_uses_prompts_of_requested_language():
+    _create_prompts(21)
+    for i in range(1, 22):
+        Prompt.objects.create(
+            language="lt",
+            description=f"LT {i}",
+            rule={"type": "contains_diacritic"},
+        )
+    client = APIClient()
+
+    response = client.post("/api/v1/sessions/", data={"language": "lt"}, format="json")
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["language"] == "lt"
+    session = Session.objects.get(id=body["id"])
+    assert session.language == "lt"
+    assert all(p["description"].startswith("LT") for p in session.prompts)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("language", ["xx", ["lt"], {"code": "lt"}, 7])
+@pytest.mark.parametrize("path", ["/api/v1/sessions/", "/api/v1/daily/sessions/"])
+def test_create_session_rejects_unknown_language(path, language):
+    _create_prompts(21)
+    client = APIClient()
+
+    response = client.post(path, data={"language": language}, format="json")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unsupported language."
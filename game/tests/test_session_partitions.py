@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from game.models import LeaderboardEntry, Prompt, Session, Word
+from game.services.session_partitions import (
+    DEFAULT_PARTITION,
+    is_partitioned,
+    list_partitions,
+    maintain_partitions,
+    partition_end,
+    partition_name,
+    plan_partitions,
+)
+
+TODAY = date(2026, 3, 10)
+
+
+def test_partition_names_encode_their_range():
+    assert partition_name(TODAY) == "game_session_p20260310"
+    assert partition_end("game_session_p20260310") == date(2026, 3, 11)
+    assert partition_end("game_session_upto_20260301") == date(2026, 3, 1)
+    assert partition_end(DEFAULT_PARTITION) is None
+
+
+def test_plan_creates_missing_days_and_retires_expired_partitions():
+    existing = [
+        "game_session_upto_20260301",
+        DEFAULT_PARTITION,
+        *(partition_name(date(2026, 3, day)) for day in range(1, 12)),
+    ]
+
+    missing, expired = plan_partitions(existing, today=TODAY, ahead=3, retain_days=7)
+
+    assert missing == [date(2026, 3, 12), date(2026, 3, 13)]
+    assert expired == ["game_session_p20260301", "game_session_p20260302", existing[0]]
+
+
+def test_plan_leaves_days_covered_by_the_converted_table():
+    missing, expired = plan_partitions(
+        ["game_session_upto_20260311", DEFAULT_PARTITION], today=TODAY, ahead=2, retain_days=None
+    )
+
+    assert missing == [date(2026, 3, 11), date(2026, 3, 12)]
+    assert expired == []
+
+
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="checks the non-Postgres error")
+@pytest.mark.django_db
+def test_command_requires_postgres():
+    with pytest.raises(CommandError, match="needs PostgreSQL"):
+        call_command("session_partitions", "--dry-run")
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="partitioning needs Postgres")
+@pytest.mark.django_db(transaction=True)
+def test_partitioned_sessions_keep_working_through_the_orm():
+    now = timezone.now()
+    old = Session.objects.create(
+        started_at=now, expires_at=now + timedelta(seconds=60), prompts=[], answers=[]
+    )
+    Session.objects.filter(id=old.id).update(created_at=now - timedelta(days=40))
+    call_command("session_partitions", "--enable", "--ahead", "2")
+
+    assert is_partitioned()
+    partitions = list_partitions()
+    assert DEFAULT_PARTITION in partitions
+    assert partition_name(now.date() + timedelta(days=3)) in partitions
+
+    Word.objects.create(word="aplis")
+    for i in range(21):
+        Prompt.objects.create(description=f"P{i}", rule={"type": "starts_with", "value": "a"})
+    client = APIClient()
+    session_id = client.post("/api/v1/sessions/", data={}, format="json").json()["id"]
+    body = client.post(
+        f"/api/v1/sessions/{session_id}/attempt/", data={"word": "aplis"}, format="json"
+    ).json()
+    assert body["is_valid"] is True
+    assert Session.objects.get(id=old.id).created_at < now
+    LeaderboardEntry.objects.create(session=old, player_name="Ieva", score=1)
+    assert Session.objects.get(leaderboard_entry__player_name="Ieva") == old
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="partitioning needs Postgres")
+@pytest.mark.django_db(transaction=True)
+def test_maintenance_moves_rows_the_default_partition_caught():
+    call_command("session_partitions", "--enable", "--ahead", "0")
+    now = timezone.now()
+    late_day = now.date() + timedelta(days=3)
+    # maintenance fell behind: a session for a day without partition lands in DEFAULT
+    late = Session.objects.create(
+        started_at=now, expires_at=now + timedelta(seconds=60), prompts=[], answers=[]
+    )
+    Session.objects.filter(id=late.id).update(created_at=now + timedelta(days=3))
+
+    result = maintain_partitions(today=now.date(), ahead=5)
+
+    assert partition_name(late_day) in result["created"]
+    assert result["moved"] == {partition_name(late_day): 1}
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {qn(DEFAULT_PARTITION)}")
+        assert cursor.fetchone()[0] == 0
+        cursor.execute(f"SELECT count(*) FROM {qn(partition_name(late_day))}")
+        assert cursor.fetchone()[0] == 1
+    assert Session.objects.get(id=late.id).created_at.date() == late_day
@@ -16,3 +16,10 @@ def test_matches_rule_starts_with():
 def test_matches_rule_contains_diacritic():
     assert matches_rule("šokolāde", {"type": "contains_diacritic"})
     assert not matches_rule("skola", {"type": "contains_diacritic"})
+
+
+def test_matches_rule_contains_diacritic_uses_language_letters():
+    assert matches_rule("ąžuolas", {"type": "contains_diacritic"}, language="lt")
+    assert not matches_rule("ąsa", {"type": "contains_diacritic"}, language="et")
+    assert matches_rule("öö", {"type": "contains_diacritic"}, language="et")
+    assert not matches_rule("öö", {"type": "contains_diacritic"}, language="lv")
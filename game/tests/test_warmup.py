@@ -0,0 +1,62 @@
+import pytest
+from rest_framework.test import APIClient
+
+from game import warmup
+from game.models import Prompt
+from game.selectors import get_random_prompts
+from game.services.prompt_catalog import get_prompt_catalog
+
+RULE = {"type": "starts_with", "value": "a"}
+
+
+@pytest.mark.django_db
+def test_ready_reports_warmup_state(monkeypatch):
+    for i in range(3):
+        Prompt.objects.create(description=f"P{i}", rule=RULE)
+    monkeypatch.setitem(warmup._state, "ready", False)
+
+    assert warmup.warm_up(close_connections=False) is True
+
+    response = APIClient().get("/api/ready/")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["prompts"] == 3
+
+
+@pytest.mark.django_db
+def test_ready_is_503_until_warmup_succeeds(monkeypatch):
+    monkeypatch.setitem(warmup._state, "ready", False)
+    monkeypatch.setattr("game.api.views.warm_up", lambda **kwargs: False)
+
+    response = APIClient().get("/api/ready/")
+
+    assert response.status_code == 503
+    assert response.json() == {"status": "warming_up"}
+
+
+@pytest.mark.django_db
+def test_prompt_catalog_is_invalidated_by_prompt_writes(django_assert_num_queries):
+    first = Prompt.objects.create(description="P1", rule=RULE)
+    assert get_prompt_catalog("lv") == (first,)
+
+    with django_assert_num_queries(0):
+        get_random_prompts(1)
+
+    second = Prompt.objects.create(description="P2", rule=RULE)
+    assert get_prompt_catalog("lv") == (first, second)
+    first.delete()
+    assert get_prompt_catalog("lv") == (second,)
+    assert get_prompt_catalog("lt") == ()
+
+
+@pytest.mark.django_db
+def test_prompt_catalog_reloads_after_ttl(settings):
+    settings.PROMPT_CATALOG_TTL = 0
+    Prompt.objects.create(description="P1", rule=RULE)
+    get_prompt_catalog("lv")
+
+    # bulk writes send no signals; the TTL still bounds staleness
+    Prompt.objects.bulk_create([Prompt(description="P2", rule=RULE)])
+
+    assert len(get_prompt_catalog("lv")) == 2
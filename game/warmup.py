@@ -0,0 +1,90 @@
+"""
+Process warmup: everything a worker would otherwise do lazily on its first requests.
+
+config/wsgi.py runs warm_up() when the WSGI application is imported. With gunicorn
+--preload (config/gunicorn.conf.py) that is once in the master, before the fork, so workers
+share the loaded modules, URL resolver, prompt catalog and OpenAPI schema copy-on-write.
+/api/ready/ reports ready only once warmup has completed in the serving process.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.urls import get_resolver, reverse
+from rest_framework.settings import api_settings
+
+from game.api.schema import read_schema_file
+from game.services.daily_challenge import load_daily_challenges
+from game.services.languages import LANGUAGES, get_description_templates, get_diacritics
+from game.services.prompt_catalog import load_prompt_catalog
+from game.services.validation import _diacritic_q, normalize_word
+
+logger = logging.getLogger(__name__)
+
+# DRF imports these classes lazily on first access
+_DRF_SETTINGS = (
+    "DEFAULT_RENDERER_CLASSES",
+    "DEFAULT_PARSER_CLASSES",
+    "DEFAULT_AUTHENTICATION_CLASSES",
+    "DEFAULT_PERMISSION_CLASSES",
+    "DEFAULT_THROTTLE_CLASSES",
+    "DEFAULT_CONTENT_NEGOTIATION_CLASS",
+    "DEFAULT_PAGINATION_CLASS",
+)
+
+_state = {"ready": False, "duration_ms": None, "prompts": 0}
+
+
+def is_ready() -> bool:
+    return _state["ready"]
+
+
+def warmup_state() -> dict:
+    return dict(_state)
+
+
+def warm_up(*, close_connections: bool = True) -> bool:
+    """
+    Import and prime everything requests need. Returns False if the database was not
+    reachable, so a later call (from the readiness probe) can retry. With
+    `close_connections` every database connection is closed afterwards; a connection must
+    never be inherited by forked workers.
+    """
+    start = time.perf_counter()
+    try:
+        get_resolver().url_patterns  # imports every view module
+        reverse("leaderboard")  # builds the reverse lookup tables
+        for name in _DRF_SETTINGS:
+            getattr(api_settings, name)
+
+        for language in LANGUAGES:
+            get_diacritics(language)
+            get_description_templates(language)
+            _diacritic_q(language)
+        normalize_word("Ābols")
+        # the precomputed file only; generating a missing schema is left to first use
+        schema_path = Path(settings.OPENAPI_SCHEMA_PATH)
+        if read_schema_file(schema_path) is None:
+            logger.warning(
+                "No precomputed OpenAPI schema at %s; /api/schema/ %s",
+                schema_path,
+                "generates it on first use" if settings.ENABLE_API_DOCS else "returns 404",
+            )
+
+        prompts = load_prompt_catalog()
+        load_daily_challenges()
+    except DatabaseError:
+        logger.exception("Warmup could not load the prompt catalog; not ready")
+        return False
+    finally:
+        if close_connections:
+            connections.close_all()
+
+    _state.update(
+        ready=True, duration_ms=round((time.perf_counter() - start) * 1000, 1), prompts=prompts
+    )
+    logger.info("Warmup done in %.1f ms (%d prompts)", _state["duration_ms"], prompts)
+    return True